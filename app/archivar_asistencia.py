@@ -0,0 +1,38 @@
+"""Mueve la asistencia de un ciclo lectivo terminado a `asistencia_archivo`.
+
+    python -m app.archivar_asistencia --ciclo 2024
+
+Cierra los cursos del ciclo y mueve su asistencia por lotes de cursos (una
+transacción por lote). Los endpoints la siguen mostrando cuando se pide un
+ciclo pasado; los del año en curso leen sólo la tabla viva.
+"""
+import argparse
+import sys
+import time
+
+from sqlmodel import Session
+
+from app.db.database import engine
+from app.db.migrations import verificar_esquema
+from app.services.asistencia_archivo import archivar_ciclo, ciclo_actual
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Archiva la asistencia de un ciclo lectivo")
+    parser.add_argument("--ciclo", type=int, required=True)
+    parser.add_argument("--lote", type=int, default=100, help="cursos por transacción")
+    parser.add_argument("--forzar", action="store_true", help="permitir el ciclo en curso")
+    args = parser.parse_args()
+
+    if args.ciclo >= ciclo_actual() and not args.forzar:
+        sys.exit(f"El ciclo {args.ciclo} no terminó: usar --forzar para archivarlo igual")
+
+    verificar_esquema(engine, auto_migrar=False)
+    inicio = time.perf_counter()
+    with Session(engine) as session:
+        r = archivar_ciclo(session, args.ciclo, args.lote)
+    print(f"{r['filas']:,} registros de {r['cursos']:,} cursos archivados en {time.perf_counter() - inicio:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
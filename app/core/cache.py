@@ -0,0 +1,65 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+_FALTA = object()
+
+
+class TTLCache:
+    """Cache en memoria del proceso con expiración (TTL) y desalojo LRU.
+
+    Es por worker: cada proceso de uvicorn tiene la suya, por eso las
+    invalidaciones sólo aplican al proceso que recibió la escritura y el TTL
+    acota cuánto puede quedar desactualizado otro worker.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._datos: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, clave: Hashable, default=None):
+        with self._lock:
+            item = self._datos.get(clave, _FALTA)
+            if item is _FALTA or item[0] < time.monotonic():
+                if item is not _FALTA:
+                    del self._datos[clave]
+                self.misses += 1
+                return default
+            self._datos.move_to_end(clave)
+            self.hits += 1
+            return item[1]
+
+    def set(self, clave: Hashable, valor: Any) -> None:
+        with self._lock:
+            self._datos[clave] = (time.monotonic() + self.ttl, valor)
+            self._datos.move_to_end(clave)
+            while len(self._datos) > self.maxsize:
+                self._datos.popitem(last=False)
+
+    def get_or_set(self, clave: Hashable, crear: Callable[[], Any]):
+        valor = self.get(clave, _FALTA)
+        if valor is _FALTA:
+            valor = crear()
+            self.set(clave, valor)
+        return valor
+
+    def pop(self, clave: Hashable) -> None:
+        with self._lock:
+            self._datos.pop(clave, None)
+
+    def pop_where(self, condicion: Callable[[Hashable], bool]) -> None:
+        with self._lock:
+            for clave in [c for c in self._datos if condicion(c)]:
+                del self._datos[clave]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._datos.clear()
+
+    def __len__(self) -> int:
+        return len(self._datos)
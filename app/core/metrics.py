@@ -0,0 +1,179 @@
+import time
+from bisect import bisect_left
+
+import anyio.to_thread
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# límites superiores (segundos) del histograma de latencia
+BUCKETS_LATENCIA = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CUANTILES = (0.5, 0.95, 0.99)
+
+
+class _Serie:
+    __slots__ = ("buckets", "suma", "cuenta")
+
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKETS_LATENCIA) + 1)  # el último es +Inf
+        self.suma = 0.0
+        self.cuenta = 0
+
+
+class Metricas:
+    """Métricas HTTP en memoria del proceso, en formato de texto de Prometheus.
+
+    Sin locks: el middleware y /metrics corren en el hilo del event loop,
+    así que las actualizaciones nunca se pisan entre sí.
+    """
+
+    def __init__(self):
+        self.latencias: dict[tuple[str, str, str], _Serie] = {}
+        self.respuestas: dict[tuple[str, str, str, str], int] = {}
+        self.en_curso = 0
+
+    def observar(self, router: str, metodo: str, ruta: str, status: int, segundos: float) -> None:
+        clave = (router, metodo, ruta)
+        serie = self.latencias.get(clave)
+        if serie is None:
+            serie = self.latencias[clave] = _Serie()
+        serie.buckets[bisect_left(BUCKETS_LATENCIA, segundos)] += 1
+        serie.suma += segundos
+        serie.cuenta += 1
+
+        clave_status = (router, metodo, ruta, f"{status // 100}xx")
+        self.respuestas[clave_status] = self.respuestas.get(clave_status, 0) + 1
+
+
+metricas = Metricas()
+
+
+def _router_de(scope: Scope) -> tuple[str, str]:
+    route = scope.get("route")
+    if route is None:
+        return "none", "unmatched"
+    modulo = getattr(getattr(route, "endpoint", None), "__module__", "") or ""
+    # app.routers.alumno -> alumno; endpoints de main.py -> app
+    return modulo.rsplit(".", 1)[-1] if modulo.startswith("app.routers.") else "app", route.path
+
+
+class MetricsMiddleware:
+    """Middleware ASGI puro (sin BaseHTTPMiddleware) para que el costo por request sea mínimo."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        inicio = time.perf_counter()
+        status = 500
+
+        async def send_con_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        metricas.en_curso += 1
+        try:
+            await self.app(scope, receive, send_con_status)
+        finally:
+            metricas.en_curso -= 1
+            router, ruta = _router_de(scope)
+            metricas.observar(router, scope["method"], ruta, status, time.perf_counter() - inicio)
+
+
+def _labels(**kw) -> str:
+    return "{" + ",".join(f'{k}="{v}"' for k, v in kw.items()) + "}"
+
+
+def _cuantil(serie: _Serie, q: float) -> float:
+    # estimación por interpolación lineal dentro del bucket (como histogram_quantile)
+    objetivo = q * serie.cuenta
+    acumulado = 0
+    inferior = 0.0
+    for limite, n in zip((*BUCKETS_LATENCIA, float("inf")), serie.buckets):
+        if acumulado + n >= objetivo and n:
+            if limite == float("inf"):
+                return inferior
+            return inferior + (limite - inferior) * (objetivo - acumulado) / n
+        acumulado += n
+        inferior = limite
+    return inferior
+
+
+def render_prometheus(pools: dict[str, dict]) -> str:
+    lineas = [
+        "# HELP edupresente_http_requests_total Requests atendidas por ruta y clase de status.",
+        "# TYPE edupresente_http_requests_total counter",
+    ]
+    for (router, metodo, ruta, status), n in metricas.respuestas.items():
+        lineas.append(
+            f"edupresente_http_requests_total{_labels(router=router, method=metodo, route=ruta, status=status)} {n}"
+        )
+
+    lineas += [
+        "# HELP edupresente_http_request_duration_seconds Latencia por ruta.",
+        "# TYPE edupresente_http_request_duration_seconds histogram",
+    ]
+    cuantiles = []
+    for (router, metodo, ruta), serie in metricas.latencias.items():
+        base = dict(router=router, method=metodo, route=ruta)
+        acumulado = 0
+        for limite, n in zip((*BUCKETS_LATENCIA, "+Inf"), serie.buckets):
+            acumulado += n
+            lineas.append(
+                f"edupresente_http_request_duration_seconds_bucket{_labels(**base, le=limite)} {acumulado}"
+            )
+        lineas.append(f"edupresente_http_request_duration_seconds_sum{_labels(**base)} {serie.suma:.6f}")
+        lineas.append(f"edupresente_http_request_duration_seconds_count{_labels(**base)} {serie.cuenta}")
+        for q in CUANTILES:
+            cuantiles.append(
+                f"edupresente_http_request_duration_quantile_seconds{_labels(**base, quantile=q)} "
+                f"{_cuantil(serie, q):.6f}"
+            )
+
+    lineas += [
+        "# HELP edupresente_http_request_duration_quantile_seconds p50/p95/p99 estimados del histograma.",
+        "# TYPE edupresente_http_request_duration_quantile_seconds gauge",
+        *cuantiles,
+        "# HELP edupresente_http_requests_in_flight Requests en curso.",
+        "# TYPE edupresente_http_requests_in_flight gauge",
+        f"edupresente_http_requests_in_flight {metricas.en_curso}",
+    ]
+
+    # threadpool de anyio donde corren los endpoints sync (def)
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    estadisticas = limiter.statistics()
+    lineas += [
+        "# HELP edupresente_threadpool_threads Hilos del threadpool de endpoints sync.",
+        "# TYPE edupresente_threadpool_threads gauge",
+        f'edupresente_threadpool_threads{_labels(state="busy")} {estadisticas.borrowed_tokens}',
+        f'edupresente_threadpool_threads{_labels(state="total")} {int(limiter.total_tokens)}',
+        "# HELP edupresente_threadpool_waiting Requests esperando un hilo libre.",
+        "# TYPE edupresente_threadpool_waiting gauge",
+        f"edupresente_threadpool_waiting {estadisticas.tasks_waiting}",
+    ]
+
+    lineas += [
+        "# HELP edupresente_db_pool_connections Conexiones del pool por estado.",
+        "# TYPE edupresente_db_pool_connections gauge",
+    ]
+    for nombre, datos in pools.items():
+        for estado in ("checked_out", "checked_in", "overflow", "size"):
+            if estado in datos:
+                lineas.append(
+                    f"edupresente_db_pool_connections{_labels(pool=nombre, state=estado)} {datos[estado]}"
+                )
+    lineas += [
+        "# HELP edupresente_db_pool_checkout_timeouts_total Esperas de conexión que vencieron.",
+        "# TYPE edupresente_db_pool_checkout_timeouts_total counter",
+    ]
+    for nombre, datos in pools.items():
+        if "checkout_timeouts" in datos:
+            lineas.append(
+                f"edupresente_db_pool_checkout_timeouts_total{_labels(pool=nombre)} {datos['checkout_timeouts']}"
+            )
+
+    return "\n".join(lineas) + "\n"
@@ -0,0 +1,73 @@
+import base64
+import json
+from dataclasses import dataclass
+from typing import Optional
+
+from fastapi import HTTPException
+from fastapi.responses import ORJSONResponse
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+@dataclass
+class Paginacion:
+    cursor: Optional[str]
+    limit: int
+
+
+def encode_cursor(valor) -> str:
+    raw = json.dumps({"k": valor}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        return json.loads(raw)["k"]
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Cursor inválido")
+
+
+def _stmt_pagina(stmt, clave, pag: Paginacion):
+    if pag.cursor is not None:
+        stmt = stmt.where(clave > decode_cursor(pag.cursor))
+
+    # pedimos una fila de más para saber si hay otra página
+    return stmt.order_by(clave).limit(pag.limit + 1)
+
+
+def _armar_pagina(rows, clave, pag: Paginacion) -> dict:
+    rows = list(rows)
+    next_cursor = None
+    if len(rows) > pag.limit:
+        rows = rows[: pag.limit]
+        next_cursor = encode_cursor(getattr(rows[-1], clave.key))
+
+    return {"items": rows, "next_cursor": next_cursor}
+
+
+def paginar(session: Session, stmt, clave, pag: Paginacion) -> dict:
+    """Paginación keyset sobre la PK `clave` (WHERE clave > cursor ORDER BY clave).
+
+    A diferencia de OFFSET, el costo no crece con el número de página:
+    siempre es un range scan sobre el índice de la PK.
+    """
+    rows = session.exec(_stmt_pagina(stmt, clave, pag)).all()
+    return _armar_pagina(rows, clave, pag)
+
+
+async def paginar_async(session: AsyncSession, stmt, clave, pag: Paginacion) -> dict:
+    rows = (await session.exec(_stmt_pagina(stmt, clave, pag))).all()
+    return _armar_pagina(rows, clave, pag)
+
+
+async def paginar_filas_async(session: AsyncSession, stmt, clave, pag: Paginacion) -> ORJSONResponse:
+    """Como paginar_async, para un SELECT de columnas (ver columnas_publicas).
+
+    Camino rápido de los listados grandes: las filas van directo a orjson, sin
+    objetos ORM ni validación de response_model (que queda sólo para OpenAPI).
+    """
+    rows = (await session.exec(_stmt_pagina(stmt, clave, pag))).all()
+    pagina = _armar_pagina(rows, clave, pag)
+    pagina["items"] = [r._asdict() for r in pagina["items"]]
+    return ORJSONResponse(pagina)
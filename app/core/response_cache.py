@@ -0,0 +1,86 @@
+import hashlib
+from typing import Callable
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from app.core.cache import TTLCache
+from app.core.config import RESPONSE_CACHE_MAXSIZE, RESPONSE_CACHE_TTL_SECONDS
+
+
+class ResponseCache:
+    """Respuestas GET ya serializadas (body + ETag), agrupadas por namespace.
+
+    Invalidar un namespace sube su versión: las entradas viejas quedan
+    inaccesibles y se van por LRU/TTL.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._versiones: dict[str, int] = {}
+
+    def version(self, namespace: str) -> int:
+        return self._versiones.get(namespace, 0)
+
+    def get(self, namespace: str, version: int, clave):
+        return self._cache.get((namespace, version, clave))
+
+    def set(self, namespace: str, version: int, clave, valor) -> None:
+        # si se invalidó mientras se armaba la respuesta, no se guarda
+        if version == self.version(namespace):
+            self._cache.set((namespace, version, clave), valor)
+
+    def invalidar(self, *namespaces: str) -> None:
+        for ns in namespaces:
+            self._versiones[ns] = self.version(ns) + 1
+
+
+response_cache = ResponseCache(RESPONSE_CACHE_MAXSIZE, RESPONSE_CACHE_TTL_SECONDS)
+
+
+def cacheable(namespace: str):
+    """Marca un endpoint GET para cachear su respuesta (requiere route_class=CachedRoute)."""
+    def decorar(endpoint):
+        endpoint.cache_namespace = namespace
+        return endpoint
+    return decorar
+
+
+def _etag_coincide(request: Request, etag: str) -> bool:
+    pedidos = request.headers.get("if-none-match", "")
+    return any(e.strip() in (etag, "*") for e in pedidos.split(","))
+
+
+class CachedRoute(APIRoute):
+    """Sirve desde cache los endpoints marcados con @cacheable y responde 304 por ETag.
+
+    Si hay entrada en cache no se resuelven dependencias: ni sesión ni queries.
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        namespace = getattr(self.endpoint, "cache_namespace", None)
+        if namespace is None:
+            return handler
+
+        async def cached_handler(request: Request) -> Response:
+            clave = (request.url.path, tuple(sorted(request.query_params.multi_items())))
+            version = response_cache.version(namespace)
+            entrada = response_cache.get(namespace, version, clave)
+
+            if entrada is None:
+                response = await handler(request)
+                if response.status_code != 200:
+                    return response
+                etag = '"' + hashlib.sha256(response.body).hexdigest()[:32] + '"'
+                entrada = (etag, response.body, response.media_type)
+                response_cache.set(namespace, version, clave, entrada)
+
+            etag, body, media_type = entrada
+            # no-cache: el navegador guarda la respuesta pero revalida siempre con If-None-Match
+            headers = {"ETag": etag, "Cache-Control": "no-cache"}
+            if _etag_coincide(request, etag):
+                return Response(status_code=304, headers=headers)
+            return Response(body, media_type=media_type, headers=headers)
+
+        return cached_handler
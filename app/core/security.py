@@ -0,0 +1,102 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import secrets
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from app.core.config import (
+    PASSWORD_HASH_ITERATIONS,
+    PASSWORD_HASH_WORKERS,
+    SECRET_KEY,
+    TOKEN_TTL_SECONDS,
+)
+
+_ALGORITMO = "pbkdf2_sha256"
+
+# Pool acotado sólo para hashear: aunque lleguen muchos logins juntos, como
+# máximo PASSWORD_HASH_WORKERS hilos queman CPU y el threadpool de requests
+# (anyio) queda libre para el resto de los endpoints.
+_hash_pool = ThreadPoolExecutor(
+    max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash"
+)
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def _unb64(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+# ----------------------------
+# Contraseñas
+# ----------------------------
+def _hash(password: str, salt: bytes, iteraciones: int) -> bytes:
+    return hashlib.pbkdf2_hmac("sha256", password.encode(), salt, iteraciones)
+
+
+def _hash_password(password: str) -> str:
+    salt = secrets.token_bytes(16)
+    digest = _hash(password, salt, PASSWORD_HASH_ITERATIONS)
+    return f"{_ALGORITMO}${PASSWORD_HASH_ITERATIONS}${_b64(salt)}${_b64(digest)}"
+
+
+def _verify_password(password: str, guardado: str) -> bool:
+    if not es_hash(guardado):
+        # contraseñas viejas guardadas en texto plano
+        return hmac.compare_digest(password.encode(), guardado.encode())
+
+    _, iteraciones, salt, digest = guardado.split("$")
+    calculado = _hash(password, _unb64(salt), int(iteraciones))
+    return hmac.compare_digest(calculado, _unb64(digest))
+
+
+def es_hash(guardado: str) -> bool:
+    return guardado.startswith(_ALGORITMO + "$")
+
+
+def hash_password(password: str) -> str:
+    """Versión bloqueante (para endpoints sync): el cálculo igual corre en el pool acotado."""
+    return _hash_pool.submit(_hash_password, password).result()
+
+
+async def hash_password_async(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_pool, _hash_password, password)
+
+
+async def verify_password_async(password: str, guardado: str) -> bool:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_pool, _verify_password, password, guardado)
+
+
+# ----------------------------
+# Tokens firmados (HMAC-SHA256)
+# ----------------------------
+def crear_token(claims: dict, ttl: int = TOKEN_TTL_SECONDS) -> str:
+    ahora = time.time()
+    payload = {**claims, "iat": ahora, "exp": ahora + ttl}
+    cuerpo = _b64(json.dumps(payload, separators=(",", ":")).encode())
+    firma = hmac.new(SECRET_KEY.encode(), cuerpo.encode(), hashlib.sha256).digest()
+    return f"{cuerpo}.{_b64(firma)}"
+
+
+def leer_token(token: str) -> Optional[dict]:
+    """Devuelve los claims si la firma es válida y no expiró; si no, None."""
+    try:
+        cuerpo, firma = token.split(".")
+        esperada = hmac.new(SECRET_KEY.encode(), cuerpo.encode(), hashlib.sha256).digest()
+        if not hmac.compare_digest(esperada, _unb64(firma)):
+            return None
+        claims = json.loads(_unb64(cuerpo))
+    except (ValueError, TypeError):
+        return None
+
+    if claims.get("exp", 0) < time.time():
+        return None
+    return claims
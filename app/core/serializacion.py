@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+
+
+def columnas_publicas(schema: type[BaseModel], tabla) -> list:
+    """Columnas de `tabla` que arman `schema`, etiquetadas con la clave del JSON.
+
+    Misma clave que usa FastAPI con response_model (el alias, o el nombre del
+    campo): un SELECT de estas columnas se serializa tal cual, sin instanciar
+    modelos ORM ni Pydantic por fila.
+    """
+    return [
+        getattr(tabla, campo.alias or nombre).label(campo.alias or nombre)
+        for nombre, campo in schema.model_fields.items()
+    ]
@@ -0,0 +1,14 @@
+import re
+import unicodedata
+
+_NO_ALFANUMERICO = re.compile(r"[^a-z0-9]+")
+
+
+def normalizar(texto: str | None) -> str:
+    """Minúsculas, sin acentos y sin signos: "Técnica N°1" -> "tecnica n 1"."""
+    if not texto:
+        return ""
+    sin_acentos = "".join(
+        c for c in unicodedata.normalize("NFKD", texto) if not unicodedata.combining(c)
+    )
+    return _NO_ALFANUMERICO.sub(" ", sin_acentos.lower()).strip()
@@ -0,0 +1,6 @@
+from datetime import datetime, timezone
+
+
+def ahora() -> datetime:
+    """UTC sin zona: así se guardan los DATETIME en la DB."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
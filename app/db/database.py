@@ -1,15 +1,63 @@
 import os
-from sqlmodel import SQLModel, Session, create_engine
-from app.core.config import DATABASE_URL
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.core.config import (
+    ASYNC_DATABASE_REPLICA_URLS,
+    ASYNC_DATABASE_URL,
+    DATABASE_REPLICA_URLS,
+    DATABASE_URL,
+)
+from app.db.instrumentation import instrumentar
+from app.db.pool import pool_kwargs
+from app.db.routing import ReplicaSet, RoutingSession
 
-engine = create_engine(DATABASE_URL)
+engine = create_engine(DATABASE_URL, **pool_kwargs(DATABASE_URL))
+
+# Mismo esquema, driver asyncio: lo usan los endpoints de lectura `async def`
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL, **pool_kwargs(ASYNC_DATABASE_URL, es_async=True)
+)
+
+# Réplicas de lectura (vacío = todo va a la primaria)
+replica_set = ReplicaSet([create_engine(u, **pool_kwargs(u)) for u in DATABASE_REPLICA_URLS])
+async_replica_set = ReplicaSet([
+    create_async_engine(u, **pool_kwargs(u, es_async=True)).sync_engine
+    for u in ASYNC_DATABASE_REPLICA_URLS
+])
+
+
+def _fks_sqlite(dbapi_conn, _) -> None:
+    # SQLite ignora las FKs (y sus ON DELETE CASCADE) si no se activan en cada conexión
+    cur = dbapi_conn.cursor()
+    cur.execute("PRAGMA foreign_keys=ON")
+    cur.close()
+
+
+# cantidad y tiempo de queries por request, log de queries lentas
+for _e in [engine, async_engine.sync_engine, *replica_set.engines, *async_replica_set.engines]:
+    instrumentar(_e)
+    if _e.dialect.name == "sqlite":
+        event.listen(_e, "connect", _fks_sqlite)
+
+
+class DBSession(RoutingSession):
+    primaria = engine
+    replicas = replica_set
+
+
+class AsyncDBSession(RoutingSession):
+    # AsyncSession trabaja sobre una Session sync: se rutea con los sync_engine
+    primaria = async_engine.sync_engine
+    replicas = async_replica_set
 
-def create_db_and_tables():
-        import app.models.escuela
-        import app.models.usuario
-        import app.models.rol
-        SQLModel.metadata.create_all(engine)
 
 def get_session():
-    with Session(engine) as session:
-        yield session
\ No newline at end of file
+    with DBSession() as session:
+        yield session
+
+async def get_async_session():
+    # expire_on_commit=False: en async no se pueden recargar atributos "lazy"
+    async with AsyncSession(sync_session_class=AsyncDBSession, expire_on_commit=False) as session:
+        yield session
@@ -0,0 +1,150 @@
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import PROFILE_INTERVAL_MS, SLOW_QUERY_MS
+
+logger = logging.getLogger("edupresente.sql")
+
+
+@dataclass
+class RequestStats:
+    consultas: int = 0
+    db_ms: float = 0.0
+    lentas: list[dict] = field(default_factory=list)
+
+
+# estadísticas de la request en curso (las completa el engine, las lee el middleware)
+request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+_IN_LIST = re.compile(r"\((?:\s*(?:\?|%s|:\w+|__\[POSTCOMPILE_\w+\])\s*,?)+\)")
+_NUMERO = re.compile(r"\b\d+\b")
+_ESPACIOS = re.compile(r"\s+")
+
+
+def normalizar_sql(sql: str) -> str:
+    """Una forma por consulta: sin saltos de línea y con listas IN / números colapsados."""
+    sql = _ESPACIOS.sub(" ", sql).strip()
+    sql = _IN_LIST.sub("(?...)", sql)
+    return _NUMERO.sub("N", sql)
+
+
+def forma_parametros(parametros, executemany: bool) -> dict:
+    # sólo tipos y cantidades: nunca se loguean valores (DNIs, contraseñas...)
+    if executemany:
+        primera = parametros[0] if parametros else ()
+        return {"filas": len(parametros), "fila": forma_parametros(primera, False)}
+    if isinstance(parametros, dict):
+        return {k: type(v).__name__ for k, v in parametros.items()}
+    return {"tipos": [type(v).__name__ for v in (parametros or ())]}
+
+
+def _antes(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_inicio", []).append(time.perf_counter())
+
+
+def _despues(conn, cursor, statement, parameters, context, executemany):
+    ms = (time.perf_counter() - conn.info["query_inicio"].pop()) * 1000
+    stats = request_stats.get()
+    if stats is not None:
+        stats.consultas += 1
+        stats.db_ms += ms
+
+    if ms >= SLOW_QUERY_MS:
+        lenta = {
+            "ms": round(ms, 2),
+            "sql": normalizar_sql(statement),
+            "params": forma_parametros(parameters, executemany),
+        }
+        if stats is not None:
+            stats.lentas.append(lenta)  # se loguea al final, con la ruta
+        else:
+            logger.warning(json.dumps({"evento": "slow_query", "ruta": None, **lenta}))
+
+
+def _error(contexto) -> None:
+    # una query que falla no pasa por _despues: sin esto su inicio queda en la
+    # pila de la conexión (que vuelve al pool) y desfasa las mediciones siguientes
+    conn = contexto.connection
+    inicios = conn.info.get("query_inicio") if conn is not None and contexto.execution_context is not None else None
+    if not inicios:
+        return
+    ms = (time.perf_counter() - inicios.pop()) * 1000
+    stats = request_stats.get()
+    if stats is not None:
+        stats.consultas += 1
+        stats.db_ms += ms
+
+
+def instrumentar(engine: Engine) -> None:
+    event.listen(engine, "before_cursor_execute", _antes)
+    event.listen(engine, "after_cursor_execute", _despues)
+    event.listen(engine, "handle_error", _error)
+
+
+def loguear_lentas(stats: RequestStats, ruta: str, metodo: str) -> None:
+    for lenta in stats.lentas:
+        logger.warning(json.dumps({"evento": "slow_query", "ruta": ruta, "metodo": metodo, **lenta}))
+
+
+class SamplingProfiler:
+    """Profiler por muestreo: cada PROFILE_INTERVAL_MS toma el stack de los hilos
+    que están ejecutando código de `app/` y al final cuenta los más frecuentes.
+
+    Muestrea todos los hilos del proceso: conviene usarlo con poca concurrencia.
+    """
+
+    _raiz_app = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    def __init__(self, intervalo_ms: float = PROFILE_INTERVAL_MS):
+        self.intervalo = intervalo_ms / 1000
+        self.muestras: Counter[tuple[str, ...]] = Counter()
+        self.total = 0
+        self._fin = threading.Event()
+        self._hilo = threading.Thread(target=self._muestrear, daemon=True, name="sampling-profiler")
+
+    def _stack_app(self, frame) -> tuple[str, ...]:
+        stack = []
+        while frame is not None:
+            codigo = frame.f_code
+            if codigo.co_filename.startswith(self._raiz_app):
+                rel = os.path.relpath(codigo.co_filename, os.path.dirname(self._raiz_app))
+                stack.append(f"{rel}:{frame.f_lineno}:{codigo.co_name}")
+            frame = frame.f_back
+        return tuple(reversed(stack))
+
+    def _muestrear(self) -> None:
+        propio = threading.get_ident()
+        while not self._fin.wait(self.intervalo):
+            for ident, frame in sys._current_frames().items():
+                if ident == propio:
+                    continue
+                stack = self._stack_app(frame)
+                if stack:
+                    self.muestras[stack] += 1
+                    self.total += 1
+
+    def __enter__(self):
+        self._hilo.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._fin.set()
+        self._hilo.join()
+
+    def reporte(self, top: int = 10) -> list[dict]:
+        return [
+            {"muestras": n, "pct": round(100 * n / self.total, 1), "stack": list(stack)}
+            for stack, n in self.muestras.most_common(top)
+        ]
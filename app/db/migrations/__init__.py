@@ -0,0 +1,132 @@
+"""Migraciones versionadas del esquema.
+
+Cada módulo `mNNNN_*.py` define VERSION, DESCRIPCION y `subir(conn)`. La
+versión aplicada se guarda en la tabla `schema_version` (una fila): al iniciar,
+cada worker sólo lee esa fila en lugar de inspeccionar todas las tablas.
+
+    python -m app.db.migrations           # aplica las pendientes
+    python -m app.db.migrations --estado  # versión actual y pendientes
+"""
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table, delete, insert, select, text
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+from app.db.migrations import (
+    m0001_inicial,
+    m0002_escuela_busqueda,
+    m0003_indices_rol_alumno,
+    m0004_asistencia_resumen,
+    m0005_fks_cascada,
+    m0006_asistencia_archivo,
+    m0007_sync_offline,
+    m0008_revocacion_tokens,
+)
+
+MIGRACIONES = [
+    m0001_inicial,
+    m0002_escuela_busqueda,
+    m0003_indices_rol_alumno,
+    m0004_asistencia_resumen,
+    m0005_fks_cascada,
+    m0006_asistencia_archivo,
+    m0007_sync_offline,
+    m0008_revocacion_tokens,
+]
+
+VERSION_ESQUEMA = MIGRACIONES[-1].VERSION
+
+schema_version = Table(
+    "schema_version",
+    MetaData(),  # aparte de SQLModel.metadata: no la crea create_all
+    Column("version", Integer, nullable=False),
+    Column("aplicadaEn", DateTime, nullable=False),
+)
+
+
+def version_actual(conn) -> int:
+    # DB vacía o anterior a las migraciones: versión 0
+    try:
+        return conn.execute(select(schema_version.c.version)).scalar() or 0
+    except (OperationalError, ProgrammingError):
+        conn.rollback()
+        return 0
+
+
+def pendientes(conn) -> list:
+    actual = version_actual(conn)
+    return [m for m in MIGRACIONES if m.VERSION > actual]
+
+
+# lock de la DB (no de una tabla) mientras se migra; dura lo que la conexión
+NOMBRE_LOCK = "edu_presente_migraciones"
+ID_LOCK_PG = 0x6564755F6D6967  # pg_advisory_lock toma un bigint
+ESPERA_LOCK_SEGUNDOS = 600
+
+
+@contextmanager
+def _lock_migraciones(conn):
+    # varios workers con DB_AUTO_MIGRATE arrancan a la vez: migra el primero que toma
+    # el lock y los demás, al obtenerlo, ya leen la versión nueva y no tienen pendientes.
+    # SQLite no tiene locks con nombre: se usa con un solo proceso (dev y tests).
+    dialecto = conn.dialect.name
+    if dialecto == "mysql":
+        obtenido = conn.execute(
+            text("SELECT GET_LOCK(:nombre, :espera)"), {"nombre": NOMBRE_LOCK, "espera": ESPERA_LOCK_SEGUNDOS}
+        ).scalar()
+        if obtenido != 1:
+            raise RuntimeError(f"Otro proceso está migrando la DB (esperé {ESPERA_LOCK_SEGUNDOS}s)")
+    elif dialecto == "postgresql":
+        conn.execute(text("SELECT pg_advisory_lock(:id)"), {"id": ID_LOCK_PG})
+    conn.commit()
+    try:
+        yield
+    finally:
+        # una migración que falló deja la transacción abierta: cerrarla antes de soltar el lock
+        conn.rollback()
+        if dialecto == "mysql":
+            conn.execute(text("SELECT RELEASE_LOCK(:nombre)"), {"nombre": NOMBRE_LOCK})
+        elif dialecto == "postgresql":
+            conn.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": ID_LOCK_PG})
+        conn.commit()
+
+
+def migrar(engine) -> list[int]:
+    """Aplica las migraciones pendientes, cada una en su transacción.
+
+    Toma un lock de la DB (MySQL/PostgreSQL) para que dos workers no apliquen la misma
+    migración a la vez.
+    """
+    aplicadas = []
+    with engine.connect() as conn, _lock_migraciones(conn):
+        por_aplicar = pendientes(conn)
+        schema_version.create(conn, checkfirst=True)
+        conn.commit()
+        for m in por_aplicar:
+            m.subir(conn)
+            conn.execute(delete(schema_version))
+            conn.execute(insert(schema_version).values(
+                version=m.VERSION, aplicadaEn=datetime.now(timezone.utc).replace(tzinfo=None),
+            ))
+            conn.commit()
+            aplicadas.append(m.VERSION)
+    return aplicadas
+
+
+def verificar_esquema(engine, auto_migrar: bool) -> int:
+    """Chequeo de arranque: una sola consulta si la DB ya está al día."""
+    with engine.connect() as conn:
+        actual = version_actual(conn)
+    if actual == VERSION_ESQUEMA:
+        return actual
+    if actual > VERSION_ESQUEMA:
+        raise RuntimeError(
+            f"La DB está en la versión {actual}, más nueva que este código ({VERSION_ESQUEMA})"
+        )
+    if not auto_migrar:
+        raise RuntimeError(
+            f"Esquema en versión {actual}, se espera {VERSION_ESQUEMA}: correr `python -m app.db.migrations`"
+        )
+    migrar(engine)
+    return VERSION_ESQUEMA
@@ -0,0 +1,27 @@
+import argparse
+
+from app.db.database import engine
+from app.db.migrations import VERSION_ESQUEMA, migrar, pendientes, version_actual
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Migraciones del esquema de EduPresente")
+    parser.add_argument("--estado", action="store_true", help="sólo mostrar la versión y las pendientes")
+    args = parser.parse_args()
+
+    with engine.connect() as conn:
+        actual = version_actual(conn)
+        faltan = pendientes(conn)
+    print(f"DB: {engine.url.render_as_string(hide_password=True)}")
+    print(f"versión actual: {actual} / código: {VERSION_ESQUEMA}")
+    for m in faltan:
+        print(f"  pendiente {m.VERSION:04d}: {m.DESCRIPCION}")
+
+    if args.estado or not faltan:
+        return
+    for version in migrar(engine):
+        print(f"  aplicada {version:04d}")
+
+
+if __name__ == "__main__":
+    main()
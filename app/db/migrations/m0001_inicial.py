@@ -0,0 +1,113 @@
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, Integer, MetaData, Table, Text
+from sqlmodel import AutoString
+
+VERSION = 1
+DESCRIPCION = "Esquema base: crea las tablas que no existan"
+
+# esquema congelado en esta versión: los cambios posteriores van en sus migraciones,
+# no acá (esta definición no sigue a los modelos)
+metadata = MetaData()
+
+escuela = Table(
+    "escuela",
+    metadata,
+    Column("idEscuela", Integer, primary_key=True),
+    Column("cue", AutoString, index=True),
+    Column("nombre", AutoString, nullable=False),
+    Column("numero", AutoString),
+    Column("nivel_educativo", AutoString),
+    Column("turno", AutoString),
+    Column("matricula", Integer),
+    Column("direccion", AutoString),
+    Column("codigo_postal", AutoString),
+    Column("codigo_provincial", AutoString),
+    Column("telefono", AutoString),
+    Column("correo_electronico", AutoString),
+    Column("provincia", AutoString),
+    Column("localidad", AutoString),
+    Column("busqueda", Text),
+)
+
+responsable = Table(
+    "responsable",
+    metadata,
+    Column("idResponsable", Integer, primary_key=True),
+    Column("nombre", AutoString, nullable=False),
+    Column("apellido", AutoString, nullable=False),
+    Column("dni", AutoString(20), nullable=False, index=True),
+    Column("telefono", AutoString(30)),
+    Column("correo_electronico", AutoString(120)),
+)
+
+usuario = Table(
+    "usuario",
+    metadata,
+    Column("idUsuario", Integer, primary_key=True),
+    Column("dni", AutoString, nullable=False, index=True),
+    Column("cuil", AutoString),
+    Column("mailABC", AutoString),
+    Column("contrasena", AutoString, nullable=False),
+    Column("celular", AutoString),
+    Column("nombre", AutoString),
+    Column("apellido", AutoString),
+)
+
+curso = Table(
+    "curso",
+    metadata,
+    Column("idCurso", Integer, primary_key=True),
+    Column("idEscuela", Integer, ForeignKey("escuela.idEscuela"), nullable=False, index=True),
+    Column("nombre", AutoString, nullable=False),
+    Column("grado", AutoString),
+    Column("division", AutoString),
+    Column("turno", AutoString),
+    Column("cicloLectivo", Integer, nullable=False),
+)
+
+rol = Table(
+    "rol",
+    metadata,
+    Column("idRol", Integer, primary_key=True),
+    Column("idUsuario", Integer, ForeignKey("usuario.idUsuario"), nullable=False),
+    Column("idEscuela", Integer, ForeignKey("escuela.idEscuela"), nullable=False),
+    Column("descripcion", AutoString, nullable=False),
+    Column("estado", AutoString, nullable=False),
+)
+
+alumno = Table(
+    "alumno",
+    metadata,
+    Column("idAlumno", Integer, primary_key=True),
+    Column("idCurso", Integer, ForeignKey("curso.idCurso"), nullable=False, index=True),
+    Column("nombre", AutoString, nullable=False),
+    Column("apellido", AutoString, nullable=False),
+    Column("dni", AutoString, nullable=False),
+    Column("fecha_nacimiento", Date, nullable=False),
+    Column("fecha_ingreso", Date, nullable=False),
+    Column("direccion", AutoString),
+)
+
+alumno_responsable = Table(
+    "alumno_responsable",
+    metadata,
+    Column("idAlumno", Integer, ForeignKey("alumno.idAlumno"), primary_key=True),
+    Column("idResponsable", Integer, ForeignKey("responsable.idResponsable"), primary_key=True),
+    Column("parentesco", AutoString(50), nullable=False, index=True),
+)
+
+asistencia = Table(
+    "asistencia",
+    metadata,
+    Column("idAlumno", Integer, ForeignKey("alumno.idAlumno"), primary_key=True),
+    Column("fecha", Date, primary_key=True),
+    Column("idCurso", Integer, ForeignKey("curso.idCurso"), nullable=False),
+    Column("estado", AutoString(20), nullable=False),
+    Column("observacion", AutoString(255)),
+    Column("actualizadoEn", DateTime, nullable=False),
+    Index("ix_asistencia_curso_fecha", "idCurso", "fecha"),
+)
+
+
+def subir(conn) -> None:
+    # checkfirst: en una DB creada antes de las migraciones no toca las tablas existentes
+    metadata.create_all(conn)
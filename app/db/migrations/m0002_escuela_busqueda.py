@@ -0,0 +1,54 @@
+import re
+import unicodedata
+
+from sqlalchemy import Column, Integer, MetaData, Table, Text, bindparam, select, text, update
+from sqlmodel import AutoString
+
+from app.db.migrations.ops import agregar_columna, hay_indice
+
+VERSION = 2
+DESCRIPCION = "escuela.busqueda (texto normalizado) + índice FULLTEXT en MySQL"
+
+# sólo las columnas que usa esta migración, como estaban en esta versión
+escuela = Table(
+    "escuela",
+    MetaData(),
+    Column("idEscuela", Integer, primary_key=True),
+    Column("cue", AutoString),
+    Column("nombre", AutoString),
+    Column("numero", AutoString),
+    Column("provincia", AutoString),
+    Column("localidad", AutoString),
+    Column("busqueda", Text),
+)
+
+_NO_ALFANUMERICO = re.compile(r"[^a-z0-9]+")
+
+
+def _normalizar(texto: str) -> str:
+    # copia de app.core.texto.normalizar en esta versión
+    sin_acentos = "".join(
+        c for c in unicodedata.normalize("NFKD", texto) if not unicodedata.combining(c)
+    )
+    return _NO_ALFANUMERICO.sub(" ", sin_acentos.lower()).strip()
+
+
+def subir(conn) -> None:
+    agregar_columna(conn, escuela.c.busqueda)
+    if conn.dialect.name == "mysql" and not hay_indice(conn, "escuela", "ft_escuela_busqueda"):
+        conn.execute(text(
+            "ALTER TABLE escuela ADD FULLTEXT INDEX ft_escuela_busqueda (busqueda) WITH PARSER ngram"
+        ))
+    # escuelas cargadas antes de existir la columna: UPDATE por PK en un solo executemany
+    e = escuela.c
+    pendientes = conn.execute(
+        select(e.idEscuela, e.nombre, e.cue, e.numero, e.localidad, e.provincia).where(e.busqueda.is_(None))
+    ).all()
+    if pendientes:
+        conn.execute(
+            update(escuela).where(e.idEscuela == bindparam("id")).values(busqueda=bindparam("texto")),
+            [
+                {"id": fila[0], "texto": _normalizar(" ".join(str(v) for v in fila[1:] if v))}
+                for fila in pendientes
+            ],
+        )
@@ -0,0 +1,37 @@
+from sqlalchemy import Column, Index, Integer, MetaData, Table
+from sqlmodel import AutoString
+
+from app.db.migrations.ops import crear_indice
+
+VERSION = 3
+DESCRIPCION = "Índices de rol (login, pendientes, director) y alumno.dni"
+
+# sólo las columnas indexadas, como estaban en esta versión
+metadata = MetaData()
+
+rol = Table(
+    "rol",
+    metadata,
+    Column("idUsuario", Integer),
+    Column("idEscuela", Integer),
+    Column("descripcion", AutoString),
+    Column("estado", AutoString),
+    # login (roles de un usuario) y aprobar/rechazar (usuario + escuela + rol)
+    Index("ix_rol_usuario_escuela_desc", "idUsuario", "idEscuela", "descripcion"),
+    # solicitudes pendientes por tipo de rol (admin)
+    Index("ix_rol_desc_estado", "descripcion", "estado"),
+    # docentes / solicitudes de una escuela (director)
+    Index("ix_rol_escuela_desc_estado", "idEscuela", "descripcion", "estado"),
+)
+
+alumno = Table(
+    "alumno",
+    metadata,
+    Column("idCurso", Integer, index=True),
+    Column("dni", AutoString, index=True),
+)
+
+
+def subir(conn) -> None:
+    for indice in [*rol.indexes, *alumno.indexes]:
+        crear_indice(conn, indice)
@@ -0,0 +1,111 @@
+from sqlalchemy import (
+    Column, Date, ForeignKey, Index, Integer, MetaData, Table, case, cast, func, insert, select,
+)
+from sqlmodel import AutoString
+
+from app.db.migrations.ops import crear_tabla
+
+VERSION = 4
+DESCRIPCION = "Resúmenes de asistencia por alumno/curso/escuela (día y mes)"
+
+# esquema congelado en esta versión (no sigue a los modelos)
+metadata = MetaData()
+
+# tablas existentes: sólo lo que usan las FKs y el backfill
+escuela = Table("escuela", metadata, Column("idEscuela", Integer, primary_key=True))
+curso = Table(
+    "curso",
+    metadata,
+    Column("idCurso", Integer, primary_key=True),
+    Column("idEscuela", Integer),
+)
+alumno = Table("alumno", metadata, Column("idAlumno", Integer, primary_key=True))
+asistencia = Table(
+    "asistencia",
+    metadata,
+    Column("idAlumno", Integer, primary_key=True),
+    Column("fecha", Date, primary_key=True),
+    Column("idCurso", Integer),
+    Column("estado", AutoString(20)),
+)
+
+ESTADO_COLUMNA = {
+    "Presente": "presentes",
+    "Ausente": "ausentes",
+    "Tarde": "tardes",
+    "Justificado": "justificados",
+}
+
+
+def _resumen(nombre: str, *columnas) -> Table:
+    contadores = [Column(c, Integer, nullable=False) for c in ESTADO_COLUMNA.values()]
+    return Table(nombre, metadata, *contadores, *columnas)
+
+
+asistencia_alumno_mes = _resumen(
+    "asistencia_alumno_mes",
+    Column("idCurso", Integer, ForeignKey("curso.idCurso"), primary_key=True),
+    Column("mes", Date, primary_key=True),
+    Column("idAlumno", Integer, ForeignKey("alumno.idAlumno"), primary_key=True),
+    Index("ix_asistencia_alumno_mes_alumno", "idAlumno", "mes"),
+)
+asistencia_curso_dia = _resumen(
+    "asistencia_curso_dia",
+    Column("idCurso", Integer, ForeignKey("curso.idCurso"), primary_key=True),
+    Column("fecha", Date, primary_key=True),
+    Column("idEscuela", Integer, ForeignKey("escuela.idEscuela"), nullable=False),
+    Index("ix_asistencia_curso_dia_escuela", "idEscuela", "fecha"),
+)
+asistencia_curso_mes = _resumen(
+    "asistencia_curso_mes",
+    Column("idCurso", Integer, ForeignKey("curso.idCurso"), primary_key=True),
+    Column("mes", Date, primary_key=True),
+    Column("idEscuela", Integer, ForeignKey("escuela.idEscuela"), nullable=False),
+    Index("ix_asistencia_curso_mes_escuela", "idEscuela", "mes"),
+)
+asistencia_escuela_dia = _resumen(
+    "asistencia_escuela_dia",
+    Column("idEscuela", Integer, ForeignKey("escuela.idEscuela"), primary_key=True),
+    Column("fecha", Date, primary_key=True),
+)
+asistencia_escuela_mes = _resumen(
+    "asistencia_escuela_mes",
+    Column("idEscuela", Integer, ForeignKey("escuela.idEscuela"), primary_key=True),
+    Column("mes", Date, primary_key=True),
+)
+
+
+def _mes_sql(dialecto: str, columna):
+    # primer día del mes de `columna`, en SQL de cada motor
+    if dialecto == "sqlite":
+        return func.date(columna, "start of month")
+    if dialecto == "postgresql":
+        return cast(func.date_trunc("month", columna), Date)
+    return func.date_format(columna, "%Y-%m-01")
+
+
+def subir(conn) -> None:
+    resumenes = (asistencia_alumno_mes, asistencia_curso_dia, asistencia_curso_mes,
+                 asistencia_escuela_dia, asistencia_escuela_mes)
+    for tabla in resumenes:
+        crear_tabla(conn, tabla)
+
+    # backfill con la asistencia ya cargada: un INSERT ... SELECT por tabla
+    a, c = asistencia.c, curso.c
+    mes = _mes_sql(conn.dialect.name, a.fecha)
+    conteos = [func.sum(case((a.estado == estado, 1), else_=0)) for estado in ESTADO_COLUMNA]
+    grupos = {
+        asistencia_alumno_mes: ([a.idCurso, mes, a.idAlumno], ["idCurso", "mes", "idAlumno"]),
+        asistencia_curso_dia: ([a.idCurso, a.fecha, c.idEscuela], ["idCurso", "fecha", "idEscuela"]),
+        asistencia_curso_mes: ([a.idCurso, mes, c.idEscuela], ["idCurso", "mes", "idEscuela"]),
+        asistencia_escuela_dia: ([c.idEscuela, a.fecha], ["idEscuela", "fecha"]),
+        asistencia_escuela_mes: ([c.idEscuela, mes], ["idEscuela", "mes"]),
+    }
+    for tabla, (grupo, columnas) in grupos.items():
+        origen = (
+            select(*grupo, *conteos)
+            .select_from(asistencia)
+            .join(curso, c.idCurso == a.idCurso)
+            .group_by(*grupo)
+        )
+        conn.execute(insert(tabla).from_select(columnas + list(ESTADO_COLUMNA.values()), origen))
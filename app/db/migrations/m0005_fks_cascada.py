@@ -0,0 +1,147 @@
+from sqlalchemy import (
+    Boolean, Column, Date, DateTime, ForeignKey, Index, Integer, MetaData, Table, false,
+)
+from sqlmodel import AutoString
+
+from app.db.migrations.ops import actualizar_fks, agregar_columna
+
+VERSION = 5
+DESCRIPCION = "FKs con ON DELETE CASCADE + curso.cerrado"
+
+# esquema congelado en esta versión: en SQLite las tablas se reconstruyen con
+# esta definición, así que lleva todas sus columnas e índices (no sigue a los modelos)
+metadata = MetaData()
+
+# destino de FKs que no se tocan
+escuela = Table("escuela", metadata, Column("idEscuela", Integer, primary_key=True))
+usuario = Table("usuario", metadata, Column("idUsuario", Integer, primary_key=True))
+responsable = Table("responsable", metadata, Column("idResponsable", Integer, primary_key=True))
+
+curso = Table(
+    "curso",
+    metadata,
+    Column("idCurso", Integer, primary_key=True),
+    Column("idEscuela", Integer, ForeignKey("escuela.idEscuela", ondelete="CASCADE"), nullable=False, index=True),
+    Column("nombre", AutoString, nullable=False),
+    Column("grado", AutoString),
+    Column("division", AutoString),
+    Column("turno", AutoString),
+    Column("cicloLectivo", Integer, nullable=False),
+    Column("cerrado", Boolean, nullable=False, server_default=false()),
+)
+
+rol = Table(
+    "rol",
+    metadata,
+    Column("idRol", Integer, primary_key=True),
+    Column("idUsuario", Integer, ForeignKey("usuario.idUsuario", ondelete="CASCADE"), nullable=False),
+    Column("idEscuela", Integer, ForeignKey("escuela.idEscuela", ondelete="CASCADE"), nullable=False),
+    Column("descripcion", AutoString, nullable=False),
+    Column("estado", AutoString, nullable=False),
+    Index("ix_rol_usuario_escuela_desc", "idUsuario", "idEscuela", "descripcion"),
+    Index("ix_rol_desc_estado", "descripcion", "estado"),
+    Index("ix_rol_escuela_desc_estado", "idEscuela", "descripcion", "estado"),
+)
+
+alumno = Table(
+    "alumno",
+    metadata,
+    Column("idAlumno", Integer, primary_key=True),
+    Column("idCurso", Integer, ForeignKey("curso.idCurso", ondelete="CASCADE"), nullable=False, index=True),
+    Column("nombre", AutoString, nullable=False),
+    Column("apellido", AutoString, nullable=False),
+    Column("dni", AutoString, nullable=False, index=True),
+    Column("fecha_nacimiento", Date, nullable=False),
+    Column("fecha_ingreso", Date, nullable=False),
+    Column("direccion", AutoString),
+)
+
+alumno_responsable = Table(
+    "alumno_responsable",
+    metadata,
+    Column("idAlumno", Integer, ForeignKey("alumno.idAlumno", ondelete="CASCADE"), primary_key=True),
+    Column("idResponsable", Integer, ForeignKey("responsable.idResponsable", ondelete="CASCADE"), primary_key=True),
+    Column("parentesco", AutoString(50), nullable=False, index=True),
+)
+
+asistencia = Table(
+    "asistencia",
+    metadata,
+    Column("idAlumno", Integer, ForeignKey("alumno.idAlumno", ondelete="CASCADE"), primary_key=True),
+    Column("fecha", Date, primary_key=True),
+    Column("idCurso", Integer, ForeignKey("curso.idCurso", ondelete="CASCADE"), nullable=False),
+    Column("estado", AutoString(20), nullable=False),
+    Column("observacion", AutoString(255)),
+    Column("actualizadoEn", DateTime, nullable=False),
+    Index("ix_asistencia_curso_fecha", "idCurso", "fecha"),
+)
+
+
+def _resumen(nombre: str, *columnas) -> Table:
+    contadores = [Column(c, Integer, nullable=False) for c in ("presentes", "ausentes", "tardes", "justificados")]
+    return Table(nombre, metadata, *contadores, *columnas)
+
+
+asistencia_alumno_mes = _resumen(
+    "asistencia_alumno_mes",
+    Column("idCurso", Integer, ForeignKey("curso.idCurso", ondelete="CASCADE"), primary_key=True),
+    Column("mes", Date, primary_key=True),
+    Column("idAlumno", Integer, ForeignKey("alumno.idAlumno", ondelete="CASCADE"), primary_key=True),
+    Index("ix_asistencia_alumno_mes_alumno", "idAlumno", "mes"),
+)
+asistencia_curso_dia = _resumen(
+    "asistencia_curso_dia",
+    Column("idCurso", Integer, ForeignKey("curso.idCurso", ondelete="CASCADE"), primary_key=True),
+    Column("fecha", Date, primary_key=True),
+    Column("idEscuela", Integer, ForeignKey("escuela.idEscuela", ondelete="CASCADE"), nullable=False),
+    Index("ix_asistencia_curso_dia_escuela", "idEscuela", "fecha"),
+)
+asistencia_curso_mes = _resumen(
+    "asistencia_curso_mes",
+    Column("idCurso", Integer, ForeignKey("curso.idCurso", ondelete="CASCADE"), primary_key=True),
+    Column("mes", Date, primary_key=True),
+    Column("idEscuela", Integer, ForeignKey("escuela.idEscuela", ondelete="CASCADE"), nullable=False),
+    Index("ix_asistencia_curso_mes_escuela", "idEscuela", "mes"),
+)
+asistencia_escuela_dia = _resumen(
+    "asistencia_escuela_dia",
+    Column("idEscuela", Integer, ForeignKey("escuela.idEscuela", ondelete="CASCADE"), primary_key=True),
+    Column("fecha", Date, primary_key=True),
+)
+asistencia_escuela_mes = _resumen(
+    "asistencia_escuela_mes",
+    Column("idEscuela", Integer, ForeignKey("escuela.idEscuela", ondelete="CASCADE"), primary_key=True),
+    Column("mes", Date, primary_key=True),
+)
+
+# padres antes que hijos
+TABLAS = [
+    curso, rol, alumno, alumno_responsable, asistencia,
+    asistencia_alumno_mes, asistencia_curso_dia, asistencia_curso_mes,
+    asistencia_escuela_dia, asistencia_escuela_mes,
+]
+
+
+def subir(conn) -> None:
+    agregar_columna(conn, curso.c.cerrado)
+    if conn.dialect.name != "sqlite":
+        for tabla in TABLAS:
+            actualizar_fks(conn, tabla)
+        return
+
+    # foreign_keys sólo cambia fuera de una transacción: la reconstrucción copia
+    # filas que pueden no cumplir las FKs todavía
+    conn.commit()
+    conn.exec_driver_sql("PRAGMA foreign_keys=OFF")
+    try:
+        # BEGIN explícito: pysqlite no abre la transacción antes de un DDL, y un
+        # error a mitad de camino dejaría tablas renombradas a `__viejo`
+        conn.exec_driver_sql("BEGIN")
+        for tabla in TABLAS:
+            actualizar_fks(conn, tabla)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.exec_driver_sql("PRAGMA foreign_keys=ON")
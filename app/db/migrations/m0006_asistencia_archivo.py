@@ -0,0 +1,32 @@
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, Integer, MetaData, Table
+from sqlmodel import AutoString
+
+from app.db.migrations.ops import crear_tabla
+
+VERSION = 6
+DESCRIPCION = "asistencia_archivo: asistencia de ciclos lectivos terminados"
+
+# esquema congelado en esta versión (no sigue a los modelos)
+metadata = MetaData()
+
+# destino de las FKs
+alumno = Table("alumno", metadata, Column("idAlumno", Integer, primary_key=True))
+curso = Table("curso", metadata, Column("idCurso", Integer, primary_key=True))
+
+asistencia_archivo = Table(
+    "asistencia_archivo",
+    metadata,
+    Column("idAlumno", Integer, ForeignKey("alumno.idAlumno", ondelete="CASCADE"), primary_key=True),
+    Column("fecha", Date, primary_key=True),
+    Column("idCurso", Integer, ForeignKey("curso.idCurso", ondelete="CASCADE"), nullable=False),
+    Column("estado", AutoString(20), nullable=False),
+    Column("observacion", AutoString(255)),
+    Column("actualizadoEn", DateTime, nullable=False),
+    Column("cicloLectivo", Integer, nullable=False),
+    Index("ix_asistencia_archivo_ciclo", "cicloLectivo"),
+    Index("ix_asistencia_archivo_curso_fecha", "idCurso", "fecha"),
+)
+
+
+def subir(conn) -> None:
+    crear_tabla(conn, asistencia_archivo)
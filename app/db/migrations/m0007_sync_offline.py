@@ -0,0 +1,47 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, MetaData, Table, update
+from sqlmodel import AutoString
+
+from app.core.tiempo import ahora
+from app.db.migrations.ops import crear_indice, crear_tabla, hay_columna
+
+VERSION = 7
+DESCRIPCION = "actualizadoEn en alumno/responsable/alumno_responsable/curso + sync_tombstone"
+
+# esquema congelado en esta versión (no sigue a los modelos)
+metadata = MetaData()
+
+# tablas que ganan `actualizadoEn` (sólo esa columna, indexada)
+CON_ACTUALIZADO = [
+    Table(nombre, metadata, Column("actualizadoEn", DateTime, nullable=False, index=True))
+    for nombre in ("alumno", "responsable", "alumno_responsable", "curso")
+]
+
+escuela = Table("escuela", metadata, Column("idEscuela", Integer, primary_key=True))
+
+sync_tombstone = Table(
+    "sync_tombstone",
+    metadata,
+    Column("idBaja", Integer, primary_key=True),
+    Column("entidad", AutoString(30), nullable=False),
+    Column("idEntidad", Integer, nullable=False),
+    Column("idRelacionado", Integer),
+    Column("idEscuela", Integer, ForeignKey("escuela.idEscuela", ondelete="CASCADE")),
+    Column("borradoEn", DateTime, nullable=False),
+    Index("ix_sync_tombstone_escuela_fecha", "idEscuela", "borradoEn"),
+)
+
+
+def subir(conn) -> None:
+    q = conn.dialect.identifier_preparer.quote
+    for tabla in CON_ACTUALIZADO:
+        if not hay_columna(conn, tabla.name, "actualizadoEn"):
+            columna = tabla.c.actualizadoEn
+            tipo = columna.type.compile(dialect=conn.dialect)
+            # nullable para poder agregarla con filas; se completa con la hora de la migración
+            conn.exec_driver_sql(f"ALTER TABLE {q(tabla.name)} ADD COLUMN {q(columna.name)} {tipo} NULL")
+            conn.execute(update(tabla).values(actualizadoEn=ahora()))
+            if conn.dialect.name == "mysql":
+                conn.exec_driver_sql(f"ALTER TABLE {q(tabla.name)} MODIFY {q(columna.name)} {tipo} NOT NULL")
+        for indice in tabla.indexes:
+            crear_indice(conn, indice)
+    crear_tabla(conn, sync_tombstone)
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table
+
+from app.db.migrations.ops import crear_tabla
+
+VERSION = 8
+DESCRIPCION = "revocacion_token: tokens revocados, compartidos entre workers"
+
+# esquema congelado en esta versión (no sigue a los modelos)
+revocacion_token = Table(
+    "revocacion_token",
+    MetaData(),
+    Column("idUsuario", Integer, primary_key=True, autoincrement=False),
+    Column("desde", DateTime, nullable=False, index=True),
+)
+
+
+def subir(conn) -> None:
+    crear_tabla(conn, revocacion_token)
@@ -0,0 +1,88 @@
+"""Operaciones idempotentes para las migraciones.
+
+Cada migración define las tablas que toca como eran en su versión (no importa
+los modelos). La 1 crea el esquema base en una DB vacía; las siguientes tienen
+que poder correr también sobre una DB creada antes de las migraciones, así que
+sólo agregan lo que falta.
+"""
+from sqlalchemy import Column, Index, Table, inspect
+from sqlalchemy.schema import AddConstraint, CreateColumn
+
+
+def hay_columna(conn, tabla: str, columna: str) -> bool:
+    return columna in {c["name"] for c in inspect(conn).get_columns(tabla)}
+
+
+def hay_indice(conn, tabla: str, indice: str) -> bool:
+    return indice in {i["name"] for i in inspect(conn).get_indexes(tabla)}
+
+
+def agregar_columna(conn, columna: Column) -> None:
+    tabla = columna.table.name
+    if not hay_columna(conn, tabla, columna.name):
+        ddl = CreateColumn(columna).compile(dialect=conn.dialect)
+        conn.exec_driver_sql(f"ALTER TABLE {tabla} ADD COLUMN {ddl}")
+
+
+def crear_indice(conn, indice: Index) -> None:
+    if not hay_indice(conn, indice.table.name, indice.name):
+        indice.create(conn)
+
+
+def crear_tabla(conn, tabla: Table) -> None:
+    tabla.create(conn, checkfirst=True)
+
+
+def _fks_desactualizadas(conn, tabla: Table) -> list:
+    """FKs de `tabla` cuyo ON DELETE no coincide con el de la DB: (fk de `tabla`, nombre en la DB)."""
+    en_db = {
+        (tuple(fk["constrained_columns"]), fk["referred_table"]): fk
+        for fk in inspect(conn).get_foreign_keys(tabla.name)
+    }
+    distintas = []
+    for fk in tabla.foreign_key_constraints:
+        actual = en_db.get((tuple(c.name for c in fk.columns), fk.referred_table.name))
+        ondelete = ((actual or {}).get("options") or {}).get("ondelete")
+        if (ondelete or "").upper() != (fk.ondelete or "").upper():
+            distintas.append((fk, actual["name"] if actual else None))
+    return distintas
+
+
+def actualizar_fks(conn, tabla: Table) -> bool:
+    """Lleva las FKs de la tabla en la DB a las de `tabla` (ej. ON DELETE CASCADE).
+
+    SQLite no permite modificar FKs: reconstruye la tabla (renombrar, crear,
+    copiar, borrar) con `foreign_keys` apagado, que el llamador tiene que
+    apagar fuera de una transacción. Devuelve si cambió algo.
+    """
+    distintas = _fks_desactualizadas(conn, tabla)
+    if not distintas:
+        return False
+
+    q = conn.dialect.identifier_preparer.quote
+    if conn.dialect.name != "sqlite":
+        for fk, nombre in distintas:
+            if nombre:
+                quitar = "DROP FOREIGN KEY" if conn.dialect.name == "mysql" else "DROP CONSTRAINT"
+                conn.exec_driver_sql(f"ALTER TABLE {q(tabla.name)} {quitar} {q(nombre)}")
+            conn.execute(AddConstraint(fk))
+        return True
+
+    viejo = f"{tabla.name}__viejo"
+    en_db = {c["name"] for c in inspect(conn).get_columns(tabla.name)}
+    # la copia sólo lleva las columnas de `tabla`: una que falte se perdería
+    sobrantes = en_db - set(tabla.columns.keys())
+    if sobrantes:
+        raise RuntimeError(f"{tabla.name}: columnas {sorted(sobrantes)} fuera de la definición a reconstruir")
+    columnas = ", ".join(q(c.name) for c in tabla.columns if c.name in en_db)
+    # los índices viajan con la tabla renombrada: se borran para recrearlos con la nueva
+    for ix in inspect(conn).get_indexes(tabla.name):
+        conn.exec_driver_sql(f"DROP INDEX {q(ix['name'])}")
+    # legacy_alter_table: que las FKs de otras tablas sigan apuntando al nombre original
+    conn.exec_driver_sql("PRAGMA legacy_alter_table=ON")
+    conn.exec_driver_sql(f"ALTER TABLE {q(tabla.name)} RENAME TO {q(viejo)}")
+    conn.exec_driver_sql("PRAGMA legacy_alter_table=OFF")
+    tabla.create(conn)
+    conn.exec_driver_sql(f"INSERT INTO {q(tabla.name)} ({columnas}) SELECT {columnas} FROM {q(viejo)}")
+    conn.exec_driver_sql(f"DROP TABLE {q(viejo)}")
+    return True
@@ -0,0 +1,121 @@
+import threading
+import time
+from bisect import bisect_left
+
+from sqlalchemy import exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import (
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+)
+
+# límites superiores (ms) del histograma de espera para obtener conexión
+BUCKETS_ESPERA_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class PoolStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.espera_total_ms = 0.0
+        self.espera_max_ms = 0.0
+        self.buckets = [0] * (len(BUCKETS_ESPERA_MS) + 1)  # el último es +Inf
+
+    def observar(self, espera_ms: float) -> None:
+        i = bisect_left(BUCKETS_ESPERA_MS, espera_ms)
+        with self._lock:
+            self.checkouts += 1
+            self.espera_total_ms += espera_ms
+            self.espera_max_ms = max(self.espera_max_ms, espera_ms)
+            self.buckets[i] += 1
+
+    def timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+
+class _InstrumentedPool:
+    """Mide cuánto espera cada request para obtener una conexión del pool."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self):
+        inicio = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.timeout()
+            raise
+        self.stats.observar((time.perf_counter() - inicio) * 1000)
+        return conn
+
+    def recreate(self):
+        # engine.dispose() recrea el pool: las métricas se conservan
+        nuevo = super().recreate()
+        nuevo.stats = self.stats
+        return nuevo
+
+
+class InstrumentedQueuePool(_InstrumentedPool, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPool, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_kwargs(url: str, es_async: bool = False) -> dict:
+    """Opciones de pool para create_engine según config.
+
+    SQLite en memoria usa un pool de una sola conexión y no acepta estas opciones.
+    """
+    if url.startswith("sqlite") and (":memory:" in url or url.rstrip("/") == "sqlite:"):
+        return {}
+    return {
+        "poolclass": InstrumentedAsyncQueuePool if es_async else InstrumentedQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+
+def pool_snapshot(engine: Engine) -> dict:
+    pool = engine.pool
+    datos = {"pool": pool.__class__.__name__}
+    if isinstance(pool, QueuePool):
+        datos.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+            max_overflow=pool._max_overflow,
+            timeout=pool.timeout(),
+        )
+
+    stats = getattr(pool, "stats", None)
+    if stats is not None:
+        with stats._lock:
+            acumulado = 0
+            histograma = {}
+            for limite, n in zip([*BUCKETS_ESPERA_MS, "+Inf"], stats.buckets):
+                acumulado += n
+                histograma[str(limite)] = acumulado
+            datos.update(
+                checkouts=stats.checkouts,
+                checkout_timeouts=stats.timeouts,
+                espera_promedio_ms=round(stats.espera_total_ms / stats.checkouts, 3)
+                if stats.checkouts else 0.0,
+                espera_max_ms=round(stats.espera_max_ms, 3),
+                espera_ms_histograma=histograma,  # acumulado: checkouts con espera <= límite
+            )
+    return datos
@@ -0,0 +1,191 @@
+"""Chequeo de planes de ejecución de las consultas calientes.
+
+    python -m app.db.query_plans                           # SQLite temporal con el esquema migrado
+    python -m app.db.query_plans --db mysql+mysqldb://...  # MySQL con datos (ver app.generar_datos)
+
+Corre EXPLAIN sobre las consultas de cada router y termina con código 1 si
+alguna recorre una tabla entera: un índice que falta, o una consulta que deja
+de usarlo, aparece acá y no en producción. En MySQL conviene correrlo sobre
+una DB con datos: con tablas vacías el optimizador prefiere escanear.
+"""
+import argparse
+import os
+import re
+import sys
+import tempfile
+from dataclasses import dataclass
+from datetime import date, datetime
+
+from sqlalchemy import or_
+from sqlalchemy.engine import Connection
+from sqlmodel import create_engine, select
+
+from app.core.pagination import Paginacion, _stmt_pagina
+from app.db.migrations import migrar
+from app.models.alumno import Alumno
+from app.models.alumno_responsable import AlumnoResponsable
+from app.models.asistencia import Asistencia
+from app.models.asistencia_resumen import AsistenciaAlumnoMes, AsistenciaCursoDia, AsistenciaEscuelaMes
+from app.models.curso import Curso
+from app.models.escuela import Escuela
+from app.models.responsable import Responsable
+from app.models.revocacion_token import RevocacionToken
+from app.models.rol import Rol
+from app.models.sync import SyncBaja
+from app.models.usuario import Usuario
+from app.services.alumno_service import COLUMNAS_PUBLICAS as COLUMNAS_ALUMNO
+from app.services.asistencia_archivo import fuente_asistencia
+from app.services.auth_service import _stmt_membresias, _stmt_roles
+from app.services.curso_service import COLUMNAS_PUBLICAS as COLUMNAS_CURSO
+from app.services.escuela_search import _stmt_busqueda
+from app.services.export_service import _stmt_export
+from app.services.rol_service import _stmt_miembros
+
+
+@dataclass
+class Consulta:
+    router: str
+    nombre: str
+    stmt: object
+    # tablas que puede recorrer enteras a propósito (ej. listado keyset sin filtro: corta en LIMIT)
+    escaneo_ok: frozenset[str] = frozenset()
+
+
+def consultas(dialecto: str) -> list[Consulta]:
+    # mismas formas que arman los routers y services; los valores son de ejemplo
+    pag = Paginacion(cursor=None, limit=50)
+    keyset = frozenset({"escuela", "usuario"})
+    return [
+        Consulta("auth", "login", select(Usuario).where(Usuario.dni == "30111222")),
+        Consulta("auth", "roles_usuario", _stmt_roles(1)),
+        Consulta("auth", "revocaciones", select(RevocacionToken.idUsuario, RevocacionToken.desde).where(
+            RevocacionToken.desde > datetime(2026, 3, 1),
+        )),
+        Consulta("admin", "pendientes", (
+            select(Usuario, Escuela, Rol)
+            .join(Rol, Rol.idUsuario == Usuario.idUsuario)
+            .join(Escuela, Rol.idEscuela == Escuela.idEscuela)
+            .where(Rol.descripcion == "Director")
+            .where(Rol.estado == "Pendiente")
+        )),
+        Consulta("admin", "aprobar", select(Rol).where(
+            Rol.idUsuario == 1, Rol.idEscuela == 1, Rol.descripcion == "Director",
+        )),
+        Consulta("admin", "lote_solicitudes", select(Rol.idRol, Rol.estado).where(Rol.idRol.in_([1, 2, 3]))),
+        Consulta("director", "docentes", _stmt_pagina(
+            _stmt_miembros(1, "Docente", "Aprobado"), Rol.idRol, pag,
+        )),
+        Consulta("director", "conteos", _stmt_membresias(1)),
+        Consulta("alumno", "lista_por_curso", _stmt_pagina(
+            select(*COLUMNAS_ALUMNO).where(Alumno.idCurso == 1), Alumno.idAlumno, pag,
+        )),
+        Consulta("alumno", "detalle_multi", select(Alumno).where(Alumno.idAlumno.in_([1, 2, 3]))),
+        Consulta("alumno", "responsables_de_alumnos", (
+            select(AlumnoResponsable.idAlumno, AlumnoResponsable.parentesco, Responsable)
+            .join(Responsable, Responsable.idResponsable == AlumnoResponsable.idResponsable)
+            .where(AlumnoResponsable.idAlumno.in_([1, 2, 3]))
+        )),
+        Consulta("curso", "lista_por_escuela", _stmt_pagina(
+            select(*COLUMNAS_CURSO).where(Curso.idEscuela == 1, Curso.cicloLectivo == 2025), Curso.idCurso, pag,
+        )),
+        Consulta("curso", "roster", (
+            select(Alumno).where(Alumno.idCurso == 1).order_by(Alumno.apellido, Alumno.nombre)
+        )),
+        Consulta("escuela", "lista", _stmt_pagina(select(Escuela), Escuela.idEscuela, pag), keyset),
+        # fuera de MySQL no hay FULLTEXT: LIKE sobre la tabla (chica) de escuelas
+        Consulta("escuela", "busqueda", _stmt_busqueda(dialecto, "tecnica", 20),
+                 frozenset() if dialecto == "mysql" else frozenset({"escuela"})),
+        Consulta("escuela", "export_alumnos", _stmt_export("alumnos", 1, 2025)),
+        Consulta("escuela", "import_dni_alumnos", select(Alumno.dni).where(
+            Alumno.dni.in_(["45111222", "45111223"]), Alumno.idCurso.in_([1, 2]),
+        )),
+        Consulta("responsable", "import_dni_responsables", select(
+            Responsable.dni, Responsable.idResponsable,
+        ).where(Responsable.dni.in_(["30111222", "30111223"]))),
+        Consulta("asistencia", "planilla", select(Asistencia).where(
+            Asistencia.idCurso == 1, Asistencia.fecha == date(2025, 3, 10),
+        )),
+        Consulta("asistencia", "planilla_ciclo_pasado", select(fuente_asistencia(
+            True, lambda t: [t.idCurso == 1, t.fecha == date(2024, 3, 10)],
+        ))),
+        Consulta("asistencia", "validar_alumnos", select(Alumno.idAlumno).where(
+            Alumno.idCurso == 1, Alumno.idAlumno.in_([1, 2, 3]),
+        )),
+        Consulta("tablero", "escuela_mensual", select(AsistenciaEscuelaMes).where(
+            AsistenciaEscuelaMes.idEscuela == 1, AsistenciaEscuelaMes.mes >= date(2025, 3, 1),
+        )),
+        Consulta("tablero", "escuela_por_curso", select(AsistenciaCursoDia).where(
+            AsistenciaCursoDia.idEscuela == 1, AsistenciaCursoDia.fecha == date(2025, 3, 10),
+        )),
+        Consulta("tablero", "alumnos_del_curso", select(AsistenciaAlumnoMes).where(
+            AsistenciaAlumnoMes.idCurso == 1, AsistenciaAlumnoMes.mes == date(2025, 3, 1),
+        )),
+        Consulta("tablero", "alumno_mensual", select(AsistenciaAlumnoMes).where(
+            AsistenciaAlumnoMes.idAlumno == 1,
+        )),
+        Consulta("sync", "alumnos_cambiados", select(Alumno.idAlumno).join(Curso, Curso.idCurso == Alumno.idCurso).where(
+            Curso.idEscuela == 1, Alumno.actualizadoEn >= datetime(2025, 3, 10),
+        )),
+        Consulta("sync", "bajas", select(SyncBaja.entidad, SyncBaja.idEntidad).where(
+            or_(SyncBaja.idEscuela == 1, SyncBaja.idEscuela.is_(None)), SyncBaja.borradoEn >= datetime(2025, 3, 10),
+        )),
+        Consulta("usuario", "lista", _stmt_pagina(select(Usuario), Usuario.idUsuario, pag), keyset),
+    ]
+
+
+_SCAN_SQLITE = re.compile(r"^SCAN (\w+)")
+
+
+def plan(conn: Connection, stmt) -> tuple[list[str], set[str]]:
+    """Plan legible y tablas recorridas enteras."""
+    sql = str(stmt.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}))
+    if conn.dialect.name == "sqlite":
+        filas = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}").all()
+        detalle = [f[-1] for f in filas]
+        # "SCAN t" y "SCAN t USING [COVERING] INDEX" recorren todo; "SEARCH" usa el índice
+        escaneos = {m.group(1) for d in detalle if (m := _SCAN_SQLITE.match(d))}
+        return detalle, escaneos
+    if conn.dialect.name == "mysql":
+        filas = conn.exec_driver_sql(f"EXPLAIN {sql}").mappings().all()
+        detalle = [f"{f['table']}: type={f['type']} key={f['key']} rows={f['rows']}" for f in filas]
+        # ALL = tabla completa, index = índice completo
+        escaneos = {f["table"] for f in filas if f["type"] in ("ALL", "index")}
+        return detalle, escaneos
+    raise RuntimeError(f"Dialecto no soportado: {conn.dialect.name}")
+
+
+def revisar(engine, verbose: bool = False) -> list[str]:
+    fallas = []
+    with engine.connect() as conn:
+        for c in consultas(engine.dialect.name):
+            detalle, escaneos = plan(conn, c.stmt)
+            malas = escaneos - c.escaneo_ok
+            estado = "FULL SCAN" if malas else "ok"
+            print(f"{estado:>9}  {c.router}.{c.nombre}" + (f"  ({', '.join(sorted(malas))})" if malas else ""))
+            if malas or verbose:
+                for d in detalle:
+                    print(f"             {d}")
+            if malas:
+                fallas.append(f"{c.router}.{c.nombre}")
+    return fallas
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="EXPLAIN de las consultas calientes")
+    parser.add_argument("--db", help="URL de la DB (default: SQLite temporal con las migraciones aplicadas)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="mostrar el plan de todas las consultas")
+    args = parser.parse_args()
+
+    url = args.db or "sqlite:///" + os.path.join(tempfile.mkdtemp(), "planes.db")
+    engine = create_engine(url)
+    if not args.db:
+        migrar(engine)
+
+    fallas = revisar(engine, args.verbose)
+    if fallas:
+        print(f"\n{len(fallas)} consulta(s) recorren tablas completas: {', '.join(fallas)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import itertools
+import threading
+import time
+from contextvars import ContextVar
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql.dml import UpdateBase
+from sqlmodel import Session
+
+from app.core.config import REPLICA_RETRY_SECONDS, REPLICA_STICKY_SECONDS
+
+# True mientras se atiende una request que debe leer de la primaria
+solo_primaria: ContextVar[bool] = ContextVar("solo_primaria", default=False)
+
+COOKIE_PRIMARIA = "edu_rw"
+
+
+class ReplicaSet:
+    """Réplicas de lectura con round-robin y descarte temporal de las caídas."""
+
+    def __init__(self, engines: list[Engine]):
+        self.engines = engines
+        self._caidas: dict[Engine, float] = {}  # engine -> hasta cuándo no usarla
+        self._turno = itertools.count()
+        self._lock = threading.Lock()
+        for e in engines:
+            event.listen(e, "handle_error", self._al_fallar)
+
+    def _al_fallar(self, ctx) -> None:
+        # sin conexión (no pudo conectar) o conexión cortada: réplica fuera un rato
+        if ctx.is_disconnect or ctx.connection is None:
+            with self._lock:
+                self._caidas[ctx.engine] = time.monotonic() + REPLICA_RETRY_SECONDS
+
+    def elegir(self) -> Engine | None:
+        if not self.engines:
+            return None
+        ahora = time.monotonic()
+        sanas = [e for e in self.engines if self._caidas.get(e, 0) <= ahora]
+        if not sanas:
+            return None
+        return sanas[next(self._turno) % len(sanas)]
+
+    def estado(self) -> list[dict]:
+        ahora = time.monotonic()
+        return [
+            {"url": e.url.render_as_string(hide_password=True), "sana": self._caidas.get(e, 0) <= ahora}
+            for e in self.engines
+        ]
+
+
+class RoutingSession(Session):
+    """Session que manda las lecturas a una réplica y todo lo demás a la primaria.
+
+    Va a la primaria si: hay escrituras (flush o INSERT/UPDATE/DELETE), la
+    sesión ya escribió antes (read-your-writes dentro de la request), la request
+    lo pide (`solo_primaria`) o no hay réplicas sanas.
+    """
+
+    primaria: Engine
+    replicas: ReplicaSet
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info["escribio"] = True
+
+        if self.info.get("escribio") or solo_primaria.get():
+            return self.primaria
+        return self.replicas.elegir() or self.primaria
+
+
+async def middleware_replicas(request: Request, call_next):
+    # Métodos que escriben y clientes que escribieron hace poco leen de la primaria
+    escritura = request.method not in ("GET", "HEAD", "OPTIONS")
+    token = solo_primaria.set(escritura or request.cookies.get(COOKIE_PRIMARIA) == "1")
+    try:
+        response = await call_next(request)
+    finally:
+        solo_primaria.reset(token)
+
+    if escritura and response.status_code < 400:
+        response.set_cookie(
+            COOKIE_PRIMARIA, "1", max_age=REPLICA_STICKY_SECONDS, httponly=True, samesite="lax"
+        )
+    return response
@@ -0,0 +1,51 @@
+from sqlalchemy import Table
+from sqlmodel import Session
+
+
+def upsert(
+    session: Session,
+    table: Table,
+    rows: list[dict],
+    claves: list[str],
+    actualizar: list[str],
+    incrementar: list[str] = (),
+) -> None:
+    """INSERT multi-fila que actualiza `actualizar` si ya existe la fila con `claves`.
+
+    Las columnas de `incrementar` se suman al valor existente en lugar de
+    reemplazarlo (contadores).
+
+    Se arma una sola sentencia para todas las filas, con la sintaxis propia de
+    cada motor (ON DUPLICATE KEY UPDATE en MySQL, ON CONFLICT en SQLite/Postgres).
+    """
+    if not rows:
+        return
+
+    dialect = session.get_bind().dialect.name
+
+    if dialect in ("mysql", "mariadb"):
+        from sqlalchemy.dialects.mysql import insert
+
+        stmt = insert(table).values(rows)
+        stmt = stmt.on_duplicate_key_update({
+            **{c: stmt.inserted[c] for c in actualizar},
+            **{c: table.c[c] + stmt.inserted[c] for c in incrementar},
+        })
+    elif dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert
+
+        stmt = insert(table).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=claves,
+            set_={
+                **{c: stmt.excluded[c] for c in actualizar},
+                **{c: table.c[c] + stmt.excluded[c] for c in incrementar},
+            },
+        )
+    else:
+        raise NotImplementedError(f"upsert no soportado para {dialect}")
+
+    session.execute(stmt)
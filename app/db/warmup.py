@@ -0,0 +1,69 @@
+"""Precalentamiento del worker al iniciar (lo llama el lifespan de la app).
+
+- Llena el pool con algunas conexiones, así los primeros requests no pagan el connect.
+- Ejecuta una vez las consultas más usadas: SQLAlchemy guarda el SQL compilado en
+  el cache del engine y los requests reales lo reutilizan.
+"""
+import asyncio
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import PAGE_SIZE_DEFAULT
+from app.core.pagination import Paginacion, _stmt_pagina
+from app.models.alumno import Alumno
+from app.models.alumno_responsable import AlumnoResponsable
+from app.models.curso import Curso
+from app.models.escuela import Escuela
+from app.models.rol import Rol
+from app.models.usuario import Usuario
+from app.services.alumno_service import COLUMNAS_PUBLICAS as COLUMNAS_ALUMNO
+from app.services.auth_service import _stmt_roles
+from app.services.curso_service import COLUMNAS_PUBLICAS as COLUMNAS_CURSO
+
+
+def _consultas_calientes() -> list:
+    # mismas formas que arman los routers (los valores no importan: no entran en la clave del cache)
+    pag = Paginacion(cursor=None, limit=PAGE_SIZE_DEFAULT)
+    return [
+        select(Usuario).where(Usuario.dni == ""),  # login
+        _stmt_roles(0),  # roles del login
+        # listados de alumnos y cursos: SELECT de columnas, como paginar_filas_async
+        _stmt_pagina(select(*COLUMNAS_ALUMNO).where(Alumno.idCurso == 0), Alumno.idAlumno, pag),
+        _stmt_pagina(
+            select(*COLUMNAS_CURSO).where(Curso.idEscuela == 0, Curso.cicloLectivo == 0), Curso.idCurso, pag,
+        ),
+        _stmt_pagina(select(Escuela), Escuela.idEscuela, pag),
+        select(AlumnoResponsable).where(AlumnoResponsable.idAlumno == 0),
+        select(Rol).where(Rol.idUsuario == 0, Rol.idEscuela == 0, Rol.descripcion == ""),
+    ]
+
+
+def llenar_pool(engine: Engine, n: int) -> None:
+    conexiones = []
+    try:
+        for _ in range(n):
+            conexiones.append(engine.connect())
+    finally:
+        for c in conexiones:
+            c.close()  # vuelven al pool abiertas
+
+
+async def llenar_pool_async(engine: AsyncEngine, n: int) -> None:
+    conexiones = await asyncio.gather(*(engine.connect().start() for _ in range(n)))
+    for c in conexiones:
+        await c.close()
+
+
+def precalentar(engine: Engine) -> None:
+    with Session(engine) as session:
+        for stmt in _consultas_calientes():
+            session.exec(stmt).all()
+
+
+async def precalentar_async(engine: AsyncEngine) -> None:
+    async with AsyncSession(engine) as session:
+        for stmt in _consultas_calientes():
+            (await session.exec(stmt)).all()
@@ -1,11 +1,90 @@
-from typing import Annotated
-from fastapi import Depends
+from typing import Annotated, Optional
+from fastapi import Depends, HTTPException, Query
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlmodel import Session
-from app.db.database import engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.core.config import PAGE_SIZE_DEFAULT, PAGE_SIZE_MAX
+from app.core.pagination import Paginacion
+from app.core.security import leer_token
+from app.db.database import DBSession, get_async_session
+from app.schemas.auth import Claims
+from app.services.auth_service import token_revocado
+
+_bearer = HTTPBearer(auto_error=False)
 
 def get_session():
-    with Session(engine) as session: 
+    # lecturas a réplica (si hay), escrituras a la primaria
+    with DBSession() as session:
         yield session
 
 
+def get_paginacion(
+    cursor: Optional[str] = Query(default=None, description="next_cursor de la página anterior"),
+    limit: int = Query(default=PAGE_SIZE_DEFAULT, ge=1, le=PAGE_SIZE_MAX),
+) -> Paginacion:
+    return Paginacion(cursor=cursor, limit=limit)
+
+
+def _claims_de(credenciales: HTTPAuthorizationCredentials) -> Claims:
+    # Sólo se valida la firma del token: no hay consultas a la DB
+    claims = leer_token(credenciales.credentials)
+    if claims is None or token_revocado(claims):
+        raise HTTPException(
+            status_code=401,
+            detail="Token inválido o vencido",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return Claims(
+        idUsuario=claims["sub"],
+        idRol=claims["rol"],
+        descripcion=claims["desc"],
+        idEscuela=claims["esc"],
+    )
+
+
+async def get_claims(
+    credenciales: Optional[HTTPAuthorizationCredentials] = Depends(_bearer),
+) -> Claims:
+    if credenciales is None:
+        raise HTTPException(
+            status_code=401,
+            detail="Token inválido o vencido",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return _claims_de(credenciales)
+
+
+async def get_claims_opcional(
+    credenciales: Optional[HTTPAuthorizationCredentials] = Depends(_bearer),
+) -> Optional[Claims]:
+    # sin token: None (rutas abiertas que dan más permisos con token); token inválido: 401
+    return _claims_de(credenciales) if credenciales else None
+
+
 SessionDep = Annotated[Session, Depends(get_session)]
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_session)]
+PaginacionDep = Annotated[Paginacion, Depends(get_paginacion)]
+ClaimsDep = Annotated[Claims, Depends(get_claims)]
+ClaimsOpcionalDep = Annotated[Optional[Claims], Depends(get_claims_opcional)]
+
+
+# ----------------------------
+# Autorización por rol (sólo claims del token, sin consultas)
+# ----------------------------
+def _prohibido(detalle: str) -> HTTPException:
+    return HTTPException(status_code=403, detail=detalle)
+
+
+async def get_admin(claims: ClaimsDep) -> Claims:
+    if claims.descripcion != "Admin":
+        raise _prohibido("Requiere rol Admin")
+    return claims
+
+
+async def get_director(claims: ClaimsDep, escuela_id: int) -> Claims:
+    # `escuela_id` del path o, si la ruta no lo tiene, del query string
+    if claims.descripcion == "Admin":
+        return claims
+    if claims.descripcion != "Director" or claims.idEscuela != escuela_id:
+        raise _prohibido("Requiere rol Director de esta escuela")
+    return claims
@@ -0,0 +1,282 @@
+"""Generador de datos sintéticos para pruebas de carga.
+
+    python -m app.generar_datos --alumnos 5000000 --procesos 8
+    python -m app.generar_datos --db sqlite:///carga.db --alumnos 200000
+
+Escribe escuelas, cursos de varios ciclos lectivos, alumnos agrupados en
+familias (hermanos que comparten responsables), usuarios y roles. Inserta con
+INSERT multi-fila por lotes (Core, sin ORM) y con ids calculados de antemano:
+cada proceso genera su propio subconjunto de escuelas sin coordinarse con los
+demás. Con la misma semilla genera siempre los mismos datos.
+"""
+import argparse
+import math
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+from sqlalchemy import event, func, insert, select
+from sqlmodel import create_engine
+
+from app.core.config import DATABASE_URL
+from app.core.security import hash_password
+from app.db.migrations import migrar
+from app.models.alumno import Alumno
+from app.models.alumno_responsable import AlumnoResponsable
+from app.models.curso import Curso
+from app.models.escuela import Escuela, texto_busqueda
+from app.models.responsable import Responsable
+from app.models.rol import Rol
+from app.models.usuario import Usuario
+
+NOMBRES = [
+    "Juan", "María", "Lucía", "Mateo", "Sofía", "Benjamín", "Valentina", "Tomás", "Martina", "Joaquín",
+    "Emma", "Santino", "Catalina", "Thiago", "Olivia", "Bautista", "Mía", "Felipe", "Isabella", "Lautaro",
+]
+APELLIDOS = [
+    "González", "Rodríguez", "Gómez", "Fernández", "López", "Díaz", "Martínez", "Pérez", "Romero", "Sosa",
+    "Álvarez", "Torres", "Ruiz", "Ramírez", "Flores", "Acosta", "Benítez", "Medina", "Herrera", "Aguirre",
+]
+LOCALIDADES = [
+    "La Plata", "Quilmes", "Lanús", "Morón", "Tandil", "Bahía Blanca", "Mar del Plata", "Luján",
+    "Pergamino", "Junín", "Olavarría", "Azul", "Zárate", "Campana", "Chivilcoy", "Necochea",
+]
+CALLES = ["San Martín", "Belgrano", "Rivadavia", "Mitre", "Sarmiento", "Moreno", "Alsina", "Colón"]
+
+# tamaño de las familias (hermanos en la misma escuela) y sus pesos
+HERMANOS = ([1, 2, 3, 4], [60, 28, 9, 3])
+
+# DNIs por rango de edad: alumnos 40M-60M, adultos 18M-36M, usuarios 36M-40M
+_RANGOS_DNI = {"alumno": (40_000_000, 20_000_000), "responsable": (18_000_000, 18_000_000),
+               "usuario": (36_000_000, 4_000_000)}
+
+
+def _dni(tipo: str, id_: int) -> str:
+    # biyección id -> dni dentro del rango (7919 es primo y coprimo con el tamaño): sin repetidos
+    base, tamanio = _RANGOS_DNI[tipo]
+    return str(base + (id_ * 7919) % tamanio)
+
+
+@dataclass
+class Config:
+    ciclos: int = 3  # ciclos lectivos hasta ciclo_final inclusive
+    ciclo_final: int = date.today().year
+    cursos: int = 12  # por escuela y ciclo (grados 1..6, divisiones A/B)
+    alumnos_por_curso: int = 30
+    docentes: int = 10  # por escuela, además del director
+    lote: int = 10_000
+    semilla: int = 42
+    contrasena: str = ""
+
+    @property
+    def cursos_por_escuela(self) -> int:
+        return self.ciclos * self.cursos
+
+    @property
+    def alumnos_por_escuela(self) -> int:
+        return self.cursos_por_escuela * self.alumnos_por_curso
+
+    @property
+    def responsables_por_escuela(self) -> int:
+        # cota: a lo sumo 2 por alumno (familias de un solo hijo)
+        return 2 * self.alumnos_por_escuela
+
+    @property
+    def usuarios_por_escuela(self) -> int:
+        return self.docentes + 1
+
+
+# orden de inserción (claves foráneas)
+TABLAS = [Curso, Usuario, Rol, Alumno, Responsable, AlumnoResponsable]
+
+
+def _acelerar(engine) -> None:
+    @event.listens_for(engine, "connect")
+    def _pragmas(dbapi_conn, _):
+        cur = dbapi_conn.cursor()
+        if engine.dialect.name == "sqlite":
+            cur.execute("PRAGMA journal_mode=WAL")
+            cur.execute("PRAGMA synchronous=OFF")
+            cur.execute("PRAGMA busy_timeout=60000")  # varios procesos escriben por turnos
+        elif engine.dialect.name == "mysql":
+            # los ids y FKs los arma el generador: sin chequeos por fila
+            cur.execute("SET foreign_key_checks=0, unique_checks=0")
+        cur.close()
+
+
+def _fila_escuela(i: int, bases: dict, cfg: Config) -> dict:
+    rnd = random.Random(f"{cfg.semilla}:escuela:{i}")
+    fila = dict(
+        idEscuela=bases["escuela"] + i,
+        cue=f"06{bases['escuela'] + i:07d}",
+        nombre=f"Escuela {rnd.choice(['Primaria', 'Técnica', 'Secundaria'])} N° {i + 1} "
+               f"{rnd.choice(NOMBRES)} {rnd.choice(APELLIDOS)}",
+        numero=str(i + 1),
+        nivel_educativo=rnd.choice(["Primario", "Secundario"]),
+        turno=rnd.choice(["Mañana", "Tarde", "Doble"]),
+        matricula=cfg.alumnos_por_escuela,
+        direccion=f"{rnd.choice(CALLES)} {rnd.randrange(100, 4000)}",
+        codigo_postal=str(rnd.randrange(1000, 8000)),
+        provincia="Buenos Aires",
+        localidad=rnd.choice(LOCALIDADES),
+    )
+    fila["busqueda"] = texto_busqueda(SimpleNamespace(**fila))
+    return fila
+
+
+def _generar_escuela(i: int, cfg: Config, bases: dict, filas: dict[str, list]) -> None:
+    rnd = random.Random(f"{cfg.semilla}:{i}")
+    id_escuela = bases["escuela"] + i
+
+    # cursos: un juego de grados/divisiones por ciclo lectivo
+    slots = []
+    primer_curso = bases["curso"] + i * cfg.cursos_por_escuela
+    for c in range(cfg.cursos_por_escuela):
+        ciclo = cfg.ciclo_final - cfg.ciclos + 1 + c // cfg.cursos
+        grado, division = (c % cfg.cursos) // 2 + 1, "AB"[c % 2]
+        filas["curso"].append(dict(
+            idCurso=primer_curso + c, idEscuela=id_escuela, nombre=f"{grado}° {division}",
+            grado=str(grado), division=division, turno=rnd.choice(["Mañana", "Tarde"]), cicloLectivo=ciclo,
+        ))
+        slots += [(primer_curso + c, ciclo, grado)] * cfg.alumnos_por_curso
+
+    # usuarios: un director y los docentes, con algunos pendientes de aprobación
+    primer_usuario = bases["usuario"] + i * cfg.usuarios_por_escuela
+    for u in range(cfg.usuarios_por_escuela):
+        id_usuario = primer_usuario + u
+        filas["usuario"].append(dict(
+            idUsuario=id_usuario, dni=_dni("usuario", id_usuario), contrasena=cfg.contrasena,
+            nombre=rnd.choice(NOMBRES), apellido=rnd.choice(APELLIDOS),
+            mailABC=f"docente{id_usuario}@abc.gob.ar", celular=f"11{rnd.randrange(10**8):08d}",
+        ))
+        filas["rol"].append(dict(
+            idRol=bases["rol"] + i * cfg.usuarios_por_escuela + u, idUsuario=id_usuario, idEscuela=id_escuela,
+            descripcion="Director" if u == 0 else "Docente",
+            estado="Aprobado" if u == 0 or rnd.random() < 0.8 else "Pendiente",
+        ))
+
+    # alumnos por familias: los hermanos comparten apellido y responsables
+    rnd.shuffle(slots)
+    id_alumno = bases["alumno"] + i * cfg.alumnos_por_escuela
+    id_resp = bases["responsable"] + i * cfg.responsables_por_escuela
+    pos = 0
+    while pos < len(slots):
+        hermanos = slots[pos:pos + rnd.choices(*HERMANOS)[0]]
+        pos += len(hermanos)
+        apellido = rnd.choice(APELLIDOS)
+        direccion = f"{rnd.choice(CALLES)} {rnd.randrange(100, 4000)}"
+
+        responsables = []
+        for parentesco in (["Madre", "Padre"] if rnd.random() < 0.7 else [rnd.choice(["Madre", "Padre", "Tutor"])]):
+            filas["responsable"].append(dict(
+                idResponsable=id_resp, nombre=rnd.choice(NOMBRES),
+                apellido=apellido if parentesco != "Tutor" else rnd.choice(APELLIDOS),
+                dni=_dni("responsable", id_resp), telefono=f"11{rnd.randrange(10**8):08d}",
+                correo_electronico=f"resp{id_resp}@mail.com",
+            ))
+            responsables.append((id_resp, parentesco))
+            id_resp += 1
+
+        for id_curso, ciclo, grado in hermanos:
+            # primaria: 1er grado a los 6 años
+            nacimiento = date(ciclo - 5 - grado, 1, 1) + timedelta(days=rnd.randrange(365))
+            filas["alumno"].append({
+                "idAlumno": id_alumno, "idCurso": id_curso, "nombre": rnd.choice(NOMBRES), "apellido": apellido,
+                "dni": _dni("alumno", id_alumno), "direccion": direccion,
+                "fecha_nacimiento": nacimiento, "fecha_ingreso": date(ciclo - grado + 1, 3, 1),
+            })
+            filas["alumno_responsable"] += [
+                dict(idAlumno=id_alumno, idResponsable=r, parentesco=p) for r, p in responsables
+            ]
+            id_alumno += 1
+
+
+def _volcar(conn, filas: dict[str, list], lote: int, totales: Counter) -> None:
+    for modelo in TABLAS:
+        tabla = modelo.__table__
+        pendientes = filas[tabla.name]
+        for j in range(0, len(pendientes), lote):
+            conn.execute(insert(tabla), pendientes[j:j + lote])  # executemany -> INSERT multi-fila
+        totales[tabla.name] += len(pendientes)
+        pendientes.clear()
+    conn.commit()
+
+
+def _sembrar(url: str, cfg: Config, bases: dict, indices: range) -> Counter:
+    engine = create_engine(url)
+    _acelerar(engine)
+    filas = {m.__table__.name: [] for m in TABLAS}
+    totales = Counter()
+    with engine.connect() as conn:
+        for i in indices:
+            _generar_escuela(i, cfg, bases, filas)
+            if len(filas["alumno"]) >= cfg.lote:
+                _volcar(conn, filas, cfg.lote, totales)
+        _volcar(conn, filas, cfg.lote, totales)
+    engine.dispose()
+    return totales
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Genera datos sintéticos para pruebas de carga")
+    parser.add_argument("--db", default=DATABASE_URL, help="URL de la DB (default: DATABASE_URL)")
+    parser.add_argument("--alumnos", type=int, default=100_000, help="total aproximado de alumnos")
+    parser.add_argument("--ciclos", type=int, default=Config.ciclos)
+    parser.add_argument("--cursos", type=int, default=Config.cursos, help="cursos por escuela y ciclo")
+    parser.add_argument("--alumnos-por-curso", type=int, default=Config.alumnos_por_curso)
+    parser.add_argument("--docentes", type=int, default=Config.docentes, help="docentes por escuela")
+    parser.add_argument("--procesos", type=int, default=1)
+    parser.add_argument("--lote", type=int, default=Config.lote, help="filas por INSERT")
+    parser.add_argument("--semilla", type=int, default=Config.semilla)
+    parser.add_argument("--password", default="carga1234", help="contraseña de todos los usuarios generados")
+    args = parser.parse_args()
+
+    cfg = Config(
+        ciclos=args.ciclos, cursos=args.cursos, alumnos_por_curso=args.alumnos_por_curso,
+        docentes=args.docentes, lote=args.lote, semilla=args.semilla,
+        contrasena=hash_password(args.password),  # un solo hash: PBKDF2 es caro a propósito
+    )
+    n_escuelas = math.ceil(args.alumnos / cfg.alumnos_por_escuela)
+
+    engine = create_engine(args.db)
+    _acelerar(engine)
+    migrar(engine)  # crea o actualiza el esquema y deja schema_version al día
+
+    # los ids nuevos arrancan después de lo que ya haya en la DB
+    modelos = {"escuela": Escuela.idEscuela, "curso": Curso.idCurso, "usuario": Usuario.idUsuario,
+               "rol": Rol.idRol, "alumno": Alumno.idAlumno, "responsable": Responsable.idResponsable}
+    inicio = time.perf_counter()
+    with engine.connect() as conn:
+        bases = {t: (conn.scalar(select(func.max(pk))) or 0) + 1 for t, pk in modelos.items()}
+        escuelas = [_fila_escuela(i, bases, cfg) for i in range(n_escuelas)]
+        for j in range(0, len(escuelas), cfg.lote):
+            conn.execute(insert(Escuela.__table__), escuelas[j:j + cfg.lote])
+        conn.commit()
+    engine.dispose()
+
+    # cada proceso toma escuelas salteadas (i, i+n, i+2n...): cargas parejas
+    partes = [range(p, n_escuelas, args.procesos) for p in range(args.procesos)]
+    totales = Counter({"escuela": n_escuelas})
+    if args.procesos == 1:
+        totales += _sembrar(args.db, cfg, bases, partes[0])
+    else:
+        if args.db.startswith("sqlite"):
+            print("aviso: SQLite admite un solo escritor, los procesos se turnan para escribir")
+        with ProcessPoolExecutor(args.procesos) as pool:
+            for parcial in pool.map(_sembrar, [args.db] * args.procesos, [cfg] * args.procesos,
+                                    [bases] * args.procesos, partes):
+                totales += parcial
+
+    duracion = time.perf_counter() - inicio
+    filas = sum(totales.values())
+    for tabla, n in totales.items():
+        print(f"{tabla:>20}: {n:>10,}")
+    print(f"{filas:,} filas en {duracion:.1f}s ({filas / duracion:,.0f} filas/s)")
+
+
+if __name__ == "__main__":
+    main()
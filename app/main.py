@@ -1,14 +1,32 @@
-from fastapi import FastAPI
+import asyncio
+import json
+import logging
+import time
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
-from sqlmodel import SQLModel
+from fastapi.middleware.gzip import GZipMiddleware
 
-from app.core.config import DATABASE_URL
-from app.db.database import engine
+from app.core.config import (
+    DB_AUTO_MIGRATE, DB_POOL_PREFILL, GZIP_MIN_BYTES, GZIP_NIVEL, PROFILE_ROUTE, REVOCACIONES_REFRESH_SECONDS,
+)
+from app.core.metrics import MetricsMiddleware, render_prometheus
+from app.db.database import async_engine, async_replica_set, engine, replica_set
+from app.db.migrations import verificar_esquema
+from app.db.instrumentation import RequestStats, SamplingProfiler, loguear_lentas, request_stats
+from app.db.pool import pool_snapshot
+from app.db.routing import middleware_replicas
+from app.db.warmup import llenar_pool, llenar_pool_async, precalentar, precalentar_async
+from app.services.auth_service import cargar_revocaciones, refrescar_revocaciones_periodicamente
 
 # Routers
 from app.routers import auth, usuario, escuela, curso, alumno, responsable, admin, director
+from app.routers import asistencia, asistencia_resumen, sync
 
-# Importar modelos para que SQLModel cree tablas
+# Importar modelos (mappers registrados antes de atender requests)
 from app.models.escuela import Escuela
 from app.models.usuario import Usuario
 from app.models.rol import Rol
@@ -17,18 +35,77 @@ from app.models.alumno import Alumno
 from app.routers import rol
 from app.models.responsable import Responsable
 from app.models.alumno_responsable import AlumnoResponsable
+from app.models.asistencia import Asistencia
+from app.models.asistencia_resumen import AsistenciaCursoDia
 
 
-def create_db_and_tables() -> None:
-    SQLModel.metadata.create_all(engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    inicio = time.perf_counter()
+    # sólo lee schema_version (las migraciones se corren aparte, salvo DB_AUTO_MIGRATE)
+    version = await run_in_threadpool(verificar_esquema, engine, DB_AUTO_MIGRATE)
+    await run_in_threadpool(llenar_pool, engine, DB_POOL_PREFILL)
+    await llenar_pool_async(async_engine, DB_POOL_PREFILL)
+    await run_in_threadpool(precalentar, engine)
+    await precalentar_async(async_engine)
+    # tokens revocados por otros workers: ahora y después cada REVOCACIONES_REFRESH_SECONDS
+    await run_in_threadpool(cargar_revocaciones, engine)
+    revocaciones = asyncio.create_task(refrescar_revocaciones_periodicamente(engine, REVOCACIONES_REFRESH_SECONDS))
+    ms = (time.perf_counter() - inicio) * 1000
+    print(f"✅ DB lista (esquema v{version}, {ms:.0f} ms). Conectado a: {engine.url.render_as_string(hide_password=True)}")
+    yield
+    revocaciones.cancel()
+    await async_engine.dispose()
+    engine.dispose()
 
 
 app = FastAPI(
     title="EduPresente API",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
-# CORS (Angular dev server)
+# Listados grandes comprimidos (las respuestas chicas no pagan el gzip)
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MIN_BYTES, compresslevel=GZIP_NIVEL)
+
+# Read-your-writes: quien acaba de escribir lee de la primaria unos segundos
+app.middleware("http")(middleware_replicas)
+
+# Queries por request: header Server-Timing + log de queries lentas (+ profiler opcional)
+@app.middleware("http")
+async def medir_sql(request: Request, call_next):
+    stats = RequestStats()
+    token = request_stats.set(stats)
+    inicio = time.perf_counter()
+    perfilar = bool(PROFILE_ROUTE) and request.url.path.startswith(PROFILE_ROUTE)
+    try:
+        if perfilar:
+            with SamplingProfiler() as profiler:
+                response = await call_next(request)
+        else:
+            response = await call_next(request)
+    finally:
+        request_stats.reset(token)
+
+    total_ms = (time.perf_counter() - inicio) * 1000
+    response.headers["Server-Timing"] = (
+        f'db;dur={stats.db_ms:.1f};desc="{stats.consultas} queries", app;dur={total_ms:.1f}'
+    )
+
+    route = request.scope.get("route")
+    ruta = getattr(route, "path", request.url.path)
+    loguear_lentas(stats, ruta, request.method)
+    if perfilar:
+        logging.getLogger("edupresente.profiler").warning(json.dumps({
+            "evento": "profile", "ruta": ruta, "ms": round(total_ms, 1), "top": profiler.reporte(),
+        }))
+    return response
+
+# Métricas por ruta (middleware ASGI puro, por fuera del resto para medir todo)
+app.add_middleware(MetricsMiddleware)
+
+# CORS (Angular dev server). Se agrega último para que sea el más externo: las
+# respuestas que arman los demás middlewares también llevan los headers CORS
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -40,16 +117,37 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-@app.on_event("startup")
-def on_startup():
-    create_db_and_tables()
-    print("✅ DB lista. Conectado a:", DATABASE_URL)
-
 # Healthcheck
 @app.get("/health")
 def health():
     return {"status": "ok"}
 
+# Estado del pool de conexiones (en uso, overflow, espera de checkout, timeouts)
+@app.get("/health/db-pool")
+def health_db_pool():
+    return {
+        "sync": pool_snapshot(engine),
+        "async": pool_snapshot(async_engine.sync_engine),
+        "replicas": [
+            {**r, **pool_snapshot(e)} for r, e in zip(replica_set.estado(), replica_set.engines)
+        ],
+        "replicas_async": async_replica_set.estado(),
+    }
+
+# Métricas en formato Prometheus
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    return PlainTextResponse(
+        render_prometheus({
+            "sync": pool_snapshot(engine),
+            "async": pool_snapshot(async_engine.sync_engine),
+            # réplicas por posición en DATABASE_REPLICA_URLS / ASYNC_DATABASE_REPLICA_URLS
+            **{f"replica_{i}": pool_snapshot(e) for i, e in enumerate(replica_set.engines)},
+            **{f"replica_async_{i}": pool_snapshot(e) for i, e in enumerate(async_replica_set.engines)},
+        }),
+        media_type="text/plain; version=0.0.4",
+    )
+
 # Routers 
 app.include_router(auth.router)        
 app.include_router(usuario.router)     
@@ -59,4 +157,7 @@ app.include_router(alumno.router)
 app.include_router(responsable.router) 
 app.include_router(rol.router)
 app.include_router(admin.router)
-app.include_router(director.router)
\ No newline at end of file
+app.include_router(director.router)
+app.include_router(asistencia.router)
+app.include_router(asistencia_resumen.router)
+app.include_router(sync.router)
\ No newline at end of file
@@ -1,9 +1,10 @@
 from typing import Optional, TYPE_CHECKING
-from datetime import date
+from datetime import date, datetime
 
 from sqlmodel import SQLModel, Field, Relationship
 from sqlalchemy import Column, Date
 
+from app.core.tiempo import ahora
 from app.models.alumno_responsable import AlumnoResponsable
 
 if TYPE_CHECKING:
@@ -15,11 +16,11 @@ class Alumno(SQLModel, table=True):
 
     idAlumno: Optional[int] = Field(default=None, primary_key=True)
 
-    idCurso: int = Field(index=True, foreign_key="curso.idCurso")
+    idCurso: int = Field(index=True, foreign_key="curso.idCurso", ondelete="CASCADE")
 
     nombre: str
     apellido: str
-    dni: str
+    dni: str = Field(index=True)
 
     # ✅ Mapeo a columnas existentes en DB
     fechaNac: date = Field(sa_column=Column("fecha_nacimiento", Date, nullable=False))
@@ -27,6 +28,11 @@ class Alumno(SQLModel, table=True):
 
     direccion: Optional[str] = None
 
+    # sync offline: lo completa cada INSERT/UPDATE, también los masivos de Core
+    actualizadoEn: datetime = Field(
+        default_factory=ahora, index=True, sa_column_kwargs={"default": ahora, "onupdate": ahora}
+    )
+
     # ✅ Relación many-to-many con Responsable, guardando parentesco en la tabla puente
     responsables: list["Responsable"] = Relationship(
         back_populates="alumnos",
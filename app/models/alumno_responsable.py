@@ -1,13 +1,21 @@
+from datetime import datetime
 from typing import Optional
 from sqlmodel import SQLModel, Field
 
+from app.core.tiempo import ahora
+
 
 class AlumnoResponsable(SQLModel, table=True):
     __tablename__ = "alumno_responsable"
 
     # tabla puente
-    idAlumno: int = Field(foreign_key="alumno.idAlumno", primary_key=True)
-    idResponsable: int = Field(foreign_key="responsable.idResponsable", primary_key=True)
+    idAlumno: int = Field(foreign_key="alumno.idAlumno", ondelete="CASCADE", primary_key=True)
+    idResponsable: int = Field(foreign_key="responsable.idResponsable", ondelete="CASCADE", primary_key=True)
 
     # atributo extra de la relación
     parentesco: str = Field(index=True, max_length=50)
+
+    # sync offline: lo completa cada INSERT/UPDATE, también los masivos de Core
+    actualizadoEn: datetime = Field(
+        default_factory=ahora, index=True, sa_column_kwargs={"default": ahora, "onupdate": ahora}
+    )
@@ -0,0 +1,47 @@
+from typing import Optional
+from datetime import date, datetime
+
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
+
+
+class Asistencia(SQLModel, table=True):
+    __tablename__ = "asistencia"
+    __table_args__ = (
+        # lectura de la planilla de un curso para una fecha
+        Index("ix_asistencia_curso_fecha", "idCurso", "fecha"),
+    )
+
+    # una fila por alumno y día (clave del upsert)
+    idAlumno: int = Field(foreign_key="alumno.idAlumno", ondelete="CASCADE", primary_key=True)
+    fecha: date = Field(primary_key=True)
+
+    # curso en el que se tomó la asistencia (el alumno puede cambiar de curso)
+    idCurso: int = Field(foreign_key="curso.idCurso", ondelete="CASCADE")
+
+    estado: str = Field(max_length=20)  # Presente | Ausente | Tarde | Justificado
+    observacion: Optional[str] = Field(default=None, max_length=255)
+
+    actualizadoEn: datetime
+
+
+# Asistencia de ciclos lectivos terminados (ver services/asistencia_archivo.py):
+# mismas columnas que `asistencia` más el ciclo, para que la tabla viva y sus
+# índices sólo tengan el año en curso. No se usan particiones nativas porque
+# MySQL no admite claves foráneas en tablas particionadas.
+class AsistenciaArchivo(SQLModel, table=True):
+    __tablename__ = "asistencia_archivo"
+    __table_args__ = (
+        Index("ix_asistencia_archivo_curso_fecha", "idCurso", "fecha"),
+        Index("ix_asistencia_archivo_ciclo", "cicloLectivo"),
+    )
+
+    idAlumno: int = Field(foreign_key="alumno.idAlumno", ondelete="CASCADE", primary_key=True)
+    fecha: date = Field(primary_key=True)
+    idCurso: int = Field(foreign_key="curso.idCurso", ondelete="CASCADE")
+
+    estado: str = Field(max_length=20)
+    observacion: Optional[str] = Field(default=None, max_length=255)
+
+    actualizadoEn: datetime
+    cicloLectivo: int
@@ -0,0 +1,64 @@
+from datetime import date
+
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
+
+
+class ContadoresAsistencia(SQLModel):
+    # registros por estado (Presente | Ausente | Tarde | Justificado)
+    presentes: int = 0
+    ausentes: int = 0
+    tardes: int = 0
+    justificados: int = 0
+
+
+# Resúmenes de asistencia: se actualizan en la misma transacción que cada planilla
+# (ver services/asistencia_resumen.py) para que los tableros no agrupen la tabla cruda.
+# Los mensuales usan como `mes` el primer día del mes.
+
+class AsistenciaAlumnoMes(ContadoresAsistencia, table=True):
+    __tablename__ = "asistencia_alumno_mes"
+    __table_args__ = (
+        Index("ix_asistencia_alumno_mes_alumno", "idAlumno", "mes"),
+    )
+
+    # PK empieza por curso: "alumnos del curso en el mes" es un range scan
+    idCurso: int = Field(foreign_key="curso.idCurso", ondelete="CASCADE", primary_key=True)
+    mes: date = Field(primary_key=True)
+    idAlumno: int = Field(foreign_key="alumno.idAlumno", ondelete="CASCADE", primary_key=True)
+
+
+class AsistenciaCursoDia(ContadoresAsistencia, table=True):
+    __tablename__ = "asistencia_curso_dia"
+    __table_args__ = (
+        Index("ix_asistencia_curso_dia_escuela", "idEscuela", "fecha"),
+    )
+
+    idCurso: int = Field(foreign_key="curso.idCurso", ondelete="CASCADE", primary_key=True)
+    fecha: date = Field(primary_key=True)
+    idEscuela: int = Field(foreign_key="escuela.idEscuela", ondelete="CASCADE")
+
+
+class AsistenciaCursoMes(ContadoresAsistencia, table=True):
+    __tablename__ = "asistencia_curso_mes"
+    __table_args__ = (
+        Index("ix_asistencia_curso_mes_escuela", "idEscuela", "mes"),
+    )
+
+    idCurso: int = Field(foreign_key="curso.idCurso", ondelete="CASCADE", primary_key=True)
+    mes: date = Field(primary_key=True)
+    idEscuela: int = Field(foreign_key="escuela.idEscuela", ondelete="CASCADE")
+
+
+class AsistenciaEscuelaDia(ContadoresAsistencia, table=True):
+    __tablename__ = "asistencia_escuela_dia"
+
+    idEscuela: int = Field(foreign_key="escuela.idEscuela", ondelete="CASCADE", primary_key=True)
+    fecha: date = Field(primary_key=True)
+
+
+class AsistenciaEscuelaMes(ContadoresAsistencia, table=True):
+    __tablename__ = "asistencia_escuela_mes"
+
+    idEscuela: int = Field(foreign_key="escuela.idEscuela", ondelete="CASCADE", primary_key=True)
+    mes: date = Field(primary_key=True)
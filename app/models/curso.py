@@ -1,10 +1,14 @@
 # app/models/curso.py
+from datetime import datetime
 from typing import Optional
 from sqlmodel import SQLModel, Field
+from sqlalchemy import false
+
+from app.core.tiempo import ahora
 
 class Curso(SQLModel, table=True):
     idCurso: Optional[int] = Field(default=None, primary_key=True)
-    idEscuela: int = Field(index=True, foreign_key="escuela.idEscuela")
+    idEscuela: int = Field(index=True, foreign_key="escuela.idEscuela", ondelete="CASCADE")
 
     nombre: str
     grado: Optional[str] = None
@@ -12,3 +16,11 @@ class Curso(SQLModel, table=True):
     turno: Optional[str] = None
 
     cicloLectivo: int  # ✅ tu front lo exige
+
+    # curso de un ciclo terminado: no admite alumnos ni asistencia nuevos
+    cerrado: bool = Field(default=False, sa_column_kwargs={"server_default": false()})
+
+    # sync offline: lo completa cada INSERT/UPDATE, también los masivos de Core
+    actualizadoEn: datetime = Field(
+        default_factory=ahora, index=True, sa_column_kwargs={"default": ahora, "onupdate": ahora}
+    )
@@ -1,7 +1,9 @@
 # app/models/escuela.py
 from typing import Optional, TYPE_CHECKING
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import DDL, Text, event
 
+from app.core.texto import normalizar
 from app.models.rol import Rol
 
 if TYPE_CHECKING:
@@ -26,7 +28,34 @@ class Escuela(SQLModel, table=True):
     provincia: Optional[str] = None
     localidad: Optional[str] = None
 
+    # texto normalizado (sin acentos, minúsculas) para la búsqueda full-text
+    busqueda: Optional[str] = Field(default=None, sa_type=Text)
+
     usuarios: list["Usuario"] = Relationship(
         back_populates="escuelas",
         link_model=Rol
     )
+
+
+def texto_busqueda(escuela: "Escuela") -> str:
+    return normalizar(" ".join(
+        str(v) for v in (
+            escuela.nombre, escuela.cue, escuela.numero, escuela.localidad, escuela.provincia,
+        ) if v
+    ))
+
+
+@event.listens_for(Escuela, "before_insert")
+@event.listens_for(Escuela, "before_update")
+def _actualizar_busqueda(mapper, connection, escuela: Escuela) -> None:
+    escuela.busqueda = texto_busqueda(escuela)
+
+
+# MySQL: índice FULLTEXT con parser ngram (matchea fragmentos: "tecn" encuentra "tecnica")
+event.listen(
+    Escuela.__table__,
+    "after_create",
+    DDL(
+        "ALTER TABLE escuela ADD FULLTEXT INDEX ft_escuela_busqueda (busqueda) WITH PARSER ngram"
+    ).execute_if(dialect="mysql"),
+)
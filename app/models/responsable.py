@@ -1,6 +1,8 @@
+from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 from sqlmodel import SQLModel, Field, Relationship
 
+from app.core.tiempo import ahora
 from app.models.alumno_responsable import AlumnoResponsable
 
 if TYPE_CHECKING:
@@ -18,6 +20,11 @@ class Responsable(SQLModel, table=True):
     telefono: Optional[str] = Field(default=None, max_length=30)
     correo_electronico: Optional[str] = Field(default=None, max_length=120)
 
+    # sync offline: lo completa cada INSERT/UPDATE, también los masivos de Core
+    actualizadoEn: datetime = Field(
+        default_factory=ahora, index=True, sa_column_kwargs={"default": ahora, "onupdate": ahora}
+    )
+
     alumnos: list["Alumno"] = Relationship(
         back_populates="responsables",
         link_model=AlumnoResponsable
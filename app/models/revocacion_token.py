@@ -0,0 +1,15 @@
+from datetime import datetime
+
+from sqlmodel import SQLModel, Field
+
+
+# Tokens revocados, compartidos entre workers: cada uno los trae periódicamente
+# a memoria (services/auth_service.py), así validar un token sigue sin ir a la DB.
+class RevocacionToken(SQLModel, table=True):
+    __tablename__ = "revocacion_token"
+
+    # sin FK: la revocación tiene que sobrevivir al borrado del usuario
+    idUsuario: int = Field(primary_key=True, sa_column_kwargs={"autoincrement": False})
+
+    # los tokens emitidos hasta este momento dejan de valer
+    desde: datetime = Field(index=True)
@@ -1,13 +1,22 @@
 from typing import Optional
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
 
 class Rol(SQLModel, table=True):
     __tablename__ = "rol"
+    __table_args__ = (
+        # login (roles de un usuario) y aprobar/rechazar (usuario + escuela + rol)
+        Index("ix_rol_usuario_escuela_desc", "idUsuario", "idEscuela", "descripcion"),
+        # solicitudes pendientes por tipo de rol (admin)
+        Index("ix_rol_desc_estado", "descripcion", "estado"),
+        # docentes / solicitudes de una escuela (director)
+        Index("ix_rol_escuela_desc_estado", "idEscuela", "descripcion", "estado"),
+    )
 
     idRol: Optional[int] = Field(default=None, primary_key=True)
 
-    idUsuario: int = Field(foreign_key="usuario.idUsuario")
-    idEscuela: int = Field(foreign_key="escuela.idEscuela")
+    idUsuario: int = Field(foreign_key="usuario.idUsuario", ondelete="CASCADE")
+    idEscuela: int = Field(foreign_key="escuela.idEscuela", ondelete="CASCADE")
 
     descripcion: str  # "Docente", "Director", "Admin"
     estado: str = "Activo"  # Activo | Pendiente | Rechazado
@@ -0,0 +1,25 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
+
+
+# Bajas para el sync offline: las filas borradas ya no están para consultarlas
+# por `actualizadoEn`, así que cada borrado deja acá su marca.
+class SyncBaja(SQLModel, table=True):
+    __tablename__ = "sync_tombstone"
+    __table_args__ = (
+        # bajas de una escuela desde el último sync
+        Index("ix_sync_tombstone_escuela_fecha", "idEscuela", "borradoEn"),
+    )
+
+    idBaja: Optional[int] = Field(default=None, primary_key=True)
+
+    entidad: str = Field(max_length=30)  # alumno | responsable | curso | alumno_responsable
+    idEntidad: int
+    idRelacionado: Optional[int] = None  # alumno_responsable: idResponsable (idEntidad es el alumno)
+
+    # escuela cuyos dispositivos tienen que enterarse; None = todas
+    idEscuela: Optional[int] = Field(default=None, foreign_key="escuela.idEscuela", ondelete="CASCADE")
+    borradoEn: datetime
@@ -0,0 +1,33 @@
+"""Recalcula los resúmenes de asistencia (backfill o reparación).
+
+    python -m app.reconstruir_resumenes                               # todo
+    python -m app.reconstruir_resumenes --desde 2025-03-01 --hasta 2025-06-30
+
+Trabaja por meses completos y en una transacción: los tableros ven los
+resúmenes viejos hasta el commit.
+"""
+import argparse
+from datetime import date
+
+from sqlmodel import Session
+
+from app.db.database import engine
+from app.db.migrations import verificar_esquema
+from app.services.asistencia_resumen import reconstruir
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Recalcula los resúmenes de asistencia")
+    parser.add_argument("--desde", type=date.fromisoformat)
+    parser.add_argument("--hasta", type=date.fromisoformat)
+    args = parser.parse_args()
+
+    verificar_esquema(engine, auto_migrar=False)
+    with Session(engine) as session:
+        filas = reconstruir(session, args.desde, args.hasta)
+    for tabla, n in filas.items():
+        print(f"{tabla:>24}: {n:>8,} filas")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,19 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends
 from sqlmodel import select
 from typing import List
 from pydantic import BaseModel
 
-from app.dependencies import SessionDep
+from app.dependencies import SessionDep, get_admin
 from app.models.usuario import Usuario
 from app.models.rol import Rol
 from app.models.escuela import Escuela
+from app.schemas.rol import ResultadoLote, SolicitudesLote
+from app.services.rol_service import lote_a_respuesta, resolver_solicitud, resolver_solicitudes
 
 router = APIRouter(
     prefix="/admin",
-    tags=["Administracion"]
+    tags=["Administracion"],
+    dependencies=[Depends(get_admin)],
 )
 
 # Esquema para respuesta combinada
@@ -42,36 +45,20 @@ def get_directores_pendientes(session: SessionDep):
 
 @router.post("/aprobar")
 def aprobar_director(session: SessionDep, id_usuario: int, id_escuela: int):
-    rol = session.exec(
-        select(Rol).where(
-            Rol.idUsuario == id_usuario, 
-            Rol.idEscuela == id_escuela,
-            Rol.descripcion == "Director"
-        )
-    ).first()
-
-    if not rol:
-        raise HTTPException(status_code=404, detail="Solicitud no encontrada")
-
-    rol.estado = "Aprobado"
-    session.add(rol)
-    session.commit()
+    resolver_solicitud(session, id_usuario, id_escuela, "Director", aprobar=True)
     return {"message": "Aprobado"}
 
 @router.post("/rechazar")
 def rechazar_director(session: SessionDep, id_usuario: int, id_escuela: int):
-    rol = session.exec(
-        select(Rol).where(
-            Rol.idUsuario == id_usuario, 
-            Rol.idEscuela == id_escuela,
-            Rol.descripcion == "Director"
-        )
-    ).first()
+    # Borra el rol (como si nunca solicitó), sólo si sigue pendiente: igual que el lote
+    resolver_solicitud(session, id_usuario, id_escuela, "Director", aprobar=False)
+    return {"message": "Rechazado y eliminado"}
 
-    if not rol:
-        raise HTTPException(status_code=404, detail="Solicitud no encontrada")
+# Aprobar / rechazar en lote (por idRol): sólo pasan las que siguen pendientes
+@router.post("/solicitudes/aprobar", response_model=ResultadoLote)
+def aprobar_solicitudes(session: SessionDep, lote: SolicitudesLote):
+    return lote_a_respuesta(resolver_solicitudes(session, lote.ids, aprobar=True))
 
-    # Opción A: Borrar el rol (como si nunca solicitó)
-    session.delete(rol)
-    session.commit()
-    return {"message": "Rechazado y eliminado"}
\ No newline at end of file
+@router.post("/solicitudes/rechazar", response_model=ResultadoLote)
+def rechazar_solicitudes(session: SessionDep, lote: SolicitudesLote):
+    return lote_a_respuesta(resolver_solicitudes(session, lote.ids, aprobar=False))
@@ -1,16 +1,16 @@
 from fastapi import APIRouter, HTTPException, Query
 from sqlmodel import select
 
-from app.dependencies import SessionDep
+from app.core.config import PAGE_SIZE_MAX
+from app.core.pagination import paginar_filas_async
+from app.dependencies import AsyncSessionDep, SessionDep, PaginacionDep
 from app.models.alumno import Alumno
-from app.models.responsable import Responsable
-from app.models.alumno_responsable import AlumnoResponsable
 
 from app.schemas.alumno import AlumnoCreate, AlumnoPublic
-from app.schemas.alumno_responsables import (
-    AlumnoDetalleConResponsables,
-    ResponsableConParentesco,
-)
+from app.schemas.pagination import Page
+from app.schemas.alumno_responsables import AlumnoDetalleConResponsables
+from app.services.alumno_service import COLUMNAS_PUBLICAS, borrar_alumnos, detalles_con_responsables
+from app.services.curso_service import exigir_curso_abierto
 
 router = APIRouter(prefix="/alumnos", tags=["Alumnos"])
 
@@ -18,23 +18,42 @@ router = APIRouter(prefix="/alumnos", tags=["Alumnos"])
 # --------------------------------------------------
 # LISTAR ALUMNOS (opcional por curso)
 # --------------------------------------------------
-@router.get("/", response_model=list[AlumnoPublic])
-def list_alumnos(
-    session: SessionDep,
+@router.get("/", response_model=Page[AlumnoPublic])
+async def list_alumnos(
+    session: AsyncSessionDep,
+    pag: PaginacionDep,
     cursoId: int | None = Query(default=None),
 ):
-    stmt = select(Alumno)
+    stmt = select(*COLUMNAS_PUBLICAS)
     if cursoId is not None:
         stmt = stmt.where(Alumno.idCurso == cursoId)
-    return session.exec(stmt).all()
+    return await paginar_filas_async(session, stmt, Alumno.idAlumno, pag)
+
+
+# --------------------------------------------------
+# DETALLE DE VARIOS ALUMNOS (?ids=1&ids=2...) en 2 queries
+# --------------------------------------------------
+@router.get("/detalle", response_model=list[AlumnoDetalleConResponsables])
+async def get_alumnos_detalle(
+    session: AsyncSessionDep,
+    ids: list[int] = Query(..., min_length=1, max_length=PAGE_SIZE_MAX),
+):
+    alumnos = (await session.exec(
+        select(Alumno).where(Alumno.idAlumno.in_(ids))
+    )).all()
+
+    # mismo orden que los ids pedidos (los inexistentes se omiten)
+    orden = {id_: i for i, id_ in enumerate(ids)}
+    alumnos = sorted(alumnos, key=lambda a: orden[a.idAlumno])
+    return await detalles_con_responsables(session, alumnos)
 
 
 # --------------------------------------------------
 # OBTENER ALUMNO SIMPLE
 # --------------------------------------------------
 @router.get("/{alumno_id}", response_model=AlumnoPublic)
-def get_alumno(session: SessionDep, alumno_id: int):
-    alumno = session.get(Alumno, alumno_id)
+async def get_alumno(session: AsyncSessionDep, alumno_id: int):
+    alumno = await session.get(Alumno, alumno_id)
     if not alumno:
         raise HTTPException(status_code=404, detail="Alumno no encontrado")
     return alumno
@@ -44,45 +63,14 @@ def get_alumno(session: SessionDep, alumno_id: int):
 # OBTENER ALUMNO + RESPONSABLES + PARENTESCO ✅
 # --------------------------------------------------
 @router.get("/{alumno_id}/detalle", response_model=AlumnoDetalleConResponsables)
-def get_alumno_detalle(session: SessionDep, alumno_id: int):
-    alumno = session.get(Alumno, alumno_id)
+async def get_alumno_detalle(session: AsyncSessionDep, alumno_id: int):
+    alumno = await session.get(Alumno, alumno_id)
     if not alumno:
         raise HTTPException(status_code=404, detail="Alumno no encontrado")
 
     # JOIN responsable + tabla puente para traer parentesco
-    rows = session.exec(
-        select(Responsable, AlumnoResponsable.parentesco)
-        .join(
-            AlumnoResponsable,
-            AlumnoResponsable.idResponsable == Responsable.idResponsable,
-        )
-        .where(AlumnoResponsable.idAlumno == alumno_id)
-    ).all()
-
-    responsables = [
-        ResponsableConParentesco(
-            idResponsable=r.idResponsable,
-            nombre=r.nombre,
-            apellido=r.apellido,
-            dni=r.dni,
-            telefono=r.telefono,
-            correo_electronico=r.correo_electronico,
-            parentesco=parentesco,
-        )
-        for (r, parentesco) in rows
-    ]
-
-    return AlumnoDetalleConResponsables(
-        idAlumno=alumno.idAlumno,
-        idCurso=alumno.idCurso,
-        nombre=alumno.nombre,
-        apellido=alumno.apellido,
-        dni=alumno.dni,
-        fechaNac=alumno.fechaNac,
-        fechaIngreso=alumno.fechaIngreso,
-        direccion=alumno.direccion,
-        responsables=responsables,
-    )
+    [detalle] = await detalles_con_responsables(session, [alumno])
+    return detalle
 
 
 # --------------------------------------------------
@@ -90,6 +78,7 @@ def get_alumno_detalle(session: SessionDep, alumno_id: int):
 # --------------------------------------------------
 @router.post("/", response_model=AlumnoPublic, status_code=201)
 def create_alumno(session: SessionDep, data: AlumnoCreate):
+    exigir_curso_abierto(session, data.cursoId)
     alumno = Alumno(
         idCurso=data.cursoId,
         nombre=data.nombre,
@@ -111,19 +100,8 @@ def create_alumno(session: SessionDep, data: AlumnoCreate):
 # --------------------------------------------------
 @router.delete("/{alumno_id}", status_code=204)
 def delete_alumno(session: SessionDep, alumno_id: int):
-    alumno = session.get(Alumno, alumno_id)
-    if not alumno:
+    # vínculos y asistencia caen por ON DELETE CASCADE
+    if not borrar_alumnos(session, Alumno.idAlumno == alumno_id)["alumnos"]:
         raise HTTPException(status_code=404, detail="Alumno no encontrado")
-
-    # borrar vínculos con responsables primero (FK safe)
-    links = session.exec(
-        select(AlumnoResponsable).where(
-            AlumnoResponsable.idAlumno == alumno_id
-        )
-    ).all()
-    for l in links:
-        session.delete(l)
-
-    session.delete(alumno)
     session.commit()
     return None
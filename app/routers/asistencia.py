@@ -0,0 +1,46 @@
+from datetime import date
+
+from fastapi import APIRouter, HTTPException, Query
+from sqlmodel import select
+
+from app.dependencies import SessionDep
+from app.models.curso import Curso
+from app.schemas.asistencia import (
+    AsistenciaCursoCreate,
+    AsistenciaCursoResultado,
+    AsistenciaPublic,
+)
+from app.services.asistencia_archivo import fuente_asistencia, incluye_archivo
+from app.services.asistencia_service import registrar_asistencia_curso
+
+router = APIRouter(prefix="/cursos", tags=["Asistencia"])
+
+
+# --------------------------------------------------
+# TOMAR ASISTENCIA DE TODO EL CURSO (una request por curso)
+# --------------------------------------------------
+@router.post("/{curso_id}/asistencia", response_model=AsistenciaCursoResultado)
+def tomar_asistencia(session: SessionDep, curso_id: int, data: AsistenciaCursoCreate):
+    registrados = registrar_asistencia_curso(session, curso_id, data)
+    return AsistenciaCursoResultado(
+        cursoId=curso_id,
+        fecha=data.fecha,
+        registrados=registrados,
+    )
+
+
+# --------------------------------------------------
+# VER ASISTENCIA DE UN CURSO EN UNA FECHA
+# --------------------------------------------------
+@router.get("/{curso_id}/asistencia", response_model=list[AsistenciaPublic])
+def get_asistencia(session: SessionDep, curso_id: int, fecha: date = Query(...)):
+    curso = session.get(Curso, curso_id)
+    if not curso:
+        raise HTTPException(status_code=404, detail="Curso no encontrado")
+
+    # ciclos pasados: también la asistencia archivada
+    fuente = fuente_asistencia(
+        incluye_archivo(curso.cicloLectivo),
+        lambda t: [t.idCurso == curso_id, t.fecha == fecha],
+    )
+    return session.execute(select(fuente)).mappings().all()
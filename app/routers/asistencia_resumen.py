@@ -0,0 +1,169 @@
+from datetime import date
+from typing import Literal, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from sqlalchemy import func
+from sqlmodel import select
+
+from app.dependencies import AsyncSessionDep
+from app.models.alumno import Alumno
+from app.models.asistencia_resumen import (
+    AsistenciaAlumnoMes,
+    AsistenciaCursoDia,
+    AsistenciaCursoMes,
+    AsistenciaEscuelaDia,
+    AsistenciaEscuelaMes,
+)
+from app.models.curso import Curso
+from app.models.escuela import Escuela
+from app.schemas.asistencia import ResumenAlumno, ResumenCurso, ResumenPeriodo
+
+# Tableros de asistencia: leen sólo las tablas de resumen (costo proporcional
+# a cursos/días pedidos, no a la cantidad de registros de asistencia)
+router = APIRouter(tags=["Tableros de asistencia"])
+
+Periodo = Literal["dia", "mes"]
+
+
+def _resumen(cls, fila, **extra):
+    total = fila.presentes + fila.ausentes + fila.tardes + fila.justificados
+    return cls(
+        presentes=fila.presentes,
+        ausentes=fila.ausentes,
+        tardes=fila.tardes,
+        justificados=fila.justificados,
+        total=total,
+        tasaAsistencia=round((fila.presentes + fila.tardes) / total, 4) if total else None,
+        **extra,
+    )
+
+
+def _rango(columna, desde: Optional[date], hasta: Optional[date], periodo: Periodo) -> list:
+    filtro = []
+    if desde is not None:
+        filtro.append(columna >= (desde.replace(day=1) if periodo == "mes" else desde))
+    if hasta is not None:
+        filtro.append(columna <= hasta)
+    return filtro
+
+
+# --------------------------------------------------
+# ESCUELA: serie diaria o mensual
+# --------------------------------------------------
+@router.get("/escuelas/{escuela_id}/asistencia/resumen", response_model=list[ResumenPeriodo])
+async def resumen_escuela(
+    session: AsyncSessionDep,
+    escuela_id: int,
+    periodo: Periodo = Query(default="mes"),
+    desde: Optional[date] = Query(default=None),
+    hasta: Optional[date] = Query(default=None),
+):
+    if not await session.get(Escuela, escuela_id):
+        raise HTTPException(status_code=404, detail="Escuela no encontrada")
+
+    tabla = AsistenciaEscuelaDia if periodo == "dia" else AsistenciaEscuelaMes
+    columna = tabla.fecha if periodo == "dia" else tabla.mes
+    filas = (await session.exec(
+        select(tabla)
+        .where(tabla.idEscuela == escuela_id, *_rango(columna, desde, hasta, periodo))
+        .order_by(columna)
+    )).all()
+    return [_resumen(ResumenPeriodo, f, periodo=getattr(f, columna.key)) for f in filas]
+
+
+# --------------------------------------------------
+# ESCUELA: un renglón por curso para un día o un mes
+# --------------------------------------------------
+@router.get("/escuelas/{escuela_id}/asistencia/cursos", response_model=list[ResumenCurso])
+async def resumen_escuela_por_curso(
+    session: AsyncSessionDep,
+    escuela_id: int,
+    fecha: date = Query(..., description="Día (periodo=dia) o cualquier día del mes (periodo=mes)"),
+    periodo: Periodo = Query(default="dia"),
+):
+    if not await session.get(Escuela, escuela_id):
+        raise HTTPException(status_code=404, detail="Escuela no encontrada")
+
+    if periodo == "dia":
+        stmt = select(AsistenciaCursoDia).where(
+            AsistenciaCursoDia.idEscuela == escuela_id, AsistenciaCursoDia.fecha == fecha,
+        )
+    else:
+        stmt = select(AsistenciaCursoMes).where(
+            AsistenciaCursoMes.idEscuela == escuela_id, AsistenciaCursoMes.mes == fecha.replace(day=1),
+        )
+    filas = (await session.exec(stmt)).all()
+    return [_resumen(ResumenCurso, f, cursoId=f.idCurso) for f in filas]
+
+
+# --------------------------------------------------
+# CURSO: serie diaria o mensual
+# --------------------------------------------------
+@router.get("/cursos/{curso_id}/asistencia/resumen", response_model=list[ResumenPeriodo])
+async def resumen_curso(
+    session: AsyncSessionDep,
+    curso_id: int,
+    periodo: Periodo = Query(default="mes"),
+    desde: Optional[date] = Query(default=None),
+    hasta: Optional[date] = Query(default=None),
+):
+    if not await session.get(Curso, curso_id):
+        raise HTTPException(status_code=404, detail="Curso no encontrado")
+
+    tabla = AsistenciaCursoDia if periodo == "dia" else AsistenciaCursoMes
+    columna = tabla.fecha if periodo == "dia" else tabla.mes
+    filas = (await session.exec(
+        select(tabla)
+        .where(tabla.idCurso == curso_id, *_rango(columna, desde, hasta, periodo))
+        .order_by(columna)
+    )).all()
+    return [_resumen(ResumenPeriodo, f, periodo=getattr(f, columna.key)) for f in filas]
+
+
+# --------------------------------------------------
+# CURSO: inasistencias por alumno en un mes
+# --------------------------------------------------
+@router.get("/cursos/{curso_id}/asistencia/alumnos", response_model=list[ResumenAlumno])
+async def resumen_curso_por_alumno(
+    session: AsyncSessionDep,
+    curso_id: int,
+    mes: date = Query(..., description="Cualquier día del mes"),
+):
+    if not await session.get(Curso, curso_id):
+        raise HTTPException(status_code=404, detail="Curso no encontrado")
+
+    filas = (await session.exec(
+        select(AsistenciaAlumnoMes)
+        .where(AsistenciaAlumnoMes.idCurso == curso_id, AsistenciaAlumnoMes.mes == mes.replace(day=1))
+        .order_by(AsistenciaAlumnoMes.ausentes.desc())
+    )).all()
+    return [_resumen(ResumenAlumno, f, alumnoId=f.idAlumno) for f in filas]
+
+
+# --------------------------------------------------
+# ALUMNO: serie mensual (suma los cursos por los que pasó)
+# --------------------------------------------------
+@router.get("/alumnos/{alumno_id}/asistencia/resumen", response_model=list[ResumenPeriodo])
+async def resumen_alumno(
+    session: AsyncSessionDep,
+    alumno_id: int,
+    desde: Optional[date] = Query(default=None),
+    hasta: Optional[date] = Query(default=None),
+):
+    if not await session.get(Alumno, alumno_id):
+        raise HTTPException(status_code=404, detail="Alumno no encontrado")
+
+    t = AsistenciaAlumnoMes
+    filas = (await session.exec(
+        select(
+            t.mes,
+            func.sum(t.presentes).label("presentes"),
+            func.sum(t.ausentes).label("ausentes"),
+            func.sum(t.tardes).label("tardes"),
+            func.sum(t.justificados).label("justificados"),
+        )
+        .where(t.idAlumno == alumno_id, *_rango(t.mes, desde, hasta, "mes"))
+        .group_by(t.mes)
+        .order_by(t.mes)
+    )).all()
+    return [_resumen(ResumenPeriodo, f, periodo=f.mes) for f in filas]
@@ -1,11 +1,12 @@
-from fastapi import APIRouter, HTTPException, Depends
-from sqlmodel import Session, select
+from fastapi import APIRouter, HTTPException
+from sqlmodel import select
 from pydantic import BaseModel
 from typing import List, Optional
-from app.db.database import get_session
+from app.core.security import crear_token, es_hash, hash_password_async, verify_password_async
+from app.dependencies import AsyncSessionDep, ClaimsDep
 from app.models.usuario import Usuario
-from app.models.rol import Rol
-from app.models.escuela import Escuela  
+from app.schemas.auth import Claims
+from app.services.auth_service import roles_habilitados_async
 
 router = APIRouter()
 
@@ -19,46 +20,53 @@ class OpcionRol(BaseModel):
     descripcion: str     # "Docente", "Director"
     idEscuela: int
     nombre_escuela: str  # "Escuela Técnica N°1"
+    token: str           # token firmado para operar con este rol
 
 # Estructura de respuesta del login
 class LoginResponse(BaseModel):
     mensaje: str
     usuario_id: int
-    nombre: str
-    apellido: str
-    roles_disponibles: List[OpcionRol] 
+    nombre: Optional[str] = None
+    apellido: Optional[str] = None
+    roles_disponibles: List[OpcionRol]
+
 
 @router.post("/login", response_model=LoginResponse)
-def login(data: LoginRequest, session: Session = Depends(get_session)):
+async def login(data: LoginRequest, session: AsyncSessionDep):
     # 1. Buscar usuario
-    user = session.exec(select(Usuario).where(Usuario.dni == data.dni)).first()
-    
-    if not user or user.contrasena != data.password:
+    user = (await session.exec(select(Usuario).where(Usuario.dni == data.dni))).first()
+
+    # el hash se verifica en el pool acotado, fuera del event loop
+    if not user or not await verify_password_async(data.password, user.contrasena):
         raise HTTPException(status_code=401, detail="Credenciales incorrectas")
 
-    # 2. Buscar Roles + Nombre de Escuela
-    resultados = session.exec(
-        select(Rol, Escuela)
-        .join(Escuela, Rol.idEscuela == Escuela.idEscuela)
-        .where(Rol.idUsuario == user.idUsuario)
-    ).all()
-    
-    # 3. Filtrar solo los Aprobados (o Admin)
-    opciones_validas = []
-    
-    for rol, escuela in resultados:
-        if rol.descripcion == "Admin" or rol.estado == "Aprobado":
-            opciones_validas.append(OpcionRol(
-                idRol=rol.idRol,
-                descripcion=rol.descripcion,
-                idEscuela=escuela.idEscuela,
-                nombre_escuela=escuela.nombre
-            ))
+    # contraseña vieja en texto plano: se migra a hash en este login
+    if not es_hash(user.contrasena):
+        user.contrasena = await hash_password_async(data.password)
+        session.add(user)
+        await session.commit()
+
+    # 2. Roles habilitados (Aprobados o Admin) + nombre de escuela, cacheados
+    roles = await roles_habilitados_async(session, user.idUsuario)
 
-    # 4. Validar si quedó alguno
-    if not opciones_validas:
+    # 3. Validar si quedó alguno
+    if not roles:
         raise HTTPException(status_code=403, detail="Usuario pendiente de aprobación o sin roles.")
 
+    # 4. Un token por rol: el Frontend usa el del rol que elija el usuario
+    opciones_validas = [
+        OpcionRol(
+            **rol,
+            token=crear_token({
+                "sub": user.idUsuario,
+                "rol": rol["idRol"],
+                "desc": rol["descripcion"],
+                "esc": rol["idEscuela"],
+            }),
+        )
+        for rol in roles
+    ]
+
     # 5. Devolver TODO al Frontend (para que el usuario elija)
     return LoginResponse(
         mensaje="Login exitoso",
@@ -66,4 +74,10 @@ def login(data: LoginRequest, session: Session = Depends(get_session)):
         nombre=user.nombre,
         apellido=user.apellido,
         roles_disponibles=opciones_validas
-    )
\ No newline at end of file
+    )
+
+
+# Datos del rol activo, leídos del token (sin consultar la DB)
+@router.get("/me", response_model=Claims)
+async def me(claims: ClaimsDep):
+    return claims
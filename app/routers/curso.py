@@ -1,34 +1,65 @@
 # app/routers/curso.py
+from typing import Literal
+
 from fastapi import APIRouter, HTTPException, Query
 from sqlmodel import select
 
-from app.dependencies import SessionDep
+from app.core.pagination import paginar_filas_async
+from app.core.response_cache import CachedRoute, cacheable, response_cache
+from app.dependencies import AsyncSessionDep, SessionDep, PaginacionDep
+from app.models.alumno import Alumno
 from app.models.curso import Curso
-from app.schemas.curso import CursoCreate, CursoPublic
+from app.schemas.alumno_responsables import AlumnoDetalleConResponsables
+from app.schemas.curso import CierreCurso, CursoCreate, CursoPublic
+from app.schemas.pagination import Page
+from app.services.alumno_service import detalles_con_responsables
+from app.services.curso_service import COLUMNAS_PUBLICAS, cerrar_curso
 
-router = APIRouter()
+router = APIRouter(prefix="/cursos", tags=["Cursos"], route_class=CachedRoute)
 
-@router.get("/", response_model=list[CursoPublic])
-def list_cursos(
-    session: SessionDep,
+@router.get("/", response_model=Page[CursoPublic])
+@cacheable("cursos")
+async def list_cursos(
+    session: AsyncSessionDep,
+    pag: PaginacionDep,
     escuelaId: int | None = Query(default=None),
     cicloLectivo: int | None = Query(default=None),
 ):
-    stmt = select(Curso)
+    stmt = select(*COLUMNAS_PUBLICAS)
     if escuelaId is not None:
         stmt = stmt.where(Curso.idEscuela == escuelaId)
     if cicloLectivo is not None:
         stmt = stmt.where(Curso.cicloLectivo == cicloLectivo)
 
-    return session.exec(stmt).all()
+    return await paginar_filas_async(session, stmt, Curso.idCurso, pag)
 
 @router.get("/{curso_id}", response_model=CursoPublic)
-def get_curso(session: SessionDep, curso_id: int):
-    curso = session.get(Curso, curso_id)
+@cacheable("cursos")
+async def get_curso(session: AsyncSessionDep, curso_id: int):
+    curso = await session.get(Curso, curso_id)
     if not curso:
         raise HTTPException(status_code=404, detail="Curso no encontrado")
     return curso
 
+# Planilla completa del curso: alumnos (+ responsables) en un número fijo de queries
+@router.get("/{curso_id}/alumnos", response_model=list[AlumnoDetalleConResponsables])
+async def get_curso_alumnos(
+    session: AsyncSessionDep,
+    curso_id: int,
+    include: Literal["responsables"] | None = Query(default=None),
+):
+    if not await session.get(Curso, curso_id):
+        raise HTTPException(status_code=404, detail="Curso no encontrado")
+
+    alumnos = (await session.exec(
+        select(Alumno)
+        .where(Alumno.idCurso == curso_id)
+        .order_by(Alumno.apellido, Alumno.nombre)
+    )).all()
+    return await detalles_con_responsables(
+        session, alumnos, incluir_responsables=include == "responsables"
+    )
+
 @router.post("/", response_model=CursoPublic, status_code=201)
 def create_curso(session: SessionDep, data: CursoCreate):
     curso = Curso(
@@ -42,4 +73,17 @@ def create_curso(session: SessionDep, data: CursoCreate):
     session.add(curso)
     session.commit()
     session.refresh(curso)
+    response_cache.invalidar("cursos")
     return curso
+
+# Cierre de fin de ciclo: el curso queda de sólo lectura y, si se pide, se dan
+# de baja los alumnos que siguen en él (con sus vínculos) en pocas sentencias
+@router.post("/{curso_id}/cerrar", response_model=CierreCurso)
+def cerrar(
+    session: SessionDep,
+    curso_id: int,
+    eliminarAlumnos: bool = Query(default=False),
+):
+    resultado = cerrar_curso(session, curso_id, eliminar_alumnos=eliminarAlumnos)
+    response_cache.invalidar("cursos")
+    return CierreCurso(cursoId=curso_id, **resultado)
@@ -1,55 +1,83 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
-from app.db.database import get_session 
-from app.models.usuario import Usuario
+from typing import Literal
 
-# 👇 ESTA ES LA LÍNEA QUE TE FALTA O QUE PYTHON NO ENCUENTRA
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import select
+
+from app.core.pagination import Paginacion, paginar_async
+from app.dependencies import AsyncSessionDep, PaginacionDep, SessionDep, get_director
+from app.models.escuela import Escuela
+from app.models.rol import Rol
+from app.schemas.pagination import PageConTotal
+from app.schemas.rol import MiembroEscuela, ResultadoLote, SolicitudesLote
+from app.services.auth_service import membresias_escuela_async
+from app.services.rol_service import _stmt_miembros, lote_a_respuesta, resolver_solicitud, resolver_solicitudes
+
+# todas las rutas llevan escuela_id: sólo el Director de esa escuela (o un Admin)
 router = APIRouter(
     prefix="",
-    tags=["Director"]
+    tags=["Director"],
+    dependencies=[Depends(get_director)],
 )
 
+
+async def _pagina_miembros(
+    session: AsyncSessionDep, escuela_id: int, descripcion: str, estado: str, pag: Paginacion
+) -> dict:
+    if not await session.get(Escuela, escuela_id):
+        raise HTTPException(status_code=404, detail="Escuela no encontrada")
+
+    # keyset por idRol: las solicitudes salen en orden de llegada
+    pagina = await paginar_async(session, _stmt_miembros(escuela_id, descripcion, estado), Rol.idRol, pag)
+    conteos = await membresias_escuela_async(session, escuela_id)
+    pagina["items"] = [MiembroEscuela.model_validate(r._mapping) for r in pagina["items"]]
+    pagina["total"] = conteos.get((descripcion, estado), 0)
+    return pagina
+
+
 # 1. Obtener Docentes de una Escuela
-@router.get("/escuelas/{escuela_id}/docentes")
-def get_docentes_por_escuela(escuela_id: int, session: Session = Depends(get_session)):
-    statement = select(Usuario).where(Usuario.escuela_id == escuela_id).where(Usuario.rol == "Docente")
-    results = session.exec(statement).all()
-    return results
+@router.get("/escuelas/{escuela_id}/docentes", response_model=PageConTotal[MiembroEscuela])
+async def get_docentes_por_escuela(session: AsyncSessionDep, pag: PaginacionDep, escuela_id: int):
+    return await _pagina_miembros(session, escuela_id, "Docente", "Aprobado", pag)
 
 # 2. Obtener Solicitudes Pendientes
-@router.get("/escuelas/{escuela_id}/solicitudes")
-def get_solicitudes_pendientes(escuela_id: int, session: Session = Depends(get_session)):
-    statement = select(Usuario).where(Usuario.escuela_id == escuela_id).where(Usuario.rol == "Pendiente")
-    results = session.exec(statement).all()
-    return results
+@router.get("/escuelas/{escuela_id}/solicitudes", response_model=PageConTotal[MiembroEscuela])
+async def get_solicitudes_pendientes(
+    session: AsyncSessionDep,
+    pag: PaginacionDep,
+    escuela_id: int,
+    descripcion: Literal["Docente", "Director"] = Query(default="Docente"),
+):
+    return await _pagina_miembros(session, escuela_id, descripcion, "Pendiente", pag)
 
 # 3. Aprobar Docente
 @router.post("/usuarios/{usuario_id}/aprobar-docente")
-def aprobar_docente(usuario_id: int, session: Session = Depends(get_session)):
-    usuario = session.get(Usuario, usuario_id)
-    if not usuario:
-        raise HTTPException(status_code=404, detail="Usuario no encontrado")
-    
-    usuario.rol = "Docente"
-    session.add(usuario)
-    session.commit()
-    session.refresh(usuario)
+def aprobar_docente(session: SessionDep, usuario_id: int, escuela_id: int = Query(...)):
+    resolver_solicitud(session, usuario_id, escuela_id, "Docente", aprobar=True)
     return {"message": "Docente aprobado exitosamente"}
 
 # 4. Rechazar Solicitud
 @router.delete("/usuarios/{usuario_id}/rechazar-solicitud")
-def rechazar_solicitud(usuario_id: int, session: Session = Depends(get_session)):
-    usuario = session.get(Usuario, usuario_id)
-    if not usuario:
-        raise HTTPException(status_code=404, detail="Usuario no encontrado")
-    
-    session.delete(usuario)
-    session.commit()
-    return {"message": "Solicitud rechazada y usuario eliminado"}
-
-# 5. Generar Código
+def rechazar_solicitud(session: SessionDep, usuario_id: int, escuela_id: int = Query(...)):
+    # se borra la solicitud (el rol pendiente), no el usuario: puede tener roles en otras escuelas
+    resolver_solicitud(session, usuario_id, escuela_id, "Docente", aprobar=False)
+    return {"message": "Solicitud rechazada"}
+
+# 5. Aprobar / rechazar solicitudes de Docente en lote (por idRol, sólo de esta escuela)
+@router.post("/escuelas/{escuela_id}/solicitudes/aprobar", response_model=ResultadoLote)
+def aprobar_solicitudes(session: SessionDep, escuela_id: int, lote: SolicitudesLote):
+    return lote_a_respuesta(resolver_solicitudes(
+        session, lote.ids, aprobar=True, descripcion="Docente", id_escuela=escuela_id,
+    ))
+
+@router.post("/escuelas/{escuela_id}/solicitudes/rechazar", response_model=ResultadoLote)
+def rechazar_solicitudes(session: SessionDep, escuela_id: int, lote: SolicitudesLote):
+    return lote_a_respuesta(resolver_solicitudes(
+        session, lote.ids, aprobar=False, descripcion="Docente", id_escuela=escuela_id,
+    ))
+
+# 6. Generar Código
 @router.post("/escuelas/{escuela_id}/generar-codigo")
 def generar_codigo(escuela_id: int):
     import random
     codigo = f"DOC-{random.randint(1000, 9999)}"
-    return {"codigo": codigo}
\ No newline at end of file
+    return {"codigo": codigo}
@@ -1,45 +1,103 @@
 # app/routers/escuela.py
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, File, HTTPException, Query, UploadFile
+from fastapi.responses import StreamingResponse
+from sqlalchemy import delete
 from sqlmodel import select
-from sqlalchemy import func
-from sqlmodel import or_
 
-from app.dependencies import SessionDep
+from app.core.pagination import paginar_async
+from app.core.response_cache import CachedRoute, cacheable, response_cache
+from app.core.config import IMPORT_CHUNK_SIZE, IMPORT_CHUNK_SIZE_MAX
+from app.dependencies import AsyncSessionDep, SessionDep, PaginacionDep
 from app.models.escuela import Escuela
+from app.models.rol import Rol
 from app.schemas.escuela import EscuelaCreate, EscuelaPublic, EscuelaUpdate
+from app.schemas.importacion import ResultadoImportacion
+from app.schemas.rollover import ResultadoRollover
+from app.schemas.pagination import Page
+from app.services.auth_service import invalidar_roles, revocar_tokens
+from app.services.escuela_search import buscar_escuelas_async
+from app.services.export_service import EntidadExport, FormatoExport, stream_export
+from app.services.import_service import importar_alumnos_csv
+from app.services.rollover_service import rollover_escuela
 
-router = APIRouter(prefix="/escuelas", tags=["Escuelas"])
+router = APIRouter(prefix="/escuelas", tags=["Escuelas"], route_class=CachedRoute)
 
-@router.get("/", response_model=list[EscuelaPublic])
-def list_escuelas(
-    session: SessionDep,
-    q: str | None = Query(default=None, description="Búsqueda por nombre/CUE"),
+@router.get("/", response_model=Page[EscuelaPublic])
+@cacheable("escuelas")
+async def list_escuelas(
+    session: AsyncSessionDep,
+    pag: PaginacionDep,
+    q: str | None = Query(default=None, description="Búsqueda por nombre/CUE/localidad/provincia (sin acentos)"),
 ):
-    stmt = select(Escuela)
-
+    # Con q: resultados por relevancia, hasta `limit` (sin páginas siguientes)
     if q:
-        stmt = stmt.where(
-            or_(
-                Escuela.nombre.contains(q),
-                func.coalesce(Escuela.cue, "").contains(q),
-            )
-        )
+        return {"items": await buscar_escuelas_async(session, q, pag.limit), "next_cursor": None}
 
-    return session.exec(stmt).all()
+    return await paginar_async(session, select(Escuela), Escuela.idEscuela, pag)
 
 @router.get("/{escuela_id}", response_model=EscuelaPublic)
-def get_escuela(session: SessionDep, escuela_id: int):
-    escuela = session.get(Escuela, escuela_id)
+@cacheable("escuelas")
+async def get_escuela(session: AsyncSessionDep, escuela_id: int):
+    escuela = await session.get(Escuela, escuela_id)
     if not escuela:
         raise HTTPException(status_code=404, detail="Escuela no encontrada")
     return escuela
 
+@router.get("/{escuela_id}/export")
+def export_escuela(
+    session: SessionDep,
+    escuela_id: int,
+    entidad: EntidadExport = Query(default="alumnos"),
+    format: FormatoExport = Query(default="csv"),
+    cicloLectivo: int | None = Query(default=None),
+):
+    if not session.get(Escuela, escuela_id):
+        raise HTTPException(status_code=404, detail="Escuela no encontrada")
+
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    filename = f"escuela_{escuela_id}_{entidad}.{format}"
+    return StreamingResponse(
+        stream_export(entidad, format, escuela_id, cicloLectivo),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+@router.post("/{escuela_id}/import", response_model=ResultadoImportacion)
+def import_escuela(
+    session: SessionDep,
+    escuela_id: int,
+    archivo: UploadFile = File(..., description="CSV de alumnos con sus responsables"),
+    chunkSize: int = Query(default=IMPORT_CHUNK_SIZE, ge=1, le=IMPORT_CHUNK_SIZE_MAX),
+):
+    if not session.get(Escuela, escuela_id):
+        raise HTTPException(status_code=404, detail="Escuela no encontrada")
+
+    return importar_alumnos_csv(session, escuela_id, archivo.file, chunkSize)
+
+# Pase de año: cursos del ciclo siguiente + promoción de todos los alumnos en una transacción
+@router.post("/{escuela_id}/rollover", response_model=ResultadoRollover)
+def rollover(
+    session: SessionDep,
+    escuela_id: int,
+    cicloOrigen: int = Query(...),
+    dryRun: bool = Query(default=False, description="Sólo mostrar qué haría, sin escribir"),
+    gradoMaximo: int | None = Query(default=None, ge=1, description="Grado que egresa (default: el mayor del ciclo)"),
+):
+    if not session.get(Escuela, escuela_id):
+        raise HTTPException(status_code=404, detail="Escuela no encontrada")
+
+    resultado = rollover_escuela(session, escuela_id, cicloOrigen, dry_run=dryRun, grado_maximo=gradoMaximo)
+    if not dryRun:
+        response_cache.invalidar("cursos")
+    return resultado
+
 @router.post("/", response_model=EscuelaPublic, status_code=201)
 def create_escuela(session: SessionDep, data: EscuelaCreate):
     escuela = Escuela.model_validate(data)
     session.add(escuela)
     session.commit()
     session.refresh(escuela)
+    response_cache.invalidar("escuelas")
     return escuela
 
 @router.patch("/{escuela_id}", response_model=EscuelaPublic)
@@ -54,13 +112,21 @@ def update_escuela(session: SessionDep, escuela_id: int, data: EscuelaUpdate):
     session.add(escuela)
     session.commit()
     session.refresh(escuela)
+    response_cache.invalidar("escuelas")
     return escuela
 
 @router.delete("/{escuela_id}", status_code=204)
 def delete_escuela(session: SessionDep, escuela_id: int):
-    escuela = session.get(Escuela, escuela_id)
-    if not escuela:
+    # usuarios con rol en la escuela: sus roles cacheados y tokens dejan de valer
+    usuarios = session.exec(select(Rol.idUsuario).where(Rol.idEscuela == escuela_id).distinct()).all()
+
+    # un solo DELETE: cursos, alumnos, roles, asistencia y resúmenes caen por ON DELETE CASCADE
+    if not session.execute(delete(Escuela).where(Escuela.idEscuela == escuela_id)).rowcount:
         raise HTTPException(status_code=404, detail="Escuela no encontrada")
-    session.delete(escuela)
+    revocar_tokens(session, usuarios)
     session.commit()
+
+    for id_usuario in usuarios:
+        invalidar_roles(id_usuario, id_escuela=escuela_id)
+    response_cache.invalidar("escuelas", "cursos")
     return None
@@ -1,38 +1,98 @@
 from fastapi import APIRouter, HTTPException, Query
+from sqlalchemy import delete
 from sqlmodel import select
 
-from app.dependencies import SessionDep
+from app.core.pagination import paginar
+from app.dependencies import SessionDep, PaginacionDep
 from app.models.responsable import Responsable
 from app.models.alumno import Alumno
 from app.models.alumno_responsable import AlumnoResponsable
+from app.models.curso import Curso
 from app.schemas.responsable import (
     ResponsableCreate,
     ResponsablePublic,
     ResponsableUpdate,
     VincularResponsableRequest
 )
+from app.schemas.pagination import Page
+from app.services.sync_service import registrar_bajas
 
 router = APIRouter(prefix="/responsables", tags=["Responsables"])
 
 
+# ----------------------------
+# Vincular / Desvincular con parentesco
+# (antes que /{responsable_id}: si no, DELETE /vincular no llega a esta ruta)
+# ----------------------------
+@router.post("/vincular", status_code=201)
+def vincular_responsable(session: SessionDep, data: VincularResponsableRequest):
+    alumno = session.get(Alumno, data.idAlumno)
+    if not alumno:
+        raise HTTPException(status_code=404, detail="Alumno no encontrado")
+
+    resp = session.get(Responsable, data.idResponsable)
+    if not resp:
+        raise HTTPException(status_code=404, detail="Responsable no encontrado")
+
+    # evitar duplicados
+    existente = session.get(AlumnoResponsable, (data.idAlumno, data.idResponsable))
+    if existente:
+        existente.parentesco = data.parentesco
+        session.add(existente)
+        session.commit()
+        return {"ok": True, "mensaje": "Vínculo actualizado"}
+
+    link = AlumnoResponsable(
+        idAlumno=data.idAlumno,
+        idResponsable=data.idResponsable,
+        parentesco=data.parentesco
+    )
+    session.add(link)
+    session.commit()
+    return {"ok": True, "mensaje": "Vínculo creado"}
+
+
+@router.delete("/vincular", status_code=204)
+def desvincular_responsable(
+    session: SessionDep,
+    idAlumno: int = Query(...),
+    idResponsable: int = Query(...),
+):
+    link = session.get(AlumnoResponsable, (idAlumno, idResponsable))
+    if not link:
+        raise HTTPException(status_code=404, detail="Vínculo no encontrado")
+
+    registrar_bajas(session, "alumno_responsable", (
+        select(AlumnoResponsable.idAlumno, AlumnoResponsable.idResponsable, Curso.idEscuela)
+        .join(Alumno, Alumno.idAlumno == AlumnoResponsable.idAlumno)
+        .join(Curso, Curso.idCurso == Alumno.idCurso)
+        .where(AlumnoResponsable.idAlumno == idAlumno, AlumnoResponsable.idResponsable == idResponsable)
+    ))
+    session.delete(link)
+    session.commit()
+    return None
+
+
 # ----------------------------
 # CRUD Responsables
 # ----------------------------
-@router.get("/", response_model=list[ResponsablePublic])
+@router.get("/", response_model=Page[ResponsablePublic])
 def list_responsables(
     session: SessionDep,
+    pag: PaginacionDep,
     alumnoId: int | None = Query(default=None),
 ):
+    stmt = select(Responsable)
+
     # Si piden por alumno: devolver responsables asociados
     if alumnoId is not None:
         stmt = (
-            select(Responsable)
+            stmt
             .join(AlumnoResponsable, AlumnoResponsable.idResponsable == Responsable.idResponsable)
             .where(AlumnoResponsable.idAlumno == alumnoId)
         )
-        return session.exec(stmt).all()
 
-    return session.exec(select(Responsable)).all()
+    return paginar(session, stmt, Responsable.idResponsable, pag)
 
 
 @router.get("/{responsable_id}", response_model=ResponsablePublic)
@@ -69,63 +129,23 @@ def update_responsable(session: SessionDep, responsable_id: int, data: Responsab
 
 @router.delete("/{responsable_id}", status_code=204)
 def delete_responsable(session: SessionDep, responsable_id: int):
-    r = session.get(Responsable, responsable_id)
-    if not r:
-        raise HTTPException(status_code=404, detail="Responsable no encontrado")
-
-    # borrar vínculos primero (evita FK)
-    links = session.exec(
-        select(AlumnoResponsable).where(AlumnoResponsable.idResponsable == responsable_id)
+    # marcas de baja para el sync de cada escuela donde estaba vinculado
+    vinculos = session.exec(
+        select(AlumnoResponsable.idAlumno, AlumnoResponsable.idResponsable, Curso.idEscuela)
+        .join(Alumno, Alumno.idAlumno == AlumnoResponsable.idAlumno)
+        .join(Curso, Curso.idCurso == Alumno.idCurso)
+        .where(AlumnoResponsable.idResponsable == responsable_id)
     ).all()
-    for l in links:
-        session.delete(l)
-
-    session.delete(r)
-    session.commit()
-    return None
-
-
-# ----------------------------
-# Vincular / Desvincular con parentesco
-# ----------------------------
-@router.post("/vincular", status_code=201)
-def vincular_responsable(session: SessionDep, data: VincularResponsableRequest):
-    alumno = session.get(Alumno, data.idAlumno)
-    if not alumno:
-        raise HTTPException(status_code=404, detail="Alumno no encontrado")
-
-    resp = session.get(Responsable, data.idResponsable)
-    if not resp:
+    escuelas = {e for _, _, e in vinculos} or {None}
+    registrar_bajas(session, "alumno_responsable", list(vinculos))
+    registrar_bajas(session, "responsable", [(responsable_id, None, e) for e in escuelas])
+
+    # un solo DELETE: los vínculos con alumnos caen por ON DELETE CASCADE
+    borrados = session.execute(
+        delete(Responsable).where(Responsable.idResponsable == responsable_id)
+    ).rowcount
+    if not borrados:
         raise HTTPException(status_code=404, detail="Responsable no encontrado")
 
-    # evitar duplicados
-    existente = session.get(AlumnoResponsable, (data.idAlumno, data.idResponsable))
-    if existente:
-        existente.parentesco = data.parentesco
-        session.add(existente)
-        session.commit()
-        return {"ok": True, "mensaje": "Vínculo actualizado"}
-
-    link = AlumnoResponsable(
-        idAlumno=data.idAlumno,
-        idResponsable=data.idResponsable,
-        parentesco=data.parentesco
-    )
-    session.add(link)
-    session.commit()
-    return {"ok": True, "mensaje": "Vínculo creado"}
-
-
-@router.delete("/vincular", status_code=204)
-def desvincular_responsable(
-    session: SessionDep,
-    idAlumno: int = Query(...),
-    idResponsable: int = Query(...),
-):
-    link = session.get(AlumnoResponsable, (idAlumno, idResponsable))
-    if not link:
-        raise HTTPException(status_code=404, detail="Vínculo no encontrado")
-
-    session.delete(link)
     session.commit()
     return None
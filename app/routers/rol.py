@@ -1,14 +1,23 @@
 from fastapi import APIRouter, HTTPException
-from app.dependencies import SessionDep
+from app.dependencies import ClaimsOpcionalDep, SessionDep
 from app.models.rol import Rol
 from app.schemas.rol import RolCreate, RolPublic
+from app.services.auth_service import invalidar_roles
 
 router = APIRouter(prefix="/roles", tags=["Roles"])
 
 @router.post("/", response_model=RolPublic, status_code=201)
-def create_rol(session: SessionDep, data: RolCreate):
+def create_rol(session: SessionDep, data: RolCreate, claims: ClaimsOpcionalDep):
+    # sólo un Admin asigna roles ya aprobados o de Admin; el resto es una solicitud
+    # que queda pendiente hasta que la resuelva el admin o el director
+    if claims is None or claims.descripcion != "Admin":
+        if data.descripcion == "Admin":
+            raise HTTPException(status_code=403, detail="Sólo un Admin puede asignar el rol Admin")
+        data.estado = "Pendiente"
+
     rol = Rol(**data.model_dump())
     session.add(rol)
     session.commit()
     session.refresh(rol)
+    invalidar_roles(rol.idUsuario, id_escuela=rol.idEscuela)
     return rol
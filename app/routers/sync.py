@@ -0,0 +1,41 @@
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+
+from app.db.routing import solo_primaria
+from app.dependencies import AsyncSessionDep, SessionDep
+from app.models.escuela import Escuela
+from app.schemas.sync import AsistenciaOfflineLote, ResultadoOfflineLote, SyncCambios
+from app.services.sync_service import cambios_escuela_async, leer_token, subir_asistencia_offline
+
+# Sync para dispositivos offline-first (docentes con mala conexión)
+router = APIRouter(prefix="/sync", tags=["Sync offline"])
+
+
+# --------------------------------------------------
+# BAJAR CAMBIOS DE UNA ESCUELA
+# --------------------------------------------------
+@router.get("/", response_model=SyncCambios)
+async def sync_escuela(
+    session: AsyncSessionDep,
+    escuelaId: int = Query(...),
+    since: Optional[str] = Query(default=None, description="Token de la respuesta anterior; sin token, foto completa"),
+):
+    # una réplica atrasada podría no tener filas anteriores al token que se devuelve
+    solo_primaria.set(True)
+    desde = leer_token(since) if since else None
+    if not await session.get(Escuela, escuelaId):
+        raise HTTPException(status_code=404, detail="Escuela no encontrada")
+    return await cambios_escuela_async(session, escuelaId, desde)
+
+
+# --------------------------------------------------
+# SUBIR ASISTENCIA TOMADA SIN CONEXIÓN
+# --------------------------------------------------
+@router.post("/asistencia", response_model=ResultadoOfflineLote)
+def subir_asistencia(session: SessionDep, lote: AsistenciaOfflineLote):
+    resultados = subir_asistencia_offline(session, lote.registros)
+    return ResultadoOfflineLote(
+        aplicados=sum(r.resultado == "aplicado" for r in resultados),
+        resultados=resultados,
+    )
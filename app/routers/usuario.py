@@ -1,15 +1,17 @@
-from typing import Annotated
-
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException
 from sqlmodel import select
 
-from app.dependencies import SessionDep
+from app.core.pagination import paginar
+from app.core.security import hash_password
+from app.dependencies import SessionDep, PaginacionDep
 from app.models.usuario import Usuario
 from app.schemas.usuario import (
     UsuarioCreate,
     UsuarioPublic,
     UsuarioUpdate
 )
+from app.schemas.pagination import Page
+from app.services.auth_service import invalidar_roles, revocar_tokens
 
 router = APIRouter(
     prefix="/usuarios",
@@ -19,16 +21,12 @@ router = APIRouter(
 # =====================================================
 # GET /usuarios → Listar usuarios (para Admin)
 # =====================================================
-@router.get("/", response_model=list[UsuarioPublic])
+@router.get("/", response_model=Page[UsuarioPublic])
 def get_all_usuarios(
     session: SessionDep,
-    offset: int = 0,
-    limit: Annotated[int, Query(le=100)] = 100
+    pag: PaginacionDep
 ):
-    usuarios = session.exec(
-        select(Usuario).offset(offset).limit(limit)
-    ).all()
-    return usuarios
+    return paginar(session, select(Usuario), Usuario.idUsuario, pag)
 
 
 # =====================================================
@@ -41,6 +39,7 @@ def create_usuario(
 ):
     # Crear instancia del modelo
     db_usuario = Usuario.model_validate(usuario)
+    db_usuario.contrasena = hash_password(usuario.contrasena)
 
     session.add(db_usuario)
     session.commit()
@@ -83,6 +82,8 @@ def update_usuario(
         )
 
     usuario_data = usuario.model_dump(exclude_unset=True)
+    if usuario_data.get("contrasena"):
+        usuario_data["contrasena"] = hash_password(usuario_data["contrasena"])
     usuario_db.sqlmodel_update(usuario_data)
 
     session.add(usuario_db)
@@ -108,5 +109,8 @@ def delete_usuario(
         )
 
     session.delete(usuario)
+    # sus roles caen con el usuario: los tokens que ya tenía dejan de valer
+    revocar_tokens(session, [usuario_id])
     session.commit()
+    invalidar_roles(usuario_id)
     return None
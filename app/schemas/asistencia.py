@@ -0,0 +1,55 @@
+from typing import Literal, Optional
+from datetime import date
+from pydantic import BaseModel, Field, ConfigDict
+
+EstadoAsistencia = Literal["Presente", "Ausente", "Tarde", "Justificado"]
+
+
+class AsistenciaItem(BaseModel):
+    alumnoId: int
+    estado: EstadoAsistencia
+    observacion: Optional[str] = Field(default=None, max_length=255)
+
+
+class AsistenciaCursoCreate(BaseModel):
+    fecha: date
+    registros: list[AsistenciaItem] = Field(min_length=1)
+
+
+class AsistenciaCursoResultado(BaseModel):
+    cursoId: int
+    fecha: date
+    registrados: int
+
+
+class AsistenciaPublic(BaseModel):
+    alumnoId: int = Field(alias="idAlumno")
+    cursoId: int = Field(alias="idCurso")
+    fecha: date
+    estado: str
+    observacion: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+
+# Tableros: se leen de las tablas de resumen, nunca de la asistencia cruda
+class ResumenAsistencia(BaseModel):
+    presentes: int
+    ausentes: int
+    tardes: int
+    justificados: int
+    total: int
+    # (presentes + tardes) / total; None si no hay registros
+    tasaAsistencia: Optional[float] = None
+
+
+class ResumenPeriodo(ResumenAsistencia):
+    periodo: date  # el día, o el primer día del mes
+
+
+class ResumenCurso(ResumenAsistencia):
+    cursoId: int
+
+
+class ResumenAlumno(ResumenAsistencia):
+    alumnoId: int
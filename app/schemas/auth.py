@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+
+class Claims(BaseModel):
+    """Datos del token: identifican al usuario y el rol/escuela con el que entró."""
+    idUsuario: int
+    idRol: int
+    descripcion: str  # "Docente", "Director", "Admin"
+    idEscuela: int
@@ -19,5 +19,13 @@ class CursoPublic(BaseModel):
     division: Optional[str] = None
     turno: Optional[str] = None
     cicloLectivo: int
+    cerrado: bool = False
 
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+# Resultado de POST /cursos/{id}/cerrar
+class CierreCurso(BaseModel):
+    cursoId: int
+    alumnos: int  # alumnos dados de baja
+    vinculos: int  # vínculos alumno-responsable borrados
+    responsables: int  # responsables que quedaron sin alumnos
@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+
+
+class ErrorImportacion(BaseModel):
+    fila: int  # número de línea en el CSV (el encabezado es la 1)
+    detalle: str
+
+
+class ResultadoImportacion(BaseModel):
+    filas: int
+    alumnosCreados: int
+    responsablesCreados: int
+    responsablesExistentes: int
+    vinculosCreados: int
+    errores: list[ErrorImportacion] = []
+
+    chunkSize: int
+    segundos: float
+    filasPorSegundo: float
@@ -0,0 +1,13 @@
+from typing import Generic, Optional, TypeVar
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    items: list[T]
+    next_cursor: Optional[str] = None  # None = no hay más páginas
+
+
+class PageConTotal(Page[T], Generic[T]):
+    total: int  # elementos que cumplen el filtro, sumando todas las páginas
@@ -16,3 +16,27 @@ class RolCreate(RolBase):
 class RolUpdate(SQLModel):
     descripcion: str | None = None
     estado: str | None = None
+
+# Rol + datos del usuario, para los listados de una escuela
+class MiembroEscuela(SQLModel):
+    idRol: int
+    idUsuario: int
+    descripcion: str
+    estado: str
+    dni: str
+    nombre: str | None = None
+    apellido: str | None = None
+    mailABC: str | None = None
+    celular: str | None = None
+
+# Aprobación / rechazo en lote
+class SolicitudesLote(SQLModel):
+    ids: list[int] = Field(min_length=1, max_length=500)  # idRol
+
+class ResultadoSolicitud(SQLModel):
+    idRol: int
+    resultado: str  # aprobado | rechazado | no_encontrado | no_pendiente
+
+class ResultadoLote(SQLModel):
+    procesados: int  # cuántos cambiaron de estado
+    resultados: list[ResultadoSolicitud]
@@ -0,0 +1,29 @@
+from typing import Literal, Optional
+
+from pydantic import BaseModel
+
+
+class RolloverCurso(BaseModel):
+    cursoOrigenId: int
+    nombre: str
+    grado: Optional[str] = None
+    division: Optional[str] = None
+    alumnos: int
+    # promovido: pasan al curso del grado siguiente | egresa: grado >= gradoMaximo
+    # sin_destino: no hay curso del grado siguiente con esa división/turno
+    # sin_grado: el grado no es numérico
+    accion: Literal["promovido", "egresa", "sin_destino", "sin_grado"]
+    cursoDestinoId: Optional[int] = None  # en dryRun, None si el curso se va a crear
+
+
+class ResultadoRollover(BaseModel):
+    escuelaId: int
+    cicloOrigen: int
+    cicloDestino: int
+    dryRun: bool
+    cursosCreados: int
+    cursosExistentes: int  # del ciclo destino que ya estaban y se reutilizan
+    alumnosPromovidos: int
+    alumnosEgresados: int
+    cursos: list[RolloverCurso]
+    segundos: float
@@ -0,0 +1,58 @@
+from datetime import date, datetime
+from typing import Any, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from app.core.config import SYNC_LOTE_MAX
+from app.schemas.asistencia import EstadoAsistencia
+
+
+# filas como listas en el orden de `columnas`: mucho menos JSON que un objeto por fila
+class SyncTabla(BaseModel):
+    columnas: list[str]
+    filas: list[list[Any]]
+
+
+class SyncBajas(BaseModel):
+    alumnos: list[int] = []
+    responsables: list[int] = []
+    cursos: list[int] = []
+    vinculos: list[tuple[int, int]] = []  # (idAlumno, idResponsable)
+
+
+# el dispositivo aplica primero las bajas y después las altas/modificaciones
+class SyncCambios(BaseModel):
+    token: str  # para el próximo `since`
+    completo: bool  # sin `since`: es la foto entera, el dispositivo reemplaza lo que tenía
+    cursos: SyncTabla
+    alumnos: SyncTabla
+    responsables: SyncTabla
+    vinculos: SyncTabla
+    bajas: SyncBajas
+
+
+# Asistencia tomada sin conexión y subida después
+class AsistenciaOffline(BaseModel):
+    alumnoId: int
+    cursoId: int
+    fecha: date
+    estado: EstadoAsistencia
+    observacion: Optional[str] = Field(default=None, max_length=255)
+    registradoEn: datetime  # hora del dispositivo al tomarla (gana la más nueva)
+
+
+class AsistenciaOfflineLote(BaseModel):
+    registros: list[AsistenciaOffline] = Field(min_length=1, max_length=SYNC_LOTE_MAX)
+
+
+class ResultadoOffline(BaseModel):
+    alumnoId: int
+    fecha: date
+    # aplicado | descartado: el servidor tiene un registro más nuevo | rechazado: ver detalle
+    resultado: Literal["aplicado", "descartado", "rechazado"]
+    detalle: Optional[str] = None
+
+
+class ResultadoOfflineLote(BaseModel):
+    aplicados: int
+    resultados: list[ResultadoOffline]
@@ -0,0 +1,130 @@
+from collections import defaultdict
+
+from sqlalchemy import delete, exists, null
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.serializacion import columnas_publicas
+from app.models.alumno import Alumno
+from app.models.alumno_responsable import AlumnoResponsable
+from app.models.asistencia import Asistencia, AsistenciaArchivo
+from app.models.curso import Curso
+from app.models.responsable import Responsable
+from app.services.asistencia_resumen import aplicar_cambios
+from app.services.sync_service import registrar_bajas
+from app.schemas.alumno import AlumnoPublic
+from app.schemas.alumno_responsables import (
+    AlumnoDetalleConResponsables,
+    ResponsableConParentesco,
+)
+
+# listado de alumnos: sólo las columnas de AlumnoPublic (lo usan el router, warmup y query_plans)
+COLUMNAS_PUBLICAS = columnas_publicas(AlumnoPublic, Alumno)
+
+
+async def detalles_con_responsables(
+    session: AsyncSession,
+    alumnos: list[Alumno],
+    incluir_responsables: bool = True,
+) -> list[AlumnoDetalleConResponsables]:
+    """Arma el detalle de varios alumnos con UNA query para todos sus responsables.
+
+    Evita el N+1 de pedir /alumnos/{id}/detalle por cada alumno.
+    """
+    por_alumno: dict[int, list[ResponsableConParentesco]] = defaultdict(list)
+
+    if incluir_responsables and alumnos:
+        rows = (await session.exec(
+            select(AlumnoResponsable.idAlumno, AlumnoResponsable.parentesco, Responsable)
+            .join(
+                Responsable,
+                Responsable.idResponsable == AlumnoResponsable.idResponsable,
+            )
+            .where(AlumnoResponsable.idAlumno.in_([a.idAlumno for a in alumnos]))
+        )).all()
+
+        for id_alumno, parentesco, r in rows:
+            por_alumno[id_alumno].append(ResponsableConParentesco(
+                idResponsable=r.idResponsable,
+                nombre=r.nombre,
+                apellido=r.apellido,
+                dni=r.dni,
+                telefono=r.telefono,
+                correo_electronico=r.correo_electronico,
+                parentesco=parentesco,
+            ))
+
+    return [
+        AlumnoDetalleConResponsables(
+            idAlumno=alumno.idAlumno,
+            idCurso=alumno.idCurso,
+            nombre=alumno.nombre,
+            apellido=alumno.apellido,
+            dni=alumno.dni,
+            fechaNac=alumno.fechaNac,
+            fechaIngreso=alumno.fechaIngreso,
+            direccion=alumno.direccion,
+            responsables=por_alumno[alumno.idAlumno],
+        )
+        for alumno in alumnos
+    ]
+
+
+def borrar_alumnos(session: Session, condicion, borrar_huerfanos: bool = False) -> dict[str, int]:
+    """Baja set-based de los alumnos que cumplen `condicion` (sobre columnas de Alumno).
+
+    No hace commit. Descuenta su asistencia de los resúmenes y borra los alumnos
+    con un DELETE: vínculos, asistencia y resúmenes por alumno caen por
+    ON DELETE CASCADE, con sus marcas de baja para el sync offline. Con
+    `borrar_huerfanos` también borra los responsables que se quedan sin ningún alumno.
+    """
+    ids = select(Alumno.idAlumno).where(condicion)
+    # lock de los alumnos antes de leer su asistencia: ver aplicar_cambios
+    session.exec(ids.order_by(Alumno.idAlumno).with_for_update()).all()
+
+    anteriores = [
+        *session.exec(
+            select(Asistencia.idAlumno, Asistencia.fecha, Asistencia.idCurso, Asistencia.estado)
+            .where(Asistencia.idAlumno.in_(ids))
+            .with_for_update()
+        ).all(),
+        # la archivada también cuenta en los resúmenes y también cae por CASCADE
+        *session.exec(
+            select(AsistenciaArchivo.idAlumno, AsistenciaArchivo.fecha, AsistenciaArchivo.idCurso, AsistenciaArchivo.estado)
+            .where(AsistenciaArchivo.idAlumno.in_(ids))
+        ).all(),
+    ]
+    aplicar_cambios(session, anteriores, [])
+
+    # marcas de baja para el sync offline, con la escuela de cada alumno
+    vinculados = session.exec(
+        select(AlumnoResponsable.idAlumno, AlumnoResponsable.idResponsable, Curso.idEscuela)
+        .join(Alumno, Alumno.idAlumno == AlumnoResponsable.idAlumno)
+        .join(Curso, Curso.idCurso == Alumno.idCurso)
+        .where(condicion)
+    ).all()
+    registrar_bajas(session, "alumno", (
+        select(Alumno.idAlumno, null(), Curso.idEscuela)
+        .join(Curso, Curso.idCurso == Alumno.idCurso)
+        .where(condicion)
+    ))
+    registrar_bajas(session, "alumno_responsable", list(vinculados))
+
+    # directo sobre `condicion`: MySQL no deja borrar de una tabla filtrando con una subquery de ella misma
+    alumnos = session.execute(delete(Alumno).where(condicion)).rowcount
+
+    responsables = 0
+    if borrar_huerfanos and vinculados:
+        escuela_de = {id_responsable: id_escuela for _, id_responsable, id_escuela in vinculados}
+        huerfanos = session.exec(
+            select(Responsable.idResponsable).where(
+                Responsable.idResponsable.in_(escuela_de),
+                ~exists().where(AlumnoResponsable.idResponsable == Responsable.idResponsable),
+            )
+        ).all()
+        if huerfanos:
+            registrar_bajas(session, "responsable", [(r, None, escuela_de[r]) for r in huerfanos])
+            responsables = session.execute(
+                delete(Responsable).where(Responsable.idResponsable.in_(huerfanos))
+            ).rowcount
+    return {"alumnos": alumnos, "vinculos": len(vinculados), "responsables": responsables}
@@ -0,0 +1,60 @@
+from datetime import date
+from typing import Callable
+
+from sqlalchemy import delete, insert, union_all, update
+from sqlmodel import Session, select
+
+from app.models.asistencia import Asistencia, AsistenciaArchivo
+from app.models.curso import Curso
+
+# columnas comunes a `asistencia` y `asistencia_archivo`
+COLUMNAS = ["idAlumno", "fecha", "idCurso", "estado", "observacion", "actualizadoEn"]
+
+
+def ciclo_actual() -> int:
+    return date.today().year
+
+
+def incluye_archivo(ciclo_lectivo: int) -> bool:
+    # sólo los ciclos pasados pueden estar archivados
+    return ciclo_lectivo < ciclo_actual()
+
+
+def fuente_asistencia(incluir_archivo: bool, filtro: Callable[[type], list] = lambda t: []):
+    """Asistencia viva (y, si se pide, la archivada) como una sola subquery `asistencia`.
+
+    `filtro(tabla)` arma las condiciones de cada rama, así cada tabla usa sus
+    propios índices antes del UNION ALL.
+    """
+    ramas = [Asistencia, AsistenciaArchivo] if incluir_archivo else [Asistencia]
+    selects = [select(*(getattr(t, c) for c in COLUMNAS)).where(*filtro(t)) for t in ramas]
+    return (union_all(*selects) if len(selects) > 1 else selects[0]).subquery("asistencia")
+
+
+def archivar_ciclo(session: Session, ciclo_lectivo: int, cursos_por_lote: int = 100) -> dict[str, int]:
+    """Mueve la asistencia de un ciclo lectivo a `asistencia_archivo`.
+
+    Por lote de cursos y en una transacción cada uno: cierra los cursos (no
+    admiten asistencia nueva), copia con un INSERT ... SELECT unido a curso y
+    borra de `asistencia` con un DELETE. Los resúmenes no cambian: siguen
+    contando lo archivado. Se puede volver a correr: sólo mueve lo que quede.
+    """
+    cursos = session.exec(
+        select(Curso.idCurso).where(Curso.cicloLectivo == ciclo_lectivo).order_by(Curso.idCurso)
+    ).all()
+
+    filas = 0
+    for i in range(0, len(cursos), cursos_por_lote):
+        ids = cursos[i:i + cursos_por_lote]
+        session.execute(update(Curso).where(Curso.idCurso.in_(ids)).values(cerrado=True))
+        origen = (
+            select(*(getattr(Asistencia, c) for c in COLUMNAS), Curso.cicloLectivo)
+            .join(Curso, Curso.idCurso == Asistencia.idCurso)
+            .where(Asistencia.idCurso.in_(ids))
+        )
+        filas += session.execute(
+            insert(AsistenciaArchivo).from_select(COLUMNAS + ["cicloLectivo"], origen)
+        ).rowcount
+        session.execute(delete(Asistencia).where(Asistencia.idCurso.in_(ids)))
+        session.commit()
+    return {"cursos": len(cursos), "filas": filas}
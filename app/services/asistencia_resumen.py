@@ -0,0 +1,162 @@
+from collections import Counter, defaultdict
+from datetime import date, timedelta
+from typing import Iterable, Optional
+
+from sqlalchemy import Date, case, cast, delete, func, insert
+from sqlmodel import Session, select
+
+from app.db.upsert import upsert
+from app.models.asistencia_resumen import (
+    AsistenciaAlumnoMes,
+    AsistenciaCursoDia,
+    AsistenciaCursoMes,
+    AsistenciaEscuelaDia,
+    AsistenciaEscuelaMes,
+)
+from app.models.curso import Curso
+from app.services.asistencia_archivo import fuente_asistencia
+
+ESTADO_COLUMNA = {
+    "Presente": "presentes",
+    "Ausente": "ausentes",
+    "Tarde": "tardes",
+    "Justificado": "justificados",
+}
+CONTADORES = list(ESTADO_COLUMNA.values())
+
+# tabla -> columnas de la PK (en el orden en que se arman las claves)
+CLAVES = {
+    AsistenciaAlumnoMes: ["idCurso", "mes", "idAlumno"],
+    AsistenciaCursoDia: ["idCurso", "fecha"],
+    AsistenciaCursoMes: ["idCurso", "mes"],
+    AsistenciaEscuelaDia: ["idEscuela", "fecha"],
+    AsistenciaEscuelaMes: ["idEscuela", "mes"],
+}
+
+# (idAlumno, fecha, idCurso, estado)
+Registro = tuple[int, date, int, str]
+
+
+def _sumar(deltas, registro: Registro, id_escuela: int, signo: int) -> None:
+    id_alumno, fecha, id_curso, estado = registro
+    columna = ESTADO_COLUMNA[estado]
+    mes = fecha.replace(day=1)
+    # la clave lleva también las columnas que no son PK (idEscuela en los de curso)
+    for tabla, clave in (
+        (AsistenciaAlumnoMes, (id_curso, mes, id_alumno)),
+        (AsistenciaCursoDia, (id_curso, fecha, id_escuela)),
+        (AsistenciaCursoMes, (id_curso, mes, id_escuela)),
+        (AsistenciaEscuelaDia, (id_escuela, fecha)),
+        (AsistenciaEscuelaMes, (id_escuela, mes)),
+    ):
+        deltas[tabla][clave][columna] += signo
+
+
+def aplicar_cambios(
+    session: Session, anteriores: Iterable[Registro], nuevos: Iterable[Registro]
+) -> None:
+    """Actualiza los resúmenes con la diferencia entre los registros previos y los nuevos.
+
+    No hace commit: se llama dentro de la transacción que escribe la asistencia,
+    con `anteriores` leídos (FOR UPDATE) antes del upsert. Un upsert incremental
+    por tabla de resumen, sin recalcular nada.
+
+    Quien escribe tiene que haber bloqueado antes las filas de `alumno` (SELECT ...
+    FOR UPDATE): el FOR UPDATE de la asistencia no bloquea un (alumno, fecha) que
+    todavía no existe, y dos requests que cargan a la vez el primer registro
+    leerían los dos "sin previo" y lo contarían dos veces.
+    """
+    anteriores, nuevos = list(anteriores), list(nuevos)
+    cursos = {r[2] for r in anteriores} | {r[2] for r in nuevos}
+    if not cursos:
+        return
+    escuela_de = dict(session.exec(
+        select(Curso.idCurso, Curso.idEscuela).where(Curso.idCurso.in_(cursos))
+    ).all())
+
+    deltas = defaultdict(lambda: defaultdict(Counter))
+    for r in anteriores:
+        _sumar(deltas, r, escuela_de[r[2]], -1)
+    for r in nuevos:
+        _sumar(deltas, r, escuela_de[r[2]], +1)
+
+    for tabla, por_clave in deltas.items():
+        columnas = CLAVES[tabla] + (["idEscuela"] if tabla in (AsistenciaCursoDia, AsistenciaCursoMes) else [])
+        rows = [
+            {**dict(zip(columnas, clave)), **{c: cambio[c] for c in CONTADORES}}
+            for clave, cambio in por_clave.items()
+            if any(cambio.values())  # mismo estado que antes: nada que tocar
+        ]
+        upsert(session, tabla.__table__, rows, claves=CLAVES[tabla], actualizar=[], incrementar=CONTADORES)
+
+
+def _mes_sql(dialecto: str, columna):
+    # primer día del mes de `columna`, en SQL de cada motor
+    if dialecto == "sqlite":
+        return func.date(columna, "start of month")
+    if dialecto == "postgresql":
+        return cast(func.date_trunc("month", columna), Date)
+    return func.date_format(columna, "%Y-%m-01")
+
+
+def _fin_de_mes(dia: date) -> date:
+    return (dia.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+
+
+def reconstruir(session: Session, desde: Optional[date] = None, hasta: Optional[date] = None) -> dict[str, int]:
+    """Recalcula los resúmenes desde la asistencia cruda, viva y archivada (backfill o reparación).
+
+    Trabaja por meses completos: `desde` y `hasta` se extienden al mes entero.
+    Borra los resúmenes del rango y los vuelve a armar con un INSERT ... SELECT
+    por tabla, en una transacción.
+    """
+    dialecto = session.get_bind().dialect.name
+    if desde is not None:
+        desde = desde.replace(day=1)
+    if hasta is not None:
+        hasta = _fin_de_mes(hasta)
+
+    def filtro(t) -> list:
+        condiciones = []
+        if desde is not None:
+            condiciones.append(t.fecha >= desde)
+        if hasta is not None:
+            condiciones.append(t.fecha <= hasta)
+        return condiciones
+
+    # también la asistencia archivada: los resúmenes cubren todos los ciclos
+    a = fuente_asistencia(True, filtro)
+    mes = _mes_sql(dialecto, a.c.fecha)
+    conteos = [
+        func.sum(case((a.c.estado == estado, 1), else_=0)) for estado in ESTADO_COLUMNA
+    ]
+    consultas = {
+        AsistenciaAlumnoMes: [a.c.idCurso, mes, a.c.idAlumno],
+        AsistenciaCursoDia: [a.c.idCurso, a.c.fecha, Curso.idEscuela],
+        AsistenciaCursoMes: [a.c.idCurso, mes, Curso.idEscuela],
+        AsistenciaEscuelaDia: [Curso.idEscuela, a.c.fecha],
+        AsistenciaEscuelaMes: [Curso.idEscuela, mes],
+    }
+
+    filas = {}
+    for tabla, grupo in consultas.items():
+        periodo = tabla.fecha if "fecha" in CLAVES[tabla] else tabla.mes
+        borrar = delete(tabla)
+        if desde is not None:
+            borrar = borrar.where(periodo >= desde)
+        if hasta is not None:
+            borrar = borrar.where(periodo <= hasta)
+        session.execute(borrar)
+
+        origen = (
+            select(*grupo, *conteos)
+            .select_from(a)
+            .join(Curso, Curso.idCurso == a.c.idCurso)
+            .group_by(*grupo)
+        )
+        columnas = CLAVES[tabla] + (["idEscuela"] if len(grupo) > len(CLAVES[tabla]) else []) + CONTADORES
+        resultado = session.execute(insert(tabla).from_select(columnas, origen))
+        filas[tabla.__tablename__] = resultado.rowcount
+
+    session.commit()
+    return filas
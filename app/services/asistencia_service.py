@@ -0,0 +1,83 @@
+from datetime import datetime, timezone
+
+from fastapi import HTTPException
+from sqlmodel import Session, select
+
+from app.db.upsert import upsert
+from app.models.alumno import Alumno
+from app.models.asistencia import Asistencia
+from app.schemas.asistencia import AsistenciaCursoCreate
+from app.services.asistencia_resumen import aplicar_cambios
+from app.services.curso_service import exigir_curso_abierto
+
+
+def registrar_asistencia_curso(
+    session: Session, curso_id: int, data: AsistenciaCursoCreate
+) -> int:
+    """Guarda la planilla completa de un curso en una sola transacción.
+
+    1 SELECT ... FOR UPDATE para validar que todos los alumnos pertenecen al curso
+    (bloquea sus filas: ver aplicar_cambios),
+    1 SELECT ... FOR UPDATE de lo que ya estaba cargado ese día,
+    1 INSERT multi-fila (upsert por idAlumno + fecha), los resúmenes
+    (un upsert incremental por tabla) y 1 commit.
+    """
+    exigir_curso_abierto(session, curso_id)
+
+    ids = [r.alumnoId for r in data.registros]
+    if len(set(ids)) != len(ids):
+        raise HTTPException(status_code=422, detail="Alumnos repetidos en la planilla")
+
+    # validación set-based contra Alumno.idCurso; el lock serializa con otras
+    # escrituras de los mismos alumnos hasta el commit
+    validos = set(
+        session.exec(
+            select(Alumno.idAlumno).where(
+                Alumno.idCurso == curso_id,
+                Alumno.idAlumno.in_(ids),
+            )
+            .order_by(Alumno.idAlumno)
+            .with_for_update()
+        ).all()
+    )
+    invalidos = [i for i in ids if i not in validos]
+    if invalidos:
+        raise HTTPException(
+            status_code=422,
+            detail={"mensaje": "Alumnos que no pertenecen al curso", "alumnos": invalidos},
+        )
+
+    # registros previos del día: lo que hay que descontar de los resúmenes
+    anteriores = session.exec(
+        select(Asistencia.idAlumno, Asistencia.fecha, Asistencia.idCurso, Asistencia.estado)
+        .where(Asistencia.fecha == data.fecha, Asistencia.idAlumno.in_(ids))
+        .with_for_update()
+    ).all()
+
+    ahora = datetime.now(timezone.utc).replace(tzinfo=None)
+    rows = [
+        {
+            "idAlumno": r.alumnoId,
+            "fecha": data.fecha,
+            "idCurso": curso_id,
+            "estado": r.estado,
+            "observacion": r.observacion,
+            "actualizadoEn": ahora,
+        }
+        for r in data.registros
+    ]
+
+    upsert(
+        session,
+        Asistencia.__table__,
+        rows,
+        claves=["idAlumno", "fecha"],
+        actualizar=["idCurso", "estado", "observacion", "actualizadoEn"],
+    )
+    aplicar_cambios(
+        session,
+        anteriores,
+        [(r["idAlumno"], r["fecha"], r["idCurso"], r["estado"]) for r in rows],
+    )
+    session.commit()
+    return len(rows)
@@ -0,0 +1,162 @@
+import asyncio
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import ROLES_CACHE_TTL_SECONDS, TOKEN_TTL_SECONDS
+from app.core.tiempo import ahora
+from app.db.upsert import upsert
+from app.models.escuela import Escuela
+from app.models.revocacion_token import RevocacionToken
+from app.models.rol import Rol
+
+logger = logging.getLogger("edupresente.auth")
+
+# idUsuario -> roles habilitados [{idRol, descripcion, idEscuela, nombre_escuela}]
+_roles_cache = TTLCache(maxsize=10_000, ttl=ROLES_CACHE_TTL_SECONDS)
+
+# idEscuela -> {(descripcion, estado): cantidad} (conteos de los listados del director)
+_membresias_cache = TTLCache(maxsize=5_000, ttl=ROLES_CACHE_TTL_SECONDS)
+
+# idUsuario -> momento desde el cual sus tokens anteriores dejan de valer (copia
+# en memoria de `revocacion_token`, refrescada por `refrescar_revocaciones`)
+_revocados: dict[int, float] = {}
+_revocados_lock = threading.Lock()
+
+
+def _stmt_roles(id_usuario: int):
+    return (
+        select(Rol, Escuela)
+        .join(Escuela, Rol.idEscuela == Escuela.idEscuela)
+        .where(Rol.idUsuario == id_usuario)
+    )
+
+
+def _roles_validos(resultados) -> list[dict]:
+    # Sólo los Aprobados (o Admin)
+    return [
+        {
+            "idRol": rol.idRol,
+            "descripcion": rol.descripcion,
+            "idEscuela": escuela.idEscuela,
+            "nombre_escuela": escuela.nombre,
+        }
+        for rol, escuela in resultados
+        if rol.descripcion == "Admin" or rol.estado == "Aprobado"
+    ]
+
+
+def roles_habilitados(session: Session, id_usuario: int) -> list[dict]:
+    """Roles del usuario, cacheados: el join Rol -> Escuela se hace una vez por TTL."""
+    roles = _roles_cache.get(id_usuario)
+    if roles is None:
+        roles = _roles_validos(session.exec(_stmt_roles(id_usuario)).all())
+        _roles_cache.set(id_usuario, roles)
+    return roles
+
+
+async def roles_habilitados_async(session: AsyncSession, id_usuario: int) -> list[dict]:
+    roles = _roles_cache.get(id_usuario)
+    if roles is None:
+        roles = _roles_validos((await session.exec(_stmt_roles(id_usuario))).all())
+        _roles_cache.set(id_usuario, roles)
+    return roles
+
+
+def _stmt_membresias(id_escuela: int):
+    return (
+        select(Rol.descripcion, Rol.estado, func.count())
+        .where(Rol.idEscuela == id_escuela)
+        .group_by(Rol.descripcion, Rol.estado)
+    )
+
+
+async def membresias_escuela_async(session: AsyncSession, id_escuela: int) -> dict[tuple[str, str], int]:
+    """Cantidad de roles de la escuela por (descripcion, estado), cacheada por escuela."""
+    conteos = _membresias_cache.get(id_escuela)
+    if conteos is None:
+        filas = (await session.exec(_stmt_membresias(id_escuela))).all()
+        conteos = {(descripcion, estado): n for descripcion, estado, n in filas}
+        _membresias_cache.set(id_escuela, conteos)
+    return conteos
+
+
+def invalidar_roles(id_usuario: int, id_escuela: Optional[int] = None) -> None:
+    """Llamar cada vez que cambian los roles de un usuario.
+
+    Con `id_escuela`, se descartan también los conteos de miembros de esa escuela.
+    Si además se le quitó un rol que ya tenía aprobado, revocar sus tokens con
+    `revocar_tokens`.
+    """
+    _roles_cache.pop(id_usuario)
+    if id_escuela is not None:
+        _membresias_cache.pop(id_escuela)
+
+
+def _epoch(momento: datetime) -> float:
+    return momento.replace(tzinfo=timezone.utc).timestamp()
+
+
+def revocar_tokens(session: Session, ids_usuario: Iterable[int]) -> None:
+    """Los tokens emitidos hasta ahora a estos usuarios dejan de aceptarse.
+
+    Se guarda en `revocacion_token` dentro de la transacción del llamador (no
+    hace commit): este proceso la aplica enseguida y los demás workers en su
+    próximo refresco (REVOCACIONES_REFRESH_SECONDS).
+    """
+    # redondeado al segundo siguiente (DATETIME de MySQL no guarda fracción):
+    # un token emitido en el mismo segundo nunca queda afuera
+    desde = ahora().replace(microsecond=0) + timedelta(seconds=1)
+    filas = [{"idUsuario": i, "desde": desde} for i in dict.fromkeys(ids_usuario)]
+    upsert(session, RevocacionToken.__table__, filas, claves=["idUsuario"], actualizar=["desde"])
+    with _revocados_lock:
+        for fila in filas:
+            _revocados[fila["idUsuario"]] = _epoch(desde)
+
+
+def refrescar_revocaciones(session: Session) -> int:
+    """Trae de la DB las revocaciones que todavía pueden afectar a un token vigente.
+
+    Las de hace más de TOKEN_TTL_SECONDS ya no importan (esos tokens vencieron):
+    se descartan también de memoria. Una consulta por el índice de `desde`.
+    """
+    global _revocados
+    limite = ahora() - timedelta(seconds=TOKEN_TTL_SECONDS)
+    filas = session.exec(
+        select(RevocacionToken.idUsuario, RevocacionToken.desde).where(RevocacionToken.desde > limite)
+    ).all()
+    with _revocados_lock:
+        vigentes = {i: d for i, d in _revocados.items() if d > _epoch(limite)}
+        for id_usuario, desde in filas:
+            vigentes[id_usuario] = max(vigentes.get(id_usuario, 0), _epoch(desde))
+        # reemplazo de una vez: token_revocado nunca ve el dict a medio armar
+        _revocados = vigentes
+    return len(filas)
+
+
+def cargar_revocaciones(engine: Engine) -> int:
+    # de la primaria: una réplica atrasada demoraría la revocación
+    with Session(engine) as session:
+        return refrescar_revocaciones(session)
+
+
+async def refrescar_revocaciones_periodicamente(engine: Engine, cada: float) -> None:
+    """Tarea del lifespan: revocaciones de otros workers cada `cada` segundos."""
+    while True:
+        await asyncio.sleep(cada)
+        try:
+            await run_in_threadpool(cargar_revocaciones, engine)
+        except Exception:
+            logger.exception("No se pudieron refrescar las revocaciones de tokens")
+
+
+def token_revocado(claims: dict) -> bool:
+    return claims["iat"] <= _revocados.get(claims["sub"], 0)
@@ -0,0 +1,43 @@
+from fastapi import HTTPException
+from sqlalchemy import update
+from sqlmodel import Session
+
+from app.core.serializacion import columnas_publicas
+from app.models.alumno import Alumno
+from app.models.curso import Curso
+from app.schemas.curso import CursoPublic
+from app.services.alumno_service import borrar_alumnos
+
+# listado de cursos: sólo las columnas de CursoPublic
+COLUMNAS_PUBLICAS = columnas_publicas(CursoPublic, Curso)
+
+
+def cerrar_curso(session: Session, curso_id: int, eliminar_alumnos: bool) -> dict[str, int]:
+    """Cierre de fin de ciclo en una transacción y un número fijo de sentencias.
+
+    Marca el curso como cerrado (no admite alumnos ni asistencia nuevos). Con
+    `eliminar_alumnos`, da de baja a los alumnos que siguen en él (egresados o
+    que no pasaron de curso) con un DELETE set-based, junto con sus vínculos y
+    los responsables que quedan sin alumnos; si no, los alumnos quedan
+    archivados en el curso cerrado.
+    """
+    actualizados = session.execute(
+        update(Curso).where(Curso.idCurso == curso_id).values(cerrado=True)
+    ).rowcount
+    if not actualizados:
+        raise HTTPException(status_code=404, detail="Curso no encontrado")
+
+    resultado = {"alumnos": 0, "vinculos": 0, "responsables": 0}
+    if eliminar_alumnos:
+        resultado = borrar_alumnos(session, Alumno.idCurso == curso_id, borrar_huerfanos=True)
+    session.commit()
+    return resultado
+
+
+def exigir_curso_abierto(session: Session, curso_id: int) -> Curso:
+    curso = session.get(Curso, curso_id)
+    if not curso:
+        raise HTTPException(status_code=404, detail="Curso no encontrado")
+    if curso.cerrado:
+        raise HTTPException(status_code=409, detail="El curso está cerrado")
+    return curso
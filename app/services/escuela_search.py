@@ -0,0 +1,66 @@
+from sqlalchemy import and_, case, func, or_
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.texto import normalizar
+from app.models.escuela import Escuela
+
+
+def _stmt_busqueda(dialecto: str, q: str, limit: int):
+    """Búsqueda por nombre/CUE/número/localidad/provincia, ordenada por relevancia.
+
+    - MySQL: MATCH ... AGAINST sobre el índice FULLTEXT ngram de `busqueda`.
+    - Otros motores (SQLite en tests): LIKE por término sobre `busqueda`.
+    En ambos casos, un CUE exacto o por prefijo usa el índice de `cue` y va primero.
+    """
+    terminos = normalizar(q).split()
+    if not terminos:
+        return None
+
+    orden = []
+    cue_q = q.strip()
+    por_cue = case(
+        (Escuela.cue == cue_q, 100),
+        (Escuela.cue.startswith(cue_q, autoescape=True), 50),
+        else_=0,
+    )
+
+    # el parser ngram ignora términos más cortos que ngram_token_size (2)
+    ngram = [t for t in terminos if len(t) >= 2]
+
+    if dialecto == "mysql" and ngram:
+        # +"termino" en boolean mode: todos los términos son obligatorios
+        expr = " ".join(f'+"{t}"' for t in ngram)
+        relevancia = Escuela.busqueda.match(expr)
+        filtro = or_(relevancia > 0, por_cue > 0)
+        score = por_cue + relevancia
+    else:
+        # fallback portable: todos los términos deben aparecer
+        todos = and_(*[Escuela.busqueda.contains(t, autoescape=True) for t in terminos])
+        filtro = or_(todos, por_cue > 0)
+        # más relevante si el término es inicio de palabra y cuanto antes aparezca
+        # (busqueda empieza por el nombre, después cue/localidad/provincia)
+        score = por_cue + case(
+            (Escuela.busqueda.startswith(terminos[0], autoescape=True), 10),
+            (Escuela.busqueda.contains(" " + terminos[0], autoescape=True), 5),
+            else_=1,
+        )
+        orden.append(func.instr(Escuela.busqueda, terminos[0]))
+
+    return (
+        select(Escuela)
+        .where(filtro)
+        .order_by(score.desc(), *orden, Escuela.nombre)
+        .limit(limit)
+    )
+
+
+def buscar_escuelas(session: Session, q: str, limit: int) -> list[Escuela]:
+    stmt = _stmt_busqueda(session.get_bind().dialect.name, q, limit)
+    return session.exec(stmt).all() if stmt is not None else []
+
+
+async def buscar_escuelas_async(session: AsyncSession, q: str, limit: int) -> list[Escuela]:
+    stmt = _stmt_busqueda(session.sync_session.get_bind().dialect.name, q, limit)
+    return (await session.exec(stmt)).all() if stmt is not None else []
+
@@ -0,0 +1,119 @@
+import csv
+import io
+import json
+from typing import Iterator, Literal, Optional
+
+from sqlalchemy import select
+
+from app.core.config import EXPORT_CHUNK_SIZE
+from app.models.alumno import Alumno
+from app.models.alumno_responsable import AlumnoResponsable
+from app.models.curso import Curso
+from app.models.responsable import Responsable
+
+EntidadExport = Literal["alumnos", "responsables", "cursos"]
+FormatoExport = Literal["csv", "ndjson"]
+
+
+def _stmt_export(entidad: EntidadExport, escuela_id: int, ciclo_lectivo: Optional[int]):
+    # Se seleccionan columnas sueltas (tuplas), no objetos ORM: no hay identity map
+    # ni modelos Pydantic en memoria, cada fila se escribe y se descarta.
+    if entidad == "cursos":
+        stmt = select(
+            Curso.idCurso,
+            Curso.idEscuela,
+            Curso.nombre,
+            Curso.grado,
+            Curso.division,
+            Curso.turno,
+            Curso.cicloLectivo,
+        ).order_by(Curso.idCurso)
+    elif entidad == "alumnos":
+        stmt = (
+            select(
+                Alumno.idAlumno,
+                Alumno.idCurso,
+                Alumno.nombre,
+                Alumno.apellido,
+                Alumno.dni,
+                Alumno.fechaNac,
+                Alumno.fechaIngreso,
+                Alumno.direccion,
+            )
+            .join(Curso, Curso.idCurso == Alumno.idCurso)
+            .order_by(Alumno.idAlumno)
+        )
+    else:
+        # un renglón por vínculo alumno-responsable (incluye parentesco)
+        stmt = (
+            select(
+                Responsable.idResponsable,
+                AlumnoResponsable.idAlumno,
+                AlumnoResponsable.parentesco,
+                Responsable.nombre,
+                Responsable.apellido,
+                Responsable.dni,
+                Responsable.telefono,
+                Responsable.correo_electronico,
+            )
+            .join(AlumnoResponsable, AlumnoResponsable.idResponsable == Responsable.idResponsable)
+            .join(Alumno, Alumno.idAlumno == AlumnoResponsable.idAlumno)
+            .join(Curso, Curso.idCurso == Alumno.idCurso)
+            .order_by(Responsable.idResponsable, AlumnoResponsable.idAlumno)
+        )
+
+    stmt = stmt.where(Curso.idEscuela == escuela_id)
+    if ciclo_lectivo is not None:
+        stmt = stmt.where(Curso.cicloLectivo == ciclo_lectivo)
+    return stmt
+
+
+def _iter_chunks(stmt) -> Iterator[tuple[list[str], list]]:
+    # Sesión propia: el generador corre mientras se envía la respuesta,
+    # cuando la sesión de la request ya puede estar cerrada. Se importa acá para
+    # que armar las consultas (query_plans) no cree el engine de DATABASE_URL.
+    from app.db.database import DBSession
+
+    with DBSession() as session:
+        result = session.execute(
+            stmt,
+            execution_options={"stream_results": True, "yield_per": EXPORT_CHUNK_SIZE},
+        )
+        columnas = list(result.keys())
+        for chunk in result.partitions():
+            yield columnas, chunk
+
+
+def stream_export(
+    entidad: EntidadExport,
+    formato: FormatoExport,
+    escuela_id: int,
+    ciclo_lectivo: Optional[int] = None,
+) -> Iterator[str]:
+    """Genera el export por tandas de EXPORT_CHUNK_SIZE filas (cursor del lado del servidor)."""
+    stmt = _stmt_export(entidad, escuela_id, ciclo_lectivo)
+
+    if formato == "ndjson":
+        for columnas, chunk in _iter_chunks(stmt):
+            yield "".join(
+                json.dumps(dict(zip(columnas, row)), default=str, ensure_ascii=False) + "\n"
+                for row in chunk
+            )
+        return
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    encabezado = True
+    for columnas, chunk in _iter_chunks(stmt):
+        if encabezado:
+            writer.writerow(columnas)
+            encabezado = False
+        writer.writerows(chunk)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    if encabezado:
+        # export vacío: igual devolvemos el encabezado
+        writer.writerow(stmt.selected_columns.keys())
+        yield buffer.getvalue()
@@ -0,0 +1,254 @@
+import csv
+import time
+from typing import BinaryIO, Iterator
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import Session, select
+
+from app.models.alumno import Alumno
+from app.models.alumno_responsable import AlumnoResponsable
+from app.models.curso import Curso
+from app.models.responsable import Responsable
+from app.schemas.alumno import AlumnoCreate
+from app.schemas.importacion import ErrorImportacion, ResultadoImportacion
+from app.schemas.responsable import ResponsableCreate
+
+# Columnas esperadas en el CSV (las de responsable son opcionales por fila)
+COLUMNAS_ALUMNO = ["cursoId", "nombre", "apellido", "dni", "fechaNac", "fechaIngreso", "direccion"]
+COLUMNAS_RESPONSABLE = {
+    "responsableNombre": "nombre",
+    "responsableApellido": "apellido",
+    "responsableDni": "dni",
+    "responsableTelefono": "telefono",
+    "responsableCorreo": "correo_electronico",
+}
+
+
+def _leer_csv(archivo: BinaryIO, chunk_size: int) -> Iterator[list[tuple[int, dict]]]:
+    # Se lee línea a línea del archivo subido: nunca se carga el CSV entero.
+    # Cada línea se decodifica aparte para poder informar en cuál falla.
+    leidas = 0
+
+    def lineas() -> Iterator[str]:
+        nonlocal leidas
+        for crudo in archivo:
+            leidas += 1
+            yield crudo.decode("utf-8-sig" if leidas == 1 else "utf-8")
+
+    reader = csv.DictReader(lineas())
+    chunk: list[tuple[int, dict]] = []
+    try:
+        for row in reader:
+            chunk.append((reader.line_num, row))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=422, detail=f"CSV inválido en la línea {leidas}: no está en UTF-8")
+    except csv.Error as exc:
+        raise HTTPException(status_code=422, detail=f"CSV inválido en la línea {leidas}: {exc}")
+    if chunk:
+        yield chunk
+
+
+def _vacio_a_none(valor):
+    if valor is None:
+        return None
+    valor = valor.strip()
+    return valor or None
+
+
+def _parsear_fila(row: dict) -> tuple[AlumnoCreate, ResponsableCreate | None, str | None]:
+    alumno = AlumnoCreate(**{c: _vacio_a_none(row.get(c)) for c in COLUMNAS_ALUMNO})
+
+    if not _vacio_a_none(row.get("responsableDni")):
+        return alumno, None, None
+
+    responsable = ResponsableCreate(
+        **{campo: _vacio_a_none(row.get(col)) for col, campo in COLUMNAS_RESPONSABLE.items()}
+    )
+    parentesco = _vacio_a_none(row.get("parentesco"))
+    if not parentesco:
+        raise ValueError("Falta parentesco del responsable")
+    return alumno, responsable, parentesco
+
+
+def _error_validacion(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(p) for p in e['loc'])}: {e['msg']}" for e in exc.errors()
+    )
+
+
+def importar_alumnos_csv(
+    session: Session,
+    escuela_id: int,
+    archivo: BinaryIO,
+    chunk_size: int,
+) -> ResultadoImportacion:
+    """Importa alumnos + responsables + vínculos de un CSV en transacciones por tanda.
+
+    Por tanda: 1 SELECT de responsables por DNI, 1 SELECT de alumnos ya cargados,
+    INSERTs multi-fila (alumnos, responsables nuevos y vínculos), 1 SELECT de
+    las PK creadas por DNI y 1 commit. Un CSV mal codificado o malformado
+    corta con 422 y la línea; las tandas anteriores quedan guardadas.
+    """
+    inicio = time.perf_counter()
+    resultado = ResultadoImportacion(
+        filas=0,
+        alumnosCreados=0,
+        responsablesCreados=0,
+        responsablesExistentes=0,
+        vinculosCreados=0,
+        chunkSize=chunk_size,
+        segundos=0,
+        filasPorSegundo=0,
+    )
+
+    # cursos de la escuela (una sola vez: son pocos); a los cerrados no se suman
+    # alumnos, como en create_alumno (exigir_curso_abierto)
+    cerrado_por_curso = dict(
+        session.exec(select(Curso.idCurso, Curso.cerrado).where(Curso.idEscuela == escuela_id)).all()
+    )
+    cursos_escuela = set(cerrado_por_curso)
+
+    for chunk in _leer_csv(archivo, chunk_size):
+        resultado.filas += len(chunk)
+        errores: list[ErrorImportacion] = []
+
+        # 1. Validación fila por fila (en memoria)
+        filas = []
+        for linea, row in chunk:
+            try:
+                alumno, responsable, parentesco = _parsear_fila(row)
+            except ValidationError as exc:
+                errores.append(ErrorImportacion(fila=linea, detalle=_error_validacion(exc)))
+                continue
+            except ValueError as exc:
+                errores.append(ErrorImportacion(fila=linea, detalle=str(exc)))
+                continue
+
+            if alumno.cursoId not in cursos_escuela:
+                errores.append(ErrorImportacion(
+                    fila=linea, detalle=f"El curso {alumno.cursoId} no pertenece a la escuela"
+                ))
+                continue
+            if cerrado_por_curso[alumno.cursoId]:
+                errores.append(ErrorImportacion(fila=linea, detalle=f"El curso {alumno.cursoId} está cerrado"))
+                continue
+            filas.append((linea, alumno, responsable, parentesco))
+
+        # 2. Alumnos ya cargados en la escuela (1 query por tanda)
+        dnis_alumnos = {a.dni for _, a, _, _ in filas}
+        existentes = set(
+            session.exec(
+                select(Alumno.dni).where(
+                    Alumno.dni.in_(dnis_alumnos),
+                    Alumno.idCurso.in_(cursos_escuela),
+                )
+            ).all()
+        ) if dnis_alumnos else set()
+
+        vistos = set()
+        nuevas = []
+        for linea, alumno, responsable, parentesco in filas:
+            if alumno.dni in existentes or alumno.dni in vistos:
+                errores.append(ErrorImportacion(
+                    fila=linea, detalle=f"Alumno con DNI {alumno.dni} ya existe"
+                ))
+                continue
+            vistos.add(alumno.dni)
+            nuevas.append((linea, alumno, responsable, parentesco))
+
+        try:
+            creados = _insertar_tanda(session, nuevas)
+            session.commit()
+        except SQLAlchemyError as exc:
+            session.rollback()
+            errores.extend(
+                ErrorImportacion(fila=linea, detalle=f"Error al guardar la tanda: {exc.__class__.__name__}")
+                for linea, _, _, _ in nuevas
+            )
+        else:
+            resultado.alumnosCreados += creados["alumnos"]
+            resultado.responsablesCreados += creados["responsables"]
+            resultado.responsablesExistentes += creados["responsablesExistentes"]
+            resultado.vinculosCreados += creados["vinculos"]
+
+        resultado.errores.extend(sorted(errores, key=lambda e: e.fila))
+
+    resultado.segundos = round(time.perf_counter() - inicio, 3)
+    if resultado.segundos > 0:
+        resultado.filasPorSegundo = round(resultado.filas / resultado.segundos, 1)
+    return resultado
+
+
+def _insertar_tanda(session: Session, filas: list) -> dict:
+    if not filas:
+        return {"alumnos": 0, "responsables": 0, "responsablesExistentes": 0, "vinculos": 0}
+
+    # Responsables: dedupe por DNI con una sola búsqueda (Responsable.dni está indexado)
+    por_dni = {r.dni: r for _, _, r, _ in filas if r is not None}
+    ids_responsable = dict(
+        session.exec(
+            select(Responsable.dni, Responsable.idResponsable).where(
+                Responsable.dni.in_(por_dni)
+            )
+        ).all()
+    ) if por_dni else {}
+    existentes = len(ids_responsable)
+
+    nuevos_resp = [r for dni, r in por_dni.items() if dni not in ids_responsable]
+    # INSERT multi-fila (Core) + 1 SELECT por DNI para las PK: sin RETURNING
+    # (MySQL), un flush de objetos ORM manda un INSERT por fila
+    if nuevos_resp:
+        session.execute(insert(Responsable.__table__), [r.model_dump() for r in nuevos_resp])
+        ids_responsable.update(session.exec(
+            select(Responsable.dni, Responsable.idResponsable).where(
+                Responsable.dni.in_([r.dni for r in nuevos_resp])
+            )
+        ).all())
+
+    session.execute(insert(Alumno.__table__), [
+        {
+            "idCurso": a.cursoId,
+            "nombre": a.nombre,
+            "apellido": a.apellido,
+            "dni": a.dni,
+            "fecha_nacimiento": a.fechaNac,  # claves = nombres de columna (Core)
+            "fecha_ingreso": a.fechaIngreso,
+            "direccion": a.direccion,
+        }
+        for _, a, _, _ in filas
+    ])
+    # los DNI de la tanda no se repiten dentro de la escuela (se filtraron antes)
+    ids_alumno = dict(session.exec(
+        select(Alumno.dni, Alumno.idAlumno).where(
+            Alumno.dni.in_([a.dni for _, a, _, _ in filas]),
+            Alumno.idCurso.in_({a.cursoId for _, a, _, _ in filas}),
+        )
+    ).all())
+
+    vinculos = {}
+    for _, alumno, responsable, parentesco in filas:
+        if responsable is not None:
+            clave = (ids_alumno[alumno.dni], ids_responsable[responsable.dni])
+            vinculos[clave] = parentesco
+
+    if vinculos:
+        session.execute(
+            insert(AlumnoResponsable.__table__),
+            [
+                {"idAlumno": a, "idResponsable": r, "parentesco": p}
+                for (a, r), p in vinculos.items()
+            ],
+        )
+
+    return {
+        "alumnos": len(filas),
+        "responsables": len(nuevos_resp),
+        "responsablesExistentes": existentes,
+        "vinculos": len(vinculos),
+    }
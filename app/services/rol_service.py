@@ -0,0 +1,112 @@
+from typing import Literal, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import delete, update
+from sqlmodel import Session, select
+
+from app.models.rol import Rol
+from app.models.usuario import Usuario
+from app.schemas.rol import ResultadoLote, ResultadoSolicitud
+from app.services.auth_service import invalidar_roles
+
+Resultado = Literal["aprobado", "rechazado", "no_encontrado", "no_pendiente"]
+
+
+def _stmt_miembros(escuela_id: int, descripcion: str, estado: str):
+    # Rol ⋈ Usuario por (idEscuela, descripcion, estado): usa ix_rol_escuela_desc_estado
+    return (
+        select(
+            Rol.idRol,
+            Rol.idUsuario,
+            Rol.descripcion,
+            Rol.estado,
+            Usuario.dni,
+            Usuario.nombre,
+            Usuario.apellido,
+            Usuario.mailABC,
+            Usuario.celular,
+        )
+        .join(Usuario, Usuario.idUsuario == Rol.idUsuario)
+        .where(
+            Rol.idEscuela == escuela_id,
+            Rol.descripcion == descripcion,
+            Rol.estado == estado,
+        )
+    )
+
+
+def resolver_solicitudes(
+    session: Session,
+    ids_rol: list[int],
+    aprobar: bool,
+    descripcion: Optional[str] = None,
+    id_escuela: Optional[int] = None,
+) -> list[tuple[int, Resultado]]:
+    """Aprueba o rechaza en lote solicitudes de rol pendientes, en una transacción.
+
+    1 SELECT ... FOR UPDATE de los roles pedidos, 1 UPDATE (aprobar) o DELETE
+    (rechazar) para todos los que siguen "Pendiente" y 1 commit. El lock y el
+    `WHERE estado = 'Pendiente'` hacen que dos admins resolviendo a la vez no
+    pisen la decisión del otro: el segundo recibe "no_pendiente" o "no_encontrado".
+
+    `descripcion` / `id_escuela` acotan qué roles puede tocar quien llama (por
+    ejemplo, el director sólo los Docentes de su escuela); los que no cumplen se
+    informan como "no_encontrado".
+    """
+    ids = list(dict.fromkeys(ids_rol))  # sin repetidos, en el orden pedido
+    filas = {
+        f.idRol: f
+        for f in session.exec(
+            select(Rol.idRol, Rol.idUsuario, Rol.idEscuela, Rol.descripcion, Rol.estado)
+            .where(Rol.idRol.in_(ids))
+            .with_for_update()
+        ).all()
+        if (descripcion is None or f.descripcion == descripcion)
+        and (id_escuela is None or f.idEscuela == id_escuela)
+    }
+
+    pendientes = [i for i in ids if i in filas and filas[i].estado == "Pendiente"]
+    if pendientes:
+        condicion = (Rol.idRol.in_(pendientes), Rol.estado == "Pendiente")
+        if aprobar:
+            session.execute(update(Rol).where(*condicion).values(estado="Aprobado"))
+        else:
+            session.execute(delete(Rol).where(*condicion))
+    session.commit()
+
+    for i in pendientes:
+        invalidar_roles(filas[i].idUsuario, id_escuela=filas[i].idEscuela)
+
+    hecho: Resultado = "aprobado" if aprobar else "rechazado"
+    return [
+        (i, hecho if i in pendientes else "no_pendiente" if i in filas else "no_encontrado")
+        for i in ids
+    ]
+
+
+def lote_a_respuesta(resultados: list[tuple[int, Resultado]]) -> ResultadoLote:
+    return ResultadoLote(
+        procesados=sum(r in ("aprobado", "rechazado") for _, r in resultados),
+        resultados=[ResultadoSolicitud(idRol=i, resultado=r) for i, r in resultados],
+    )
+
+
+def resolver_solicitud(
+    session: Session, id_usuario: int, id_escuela: int, descripcion: str, aprobar: bool
+) -> None:
+    """Aprobación/rechazo individual: misma transición que el lote, para que no se contradigan."""
+    id_rol = session.exec(
+        select(Rol.idRol).where(
+            Rol.idUsuario == id_usuario,
+            Rol.idEscuela == id_escuela,
+            Rol.descripcion == descripcion,
+        )
+    ).first()
+    if id_rol is None:
+        raise HTTPException(status_code=404, detail="Solicitud no encontrada")
+
+    [(_, resultado)] = resolver_solicitudes(session, [id_rol], aprobar, descripcion=descripcion)
+    if resultado == "no_encontrado":  # otro admin la rechazó entre el SELECT y el lock
+        raise HTTPException(status_code=404, detail="Solicitud no encontrada")
+    if resultado == "no_pendiente":
+        raise HTTPException(status_code=409, detail="La solicitud ya fue resuelta")
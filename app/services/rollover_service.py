@@ -0,0 +1,139 @@
+import re
+import time
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy import case, func, insert, update
+from sqlmodel import Session, select
+
+from app.models.alumno import Alumno
+from app.models.curso import Curso
+from app.schemas.rollover import ResultadoRollover, RolloverCurso
+
+_GRADO = re.compile(r"^\s*(\d+)")
+
+
+def _grado(grado: Optional[str]) -> Optional[int]:
+    m = _GRADO.match(grado or "")
+    return int(m.group(1)) if m else None
+
+
+def rollover_escuela(
+    session: Session,
+    escuela_id: int,
+    ciclo_origen: int,
+    dry_run: bool = False,
+    grado_maximo: Optional[int] = None,
+) -> ResultadoRollover:
+    """Pasa una escuela al ciclo lectivo siguiente en una transacción.
+
+    Clona la estructura de cursos de `ciclo_origen` en el ciclo siguiente (un
+    INSERT multi-fila; reutiliza los cursos que ya existan) y mueve a cada
+    alumno al curso del grado siguiente con la misma división y turno (un
+    UPDATE con CASE sobre idCurso). Los de `grado_maximo` (default: el mayor
+    grado del ciclo) egresan y quedan en su curso. Los cursos de origen quedan
+    cerrados. En `dry_run` sólo calcula, no escribe.
+    """
+    inicio = time.perf_counter()
+    ciclo_destino = ciclo_origen + 1
+
+    origen = session.exec(
+        select(Curso)
+        .where(Curso.idEscuela == escuela_id, Curso.cicloLectivo == ciclo_origen)
+        .order_by(Curso.idCurso)
+        .with_for_update()
+    ).all()
+    if not origen:
+        raise HTTPException(status_code=404, detail="La escuela no tiene cursos en ese ciclo lectivo")
+    if grado_maximo is None:
+        grado_maximo = max((g for c in origen if (g := _grado(c.grado)) is not None), default=0)
+
+    def destino_actual() -> dict[tuple, int]:
+        # (grado, división, turno) -> idCurso en el ciclo destino
+        return {
+            (g, d, t): i for g, d, t, i in session.exec(
+                select(Curso.grado, Curso.division, Curso.turno, Curso.idCurso)
+                .where(Curso.idEscuela == escuela_id, Curso.cicloLectivo == ciclo_destino)
+            ).all()
+        }
+
+    # la estructura del ciclo destino es la del origen: se crea lo que falte
+    destino = destino_actual()
+    existentes = len(destino)
+    faltan = list({
+        (c.grado, c.division, c.turno): c for c in origen
+        if (c.grado, c.division, c.turno) not in destino
+    }.values())
+    if faltan and not dry_run:
+        session.execute(insert(Curso), [
+            {
+                "idEscuela": escuela_id,
+                "nombre": c.nombre,
+                "grado": c.grado,
+                "division": c.division,
+                "turno": c.turno,
+                "cicloLectivo": ciclo_destino,
+            }
+            for c in faltan
+        ])
+        destino = destino_actual()
+    # en dryRun los que faltan no tienen id todavía
+    por_grado = {(_grado(g), d, t): i for (g, d, t), i in destino.items()}
+    por_grado.update({(_grado(c.grado), c.division, c.turno): None for c in faltan if dry_run})
+
+    ids_origen = [c.idCurso for c in origen]
+    alumnos = dict(session.exec(
+        select(Alumno.idCurso, func.count())
+        .where(Alumno.idCurso.in_(ids_origen))
+        .group_by(Alumno.idCurso)
+    ).all())
+
+    cursos, movimientos = [], {}
+    for c in origen:
+        grado = _grado(c.grado)
+        clave = (None if grado is None else grado + 1, c.division, c.turno)
+        if grado is None:
+            accion = "sin_grado"
+        elif grado >= grado_maximo:
+            accion = "egresa"
+        elif clave in por_grado:
+            accion = "promovido"
+        else:
+            accion = "sin_destino"
+        id_destino = por_grado.get(clave) if accion == "promovido" else None
+        if accion == "promovido" and id_destino is not None and alumnos.get(c.idCurso):
+            movimientos[c.idCurso] = id_destino
+        cursos.append(RolloverCurso(
+            cursoOrigenId=c.idCurso,
+            nombre=c.nombre,
+            grado=c.grado,
+            division=c.division,
+            alumnos=alumnos.get(c.idCurso, 0),
+            accion=accion,
+            cursoDestinoId=id_destino,
+        ))
+
+    if dry_run:
+        session.rollback()
+    else:
+        if movimientos:
+            session.execute(
+                update(Alumno)
+                .where(Alumno.idCurso.in_(list(movimientos)))
+                .values(idCurso=case(movimientos, value=Alumno.idCurso))
+            )
+        session.execute(update(Curso).where(Curso.idCurso.in_(ids_origen)).values(cerrado=True))
+        session.commit()
+
+    return ResultadoRollover(
+        escuelaId=escuela_id,
+        cicloOrigen=ciclo_origen,
+        cicloDestino=ciclo_destino,
+        dryRun=dry_run,
+        cursosCreados=len(faltan),
+        cursosExistentes=existentes,
+        alumnosPromovidos=sum(r.alumnos for r in cursos if r.accion == "promovido"),
+        alumnosEgresados=sum(r.alumnos for r in cursos if r.accion == "egresa"),
+        cursos=cursos,
+        segundos=round(time.perf_counter() - inicio, 3),
+    )
@@ -0,0 +1,246 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy import DateTime, insert, literal, or_, select as sa_select
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import SYNC_MARGEN_SEGUNDOS
+from app.core.tiempo import ahora
+from app.db.upsert import upsert
+from app.models.alumno import Alumno
+from app.models.alumno_responsable import AlumnoResponsable
+from app.models.asistencia import Asistencia
+from app.models.curso import Curso
+from app.models.responsable import Responsable
+from app.models.sync import SyncBaja
+from app.schemas.sync import AsistenciaOffline, ResultadoOffline, SyncBajas, SyncCambios, SyncTabla
+from app.services.asistencia_resumen import aplicar_cambios
+
+# columnas que baja el dispositivo, por entidad
+COLUMNAS = {
+    "cursos": [Curso.idCurso, Curso.nombre, Curso.grado, Curso.division, Curso.turno,
+               Curso.cicloLectivo, Curso.cerrado],
+    "alumnos": [Alumno.idAlumno, Alumno.idCurso, Alumno.nombre, Alumno.apellido, Alumno.dni,
+                Alumno.fechaNac, Alumno.fechaIngreso, Alumno.direccion],
+    "responsables": [Responsable.idResponsable, Responsable.nombre, Responsable.apellido,
+                     Responsable.dni, Responsable.telefono, Responsable.correo_electronico],
+    "vinculos": [AlumnoResponsable.idAlumno, AlumnoResponsable.idResponsable, AlumnoResponsable.parentesco],
+}
+
+
+# --------------------------------------------------
+# Tokens: milisegundos UTC, opacos para el cliente
+# --------------------------------------------------
+def armar_token(momento: datetime) -> str:
+    return str(int(momento.replace(tzinfo=timezone.utc).timestamp() * 1000))
+
+
+def leer_token(token: str) -> datetime:
+    try:
+        return datetime.fromtimestamp(int(token) / 1000, timezone.utc).replace(tzinfo=None)
+    except (ValueError, OverflowError, OSError):
+        raise HTTPException(status_code=422, detail="Token de sync inválido")
+
+
+# --------------------------------------------------
+# Bajas (tombstones)
+# --------------------------------------------------
+def registrar_bajas(session: Session, entidad: str, origen) -> None:
+    """Deja la marca de baja de filas que se van a borrar. No hace commit.
+
+    `origen` es un SELECT o una lista de tuplas (idEntidad, idRelacionado,
+    idEscuela): con un SELECT las marcas se copian con un INSERT ... SELECT.
+    """
+    borrado = ahora()
+    if isinstance(origen, list):
+        if origen:
+            session.execute(insert(SyncBaja), [
+                {"entidad": entidad, "idEntidad": a, "idRelacionado": b, "idEscuela": e, "borradoEn": borrado}
+                for a, b, e in origen
+            ])
+        return
+    sub = origen.subquery()
+    session.execute(insert(SyncBaja).from_select(
+        ["entidad", "idEntidad", "idRelacionado", "idEscuela", "borradoEn"],
+        sa_select(literal(entidad), *sub.c, literal(borrado, DateTime)),
+    ))
+
+
+# --------------------------------------------------
+# Bajada: lo que cambió en una escuela desde el token
+# --------------------------------------------------
+def _tabla(columnas, filas) -> SyncTabla:
+    return SyncTabla(columnas=[c.key for c in columnas], filas=[list(f) for f in filas])
+
+
+async def cambios_escuela_async(
+    session: AsyncSession, escuela_id: int, desde: Optional[datetime]
+) -> SyncCambios:
+    """Cursos, alumnos, responsables y vínculos de la escuela cambiados desde `desde`.
+
+    Sin `desde`, la foto completa. Una consulta por entidad, columnas sueltas
+    (sin objetos ORM), por el índice de `actualizadoEn`.
+    """
+    # el próximo sync arranca un poco antes de ahora: lo que se reenvía se pisa igual
+    token = armar_token(ahora() - timedelta(seconds=SYNC_MARGEN_SEGUNDOS))
+
+    def desde_(columna) -> list:
+        return [columna >= desde] if desde is not None else []
+
+    ar = AlumnoResponsable
+    vinculos_escuela = (
+        sa_select(*COLUMNAS["vinculos"])
+        .join(Alumno, Alumno.idAlumno == ar.idAlumno)
+        .join(Curso, Curso.idCurso == Alumno.idCurso)
+        .where(Curso.idEscuela == escuela_id)
+    )
+    en_escuela = vinculos_escuela.with_only_columns(ar.idResponsable)
+    responsables = sa_select(*COLUMNAS["responsables"]).where(Responsable.idResponsable.in_(en_escuela))
+    if desde is not None:
+        # responsable editado, o vinculado hace poco a un alumno de la escuela
+        responsables = responsables.where(or_(
+            Responsable.actualizadoEn >= desde,
+            Responsable.idResponsable.in_(en_escuela.where(ar.actualizadoEn >= desde)),
+        ))
+
+    consultas = {
+        "cursos": sa_select(*COLUMNAS["cursos"]).where(
+            Curso.idEscuela == escuela_id, *desde_(Curso.actualizadoEn),
+        ),
+        "alumnos": (
+            sa_select(*COLUMNAS["alumnos"])
+            .join(Curso, Curso.idCurso == Alumno.idCurso)
+            .where(Curso.idEscuela == escuela_id, *desde_(Alumno.actualizadoEn))
+        ),
+        "responsables": responsables,
+        "vinculos": vinculos_escuela.where(*desde_(ar.actualizadoEn)),
+    }
+    tablas = {
+        nombre: _tabla(COLUMNAS[nombre], (await session.exec(stmt)).all())
+        for nombre, stmt in consultas.items()
+    }
+
+    bajas = SyncBajas()
+    if desde is not None:
+        filas = (await session.exec(
+            sa_select(SyncBaja.entidad, SyncBaja.idEntidad, SyncBaja.idRelacionado)
+            .where(
+                or_(SyncBaja.idEscuela == escuela_id, SyncBaja.idEscuela.is_(None)),
+                SyncBaja.borradoEn >= desde,
+            )
+        )).all()
+        for entidad, id_entidad, id_relacionado in filas:
+            if entidad == "alumno_responsable":
+                bajas.vinculos.append((id_entidad, id_relacionado))
+            else:
+                getattr(bajas, f"{entidad}s").append(id_entidad)
+
+    return SyncCambios(token=token, completo=desde is None, bajas=bajas, **tablas)
+
+
+# --------------------------------------------------
+# Subida: asistencia tomada sin conexión
+# --------------------------------------------------
+def _utc(momento: datetime) -> datetime:
+    if momento.tzinfo is not None:
+        momento = momento.astimezone(timezone.utc).replace(tzinfo=None)
+    return momento
+
+
+def subir_asistencia_offline(
+    session: Session, registros: list[AsistenciaOffline]
+) -> list[ResultadoOffline]:
+    """Aplica un lote de asistencia offline (varios cursos y fechas) en una transacción.
+
+    Conflictos por alumno y fecha: gana el registro más nuevo (last-writer-wins
+    con `registradoEn`, que no puede quedar en el futuro del servidor). 2 SELECT
+    de validación (el de alumnos, FOR UPDATE), 1 SELECT ... FOR UPDATE de lo ya
+    cargado, 1 upsert multi-fila, los resúmenes y 1 commit.
+    """
+    tope = ahora()
+    # dentro del lote también gana el más nuevo por (alumno, fecha)
+    ultimo: dict[tuple, AsistenciaOffline] = {}
+    for r in registros:
+        clave = (r.alumnoId, r.fecha)
+        if clave not in ultimo or _utc(r.registradoEn) > _utc(ultimo[clave].registradoEn):
+            ultimo[clave] = r
+
+    # con lock de los alumnos: ver aplicar_cambios
+    curso_de = dict(session.exec(
+        select(Alumno.idAlumno, Alumno.idCurso)
+        .where(Alumno.idAlumno.in_({r.alumnoId for r in registros}))
+        .order_by(Alumno.idAlumno)
+        .with_for_update()
+    ).all())
+    cerrado = dict(session.exec(
+        select(Curso.idCurso, Curso.cerrado).where(Curso.idCurso.in_({r.cursoId for r in registros}))
+    ).all())
+
+    resultado: dict[int, tuple[str, Optional[str]]] = {}  # id(registro) -> (resultado, detalle)
+    validos = []
+    for r in registros:
+        if ultimo[(r.alumnoId, r.fecha)] is not r:
+            resultado[id(r)] = ("descartado", "Hay un registro más nuevo en el mismo lote")
+        elif r.cursoId not in cerrado:
+            resultado[id(r)] = ("rechazado", "Curso no encontrado")
+        elif cerrado[r.cursoId]:
+            resultado[id(r)] = ("rechazado", "El curso está cerrado")
+        elif curso_de.get(r.alumnoId) != r.cursoId:
+            resultado[id(r)] = ("rechazado", "El alumno no pertenece al curso")
+        else:
+            validos.append(r)
+
+    existentes = {
+        (a.idAlumno, a.fecha): a
+        for a in session.exec(
+            select(Asistencia.idAlumno, Asistencia.fecha, Asistencia.idCurso, Asistencia.estado,
+                   Asistencia.actualizadoEn)
+            .where(
+                Asistencia.idAlumno.in_({r.alumnoId for r in validos}),
+                Asistencia.fecha.in_({r.fecha for r in validos}),
+            )
+            .with_for_update()
+        ).all()
+    } if validos else {}
+
+    rows, anteriores = [], []
+    for r in validos:
+        registrado = min(_utc(r.registradoEn), tope)
+        previo = existentes.get((r.alumnoId, r.fecha))
+        if previo is not None and previo.actualizadoEn >= registrado:
+            resultado[id(r)] = ("descartado", "El servidor tiene un registro más nuevo")
+            continue
+        if previo is not None:
+            anteriores.append((previo.idAlumno, previo.fecha, previo.idCurso, previo.estado))
+        rows.append({
+            "idAlumno": r.alumnoId,
+            "fecha": r.fecha,
+            "idCurso": r.cursoId,
+            "estado": r.estado,
+            "observacion": r.observacion,
+            "actualizadoEn": registrado,
+        })
+        resultado[id(r)] = ("aplicado", None)
+
+    if rows:
+        upsert(
+            session,
+            Asistencia.__table__,
+            rows,
+            claves=["idAlumno", "fecha"],
+            actualizar=["idCurso", "estado", "observacion", "actualizadoEn"],
+        )
+        aplicar_cambios(
+            session,
+            anteriores,
+            [(r["idAlumno"], r["fecha"], r["idCurso"], r["estado"]) for r in rows],
+        )
+    session.commit()
+
+    return [
+        ResultadoOffline(alumnoId=r.alumnoId, fecha=r.fecha, resultado=resultado[id(r)][0],
+                         detalle=resultado[id(r)][1])
+        for r in registros
+    ]
@@ -0,0 +1,220 @@
+"""Benchmark de la API completa, en proceso (ASGI, sin red).
+
+Siembra un dataset reproducible (benchmarks/dataset.py), corre cada escenario
+con N clientes concurrentes y reporta throughput y percentiles de latencia en
+JSON. Si hay un baseline guardado para el perfil, compara y sale con código 1
+ante una regresión.
+
+    python -m benchmarks.api                                # SQLite temporal, perfil "chico"
+    python -m benchmarks.api --db mysql+mysqldb://root:pw@localhost/edu_bench
+    python -m benchmarks.api --perfil medio --concurrencia 32
+    python -m benchmarks.api --guardar-baseline             # fija el baseline actual
+
+Los baselines dependen de la máquina: regenerarlos al cambiar de hardware.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PERFILES = {
+    "chico": dict(escuelas=5, cursos=6, alumnos=25, responsables=2),
+    "medio": dict(escuelas=20, cursos=10, alumnos=30, responsables=2),
+    "grande": dict(escuelas=100, cursos=12, alumnos=30, responsables=2),
+}
+BASELINES = Path(__file__).parent / "baselines"
+
+
+def _escenarios(ds, rnd: random.Random):
+    """Nombre -> (fracción de --requests, función que arma la request)."""
+    from app.core.security import crear_token
+    from benchmarks.dataset import PARENTESCOS, PASSWORD
+
+    # las rutas de admin sólo leen los claims del token: no hace falta un usuario real
+    admin = {"Authorization": "Bearer " + crear_token({"sub": 0, "rol": 0, "desc": "Admin", "esc": 0})}
+
+    def login():
+        return "POST", "/login", {"json": {"dni": rnd.choice(ds.dnis_usuarios), "password": PASSWORD}}
+
+    def alumnos_lista():
+        return "GET", "/alumnos/", {"params": {"cursoId": rnd.choice(ds.cursos)}}
+
+    def alumno_detalle():
+        return "GET", f"/alumnos/{rnd.choice(ds.alumnos)}/detalle", {}
+
+    def alumnos_detalle_multi():
+        return "GET", "/alumnos/detalle", {"params": {"ids": rnd.sample(ds.alumnos, 20)}}
+
+    def curso_roster():
+        return "GET", f"/cursos/{rnd.choice(ds.cursos)}/alumnos", {"params": {"include": "responsables"}}
+
+    def escuelas_busqueda():
+        return "GET", "/escuelas/", {"params": {"q": rnd.choice(ds.terminos_busqueda)}}
+
+    def admin_pendientes():
+        return "GET", "/admin/pendientes", {"headers": admin}
+
+    def vincular():
+        return "POST", "/responsables/vincular", {"json": {
+            "idAlumno": rnd.choice(ds.alumnos),
+            "idResponsable": rnd.choice(ds.responsables),
+            "parentesco": rnd.choice(PARENTESCOS),
+        }}
+
+    return {
+        # el login es caro por diseño (PBKDF2): menos requests
+        "login": (0.1, login),
+        "alumnos_lista": (1.0, alumnos_lista),
+        "alumno_detalle": (1.0, alumno_detalle),
+        "alumnos_detalle_multi": (0.5, alumnos_detalle_multi),
+        "curso_roster": (0.5, curso_roster),
+        "escuelas_busqueda": (1.0, escuelas_busqueda),
+        "admin_pendientes": (0.5, admin_pendientes),
+        "vincular": (0.5, vincular),
+    }
+
+
+def _percentil(ordenadas: list[float], p: float) -> float:
+    i = min(len(ordenadas) - 1, max(0, round(p / 100 * len(ordenadas)) - 1))
+    return ordenadas[i]
+
+
+async def _correr(client, armar, total: int, concurrencia: int) -> dict:
+    latencias: list[float] = []
+    errores = 0
+    pendientes = iter(range(total))
+
+    async def cliente():
+        nonlocal errores
+        for _ in pendientes:  # el iterador compartido reparte el trabajo
+            metodo, url, kw = armar()
+            inicio = time.perf_counter()
+            r = await client.request(metodo, url, **kw)
+            latencias.append(time.perf_counter() - inicio)
+            if r.status_code >= 400:
+                errores += 1
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(cliente() for _ in range(concurrencia)))
+    duracion = time.perf_counter() - inicio
+
+    latencias.sort()
+    return {
+        "requests": total,
+        "errores": errores,
+        "rps": round(total / duracion, 1),
+        "p50_ms": round(_percentil(latencias, 50) * 1000, 2),
+        "p95_ms": round(_percentil(latencias, 95) * 1000, 2),
+        "p99_ms": round(_percentil(latencias, 99) * 1000, 2),
+    }
+
+
+async def _benchmark(args, ds) -> dict:
+    import httpx
+
+    from app.db.database import async_engine
+    from app.main import app
+
+    rnd = random.Random(args.semilla)
+    resultados = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for nombre, (fraccion, armar) in _escenarios(ds, rnd).items():
+            if args.escenarios and nombre not in args.escenarios:
+                continue
+            total = max(args.concurrencia, int(args.requests * fraccion))
+            await _correr(client, armar, min(total, args.concurrencia * 2), args.concurrencia)  # calentamiento
+            # mediana de varias corridas: una sola es demasiado ruidosa para comparar p95
+            corridas = [await _correr(client, armar, total, args.concurrencia) for _ in range(args.repeticiones)]
+            corridas.sort(key=lambda c: c["rps"])
+            resultados[nombre] = corridas[len(corridas) // 2]
+    # cerrar el pool async: las conexiones aiosqlite viven en hilos que no dejan terminar el proceso
+    await async_engine.dispose()
+    return resultados
+
+
+def comparar(actual: dict, baseline: dict, tolerancia: float, tolerancia_p95: float) -> list[str]:
+    regresiones = []
+    for nombre, base in baseline["escenarios"].items():
+        r = actual.get(nombre)
+        if r is None:
+            continue
+        if r["errores"] > base["errores"]:
+            regresiones.append(f"{nombre}: {r['errores']} errores (baseline {base['errores']})")
+        if r["rps"] < base["rps"] * (1 - tolerancia):
+            regresiones.append(f"{nombre}: {r['rps']} req/s (baseline {base['rps']}, -{tolerancia:.0%} permitido)")
+        if r["p50_ms"] > base["p50_ms"] * (1 + tolerancia):
+            regresiones.append(f"{nombre}: p50 {r['p50_ms']} ms (baseline {base['p50_ms']}, +{tolerancia:.0%} permitido)")
+        # la cola es mucho más ruidosa que la mediana: margen aparte
+        if r["p95_ms"] > base["p95_ms"] * (1 + tolerancia_p95):
+            regresiones.append(f"{nombre}: p95 {r['p95_ms']} ms (baseline {base['p95_ms']}, +{tolerancia_p95:.0%} permitido)")
+    return regresiones
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark en proceso de la API")
+    parser.add_argument("--perfil", choices=PERFILES, default="chico")
+    parser.add_argument("--db", help="URL de la DB a usar (se BORRA y se vuelve a sembrar); default: SQLite temporal")
+    parser.add_argument("--concurrencia", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=500, help="requests por escenario (antes de la fracción)")
+    parser.add_argument("--repeticiones", type=int, default=3, help="corridas por escenario (se reporta la mediana)")
+    parser.add_argument("--escenarios", nargs="*", help="correr sólo estos escenarios")
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--tolerancia", type=float, default=0.30, help="caída de req/s o suba de p50 tolerada")
+    parser.add_argument("--tolerancia-p95", type=float, default=1.0, help="suba de p95 tolerada")
+    parser.add_argument("--salida", help="archivo JSON donde escribir el resultado")
+    parser.add_argument("--guardar-baseline", action="store_true")
+    args = parser.parse_args()
+
+    # la app lee DATABASE_URL al importarse: fijarla antes de cualquier import de app.*
+    os.environ["DATABASE_URL"] = args.db or "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db")
+    os.environ.pop("ASYNC_DATABASE_URL", None)
+    os.environ.pop("DATABASE_REPLICA_URLS", None)
+
+    from app.db.database import engine
+    from benchmarks.dataset import Tamanio, sembrar
+
+    inicio = time.perf_counter()
+    ds = sembrar(engine, Tamanio(**PERFILES[args.perfil]), args.semilla)
+    siembra_s = time.perf_counter() - inicio
+
+    escenarios = asyncio.run(_benchmark(args, ds))
+    resultado = {
+        "perfil": args.perfil,
+        "dialecto": engine.dialect.name,
+        "concurrencia": args.concurrencia,
+        "siembra_s": round(siembra_s, 2),
+        "escenarios": escenarios,
+    }
+    texto = json.dumps(resultado, indent=2, ensure_ascii=False)
+    print(texto)
+    if args.salida:
+        Path(args.salida).write_text(texto + "\n")
+
+    archivo = BASELINES / f"{args.perfil}-{engine.dialect.name}-c{args.concurrencia}.json"
+    if args.guardar_baseline:
+        BASELINES.mkdir(exist_ok=True)
+        archivo.write_text(texto + "\n")
+        print(f"baseline guardado en {archivo}", file=sys.stderr)
+        return
+
+    if not archivo.exists():
+        print(f"sin baseline ({archivo.name}): usar --guardar-baseline para fijarlo", file=sys.stderr)
+        return
+
+    regresiones = comparar(escenarios, json.loads(archivo.read_text()), args.tolerancia, args.tolerancia_p95)
+    if regresiones:
+        print("\n*** REGRESIÓN DE PERFORMANCE ***", file=sys.stderr)
+        for r in regresiones:
+            print(f"  - {r}", file=sys.stderr)
+        sys.exit(1)
+    print(f"OK contra {archivo.name}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Dataset reproducible para los benchmarks, cargado con los modelos reales.
+
+Misma semilla + mismos tamaños = mismas filas, así los resultados de dos
+corridas (o de dos ramas) son comparables.
+"""
+import random
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+from sqlalchemy import MetaData
+from sqlmodel import Session
+
+from app.core.security import hash_password
+from app.db.migrations import migrar
+from app.models.alumno import Alumno
+from app.models.alumno_responsable import AlumnoResponsable
+from app.models.curso import Curso
+from app.models.escuela import Escuela
+from app.models.responsable import Responsable
+from app.models.rol import Rol
+from app.models.usuario import Usuario
+
+PASSWORD = "bench1234"
+
+NOMBRES = ["Juan", "María", "Lucía", "Mateo", "Sofía", "Benjamín", "Valentina", "Tomás", "Martina", "Joaquín"]
+APELLIDOS = ["González", "Rodríguez", "Gómez", "Fernández", "López", "Díaz", "Martínez", "Pérez", "Romero", "Sosa"]
+LOCALIDADES = ["La Plata", "Quilmes", "Lanús", "Morón", "Tandil", "Bahía Blanca", "Mar del Plata", "Luján"]
+PARENTESCOS = ["Madre", "Padre", "Tutor"]
+
+
+@dataclass
+class Tamanio:
+    escuelas: int = 5
+    cursos: int = 6  # por escuela
+    alumnos: int = 25  # por curso
+    responsables: int = 2  # por alumno
+
+
+@dataclass
+class Dataset:
+    """Ids que los escenarios usan para armar requests válidas."""
+
+    escuelas: list[int] = field(default_factory=list)
+    cursos: list[int] = field(default_factory=list)
+    alumnos: list[int] = field(default_factory=list)
+    responsables: list[int] = field(default_factory=list)
+    dnis_usuarios: list[str] = field(default_factory=list)
+    terminos_busqueda: list[str] = field(default_factory=list)
+
+
+def sembrar(engine, tamanio: Tamanio, semilla: int = 42) -> Dataset:
+    rnd = random.Random(semilla)
+    ds = Dataset()
+    # desde cero, con el esquema de las migraciones (incluida schema_version)
+    existentes = MetaData()
+    existentes.reflect(engine)
+    existentes.drop_all(engine)
+    migrar(engine)
+
+    # un solo hash para todos: PBKDF2 es caro a propósito
+    contrasena = hash_password(PASSWORD)
+    dni = iter(range(20_000_000, 60_000_000, 7))
+
+    with Session(engine) as session:
+        escuelas = [
+            Escuela(
+                nombre=f"Escuela {rnd.choice(['Técnica', 'Primaria', 'Secundaria'])} {rnd.choice(APELLIDOS)}",
+                numero=str(i + 1),
+                cue=f"06{i:07d}",
+                nivel_educativo=rnd.choice(["Primario", "Secundario"]),
+                turno=rnd.choice(["Mañana", "Tarde"]),
+                direccion=f"Calle {rnd.randrange(1, 200)} N° {rnd.randrange(100, 3000)}",
+                codigo_postal=str(rnd.randrange(1000, 8000)),
+                localidad=rnd.choice(LOCALIDADES),
+                provincia="Buenos Aires",
+            )
+            for i in range(tamanio.escuelas)
+        ]
+        session.add_all(escuelas)
+        session.flush()
+        ds.escuelas = [e.idEscuela for e in escuelas]
+        ds.terminos_busqueda = sorted({e.localidad for e in escuelas} | {e.nombre.split()[1] for e in escuelas})
+
+        # un director aprobado y uno pendiente por escuela, más docentes
+        for e in escuelas:
+            for descripcion, estado in [("Director", "Aprobado"), ("Director", "Pendiente"),
+                                        ("Docente", "Aprobado"), ("Docente", "Pendiente")]:
+                u = Usuario(dni=str(next(dni)), contrasena=contrasena,
+                            nombre=rnd.choice(NOMBRES), apellido=rnd.choice(APELLIDOS))
+                session.add(u)
+                session.flush()
+                session.add(Rol(idUsuario=u.idUsuario, idEscuela=e.idEscuela,
+                                descripcion=descripcion, estado=estado))
+                if estado == "Aprobado":
+                    ds.dnis_usuarios.append(u.dni)
+
+        cursos = [
+            Curso(idEscuela=e.idEscuela, nombre=f"{g + 1}° {d}", grado=str(g + 1), division=d,
+                  turno=rnd.choice(["Mañana", "Tarde"]), cicloLectivo=date.today().year)
+            for e in escuelas
+            for g, d in ((c // 2, "AB"[c % 2]) for c in range(tamanio.cursos))
+        ]
+        session.add_all(cursos)
+        session.flush()
+        ds.cursos = [c.idCurso for c in cursos]
+
+        for c in cursos:
+            alumnos = [
+                Alumno(idCurso=c.idCurso, nombre=rnd.choice(NOMBRES), apellido=rnd.choice(APELLIDOS),
+                       dni=str(next(dni)),
+                       fechaNac=date(2010, 1, 1) + timedelta(days=rnd.randrange(3650)),
+                       fechaIngreso=date(2020, 3, 1))
+                for _ in range(tamanio.alumnos)
+            ]
+            responsables = [
+                Responsable(nombre=rnd.choice(NOMBRES), apellido=a.apellido, dni=str(next(dni)),
+                            telefono=f"11{rnd.randrange(10**8):08d}")
+                for a in alumnos
+                for _ in range(tamanio.responsables)
+            ]
+            session.add_all(alumnos + responsables)
+            session.flush()
+            session.add_all(
+                AlumnoResponsable(idAlumno=a.idAlumno, idResponsable=r.idResponsable,
+                                  parentesco=PARENTESCOS[j % len(PARENTESCOS)])
+                for i, a in enumerate(alumnos)
+                for j, r in enumerate(responsables[i * tamanio.responsables:(i + 1) * tamanio.responsables])
+            )
+            ds.alumnos += [a.idAlumno for a in alumnos]
+            ds.responsables += [r.idResponsable for r in responsables]
+
+        session.commit()
+    return ds
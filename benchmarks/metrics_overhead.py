@@ -0,0 +1,86 @@
+"""Costo por request del MetricsMiddleware.
+
+Compara una app mínima con y sin el middleware (mismo endpoint trivial,
+llamado por ASGI sin red) y mide aparte el costo de `observar()`.
+
+    python -m benchmarks.metrics_overhead [--requests 20000]
+"""
+import argparse
+import asyncio
+import json
+import time
+import timeit
+
+from fastapi import FastAPI
+
+from app.core.metrics import Metricas, MetricsMiddleware
+
+
+def _app(con_metricas: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping/{n}")
+    async def ping(n: int):
+        return {"n": n}
+
+    if con_metricas:
+        app.add_middleware(MetricsMiddleware)
+    return app
+
+
+async def _llamar(app, n: int) -> float:
+    # request ASGI directa: mide sólo la app, sin cliente HTTP de por medio
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    inicio = time.perf_counter()
+    for i in range(n):
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+            "method": "GET", "scheme": "http", "path": f"/ping/{i % 100}", "raw_path": b"",
+            "root_path": "", "query_string": b"", "headers": [], "server": ("bench", 80),
+        }
+        await app(scope, receive, send)
+    return time.perf_counter() - inicio
+
+
+async def _medir(n: int) -> dict:
+    sin, con = _app(False), _app(True)
+    await _llamar(sin, 1000)  # calentamiento
+    await _llamar(con, 1000)
+    # alternadas para que el ruido de la máquina afecte a las dos por igual
+    t_sin = t_con = 0.0
+    for _ in range(5):
+        t_sin += await _llamar(sin, n // 5)
+        t_con += await _llamar(con, n // 5)
+    return {
+        "requests": n,
+        "us_por_request_sin_metricas": round(t_sin / n * 1e6, 2),
+        "us_por_request_con_metricas": round(t_con / n * 1e6, 2),
+        "overhead_us": round((t_con - t_sin) / n * 1e6, 2),
+        "overhead_pct": round(100 * (t_con - t_sin) / t_sin, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    resultado = asyncio.run(_medir(args.requests))
+
+    m = Metricas()
+    veces = 200_000
+    resultado["us_por_observar"] = round(
+        timeit.timeit(lambda: m.observar("alumno", "GET", "/alumnos/", 200, 0.012), number=veces)
+        / veces * 1e6,
+        3,
+    )
+    print(json.dumps(resultado, indent=2))
+
+
+if __name__ == "__main__":
+    main()
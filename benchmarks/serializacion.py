@@ -0,0 +1,117 @@
+"""Serialización de listados grandes: camino ORM + response_model vs. camino rápido.
+
+Siembra un curso con `--filas` alumnos y pide la lista entera en una sola
+página (ASGI en proceso, sin red) por tres caminos:
+
+- antes: select(Alumno) -> objetos ORM -> AlumnoPublic (from_attributes) ->
+  validación de response_model -> JSON (lo que hacía GET /alumnos/)
+- rapido: GET /alumnos/ actual (tuplas de columnas -> orjson)
+- rapido_gzip: lo mismo detrás de GZipMiddleware, con Accept-Encoding: gzip
+
+    python -m benchmarks.serializacion [--filas 10000] [--repeticiones 20]
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+
+
+def _apps():
+    from fastapi import FastAPI, Query
+    from fastapi.middleware.gzip import GZipMiddleware
+    from sqlmodel import select
+
+    from app.core.config import GZIP_MIN_BYTES, GZIP_NIVEL
+    from app.core.pagination import paginar_async
+    from app.dependencies import AsyncSessionDep, PaginacionDep
+    from app.models.alumno import Alumno
+    from app.routers import alumno
+    from app.schemas.alumno import AlumnoPublic
+    from app.schemas.pagination import Page
+
+    antes = FastAPI()
+
+    # copia del endpoint previo al camino rápido
+    @antes.get("/alumnos/", response_model=Page[AlumnoPublic])
+    async def list_alumnos(session: AsyncSessionDep, pag: PaginacionDep, cursoId: int | None = Query(default=None)):
+        stmt = select(Alumno)
+        if cursoId is not None:
+            stmt = stmt.where(Alumno.idCurso == cursoId)
+        return await paginar_async(session, stmt, Alumno.idAlumno, pag)
+
+    rapido = FastAPI()
+    rapido.include_router(alumno.router)
+
+    rapido_gzip = FastAPI()
+    rapido_gzip.include_router(alumno.router)
+    rapido_gzip.add_middleware(GZipMiddleware, minimum_size=GZIP_MIN_BYTES, compresslevel=GZIP_NIVEL)
+
+    return {"antes": antes, "rapido": rapido, "rapido_gzip": rapido_gzip}
+
+
+async def _medir(filas: int, curso_id: int, repeticiones: int) -> dict:
+    import httpx
+
+    from app.db.database import async_engine
+
+    url = f"/alumnos/?cursoId={curso_id}&limit={filas}"
+    resultados, cuerpos = {}, {}
+    clientes = {
+        nombre: httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench")
+        for nombre, app in _apps().items()
+    }
+    tiempos = {nombre: [] for nombre in clientes}
+    for cliente in clientes.values():
+        await cliente.get(url)  # calentamiento
+    # alternadas para que el ruido de la máquina afecte a todos por igual
+    for _ in range(repeticiones):
+        for nombre, cliente in clientes.items():
+            inicio = time.perf_counter()
+            r = await cliente.get(url, headers={"Accept-Encoding": "gzip" if nombre.endswith("gzip") else "identity"})
+            tiempos[nombre].append((time.perf_counter() - inicio) * 1000)
+            r.raise_for_status()
+            cuerpos[nombre] = (r.json(), int(r.headers["content-length"]))
+
+    for nombre, ms in tiempos.items():
+        items = cuerpos[nombre][0]["items"]
+        resultados[nombre] = {
+            "filas": len(items),
+            "bytes": cuerpos[nombre][1],
+            "p50_ms": round(statistics.median(ms), 1),
+            "min_ms": round(min(ms), 1),
+        }
+    for cliente in clientes.values():
+        await cliente.aclose()
+    await async_engine.dispose()
+
+    # mismo JSON por los tres caminos
+    assert cuerpos["antes"][0] == cuerpos["rapido"][0] == cuerpos["rapido_gzip"][0]
+    resultados["aceleracion"] = round(resultados["antes"]["p50_ms"] / resultados["rapido"]["p50_ms"], 2)
+    return resultados
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serialización de listados grandes")
+    parser.add_argument("--filas", type=int, default=10_000)
+    parser.add_argument("--repeticiones", type=int, default=20)
+    args = parser.parse_args()
+
+    # la app lee DATABASE_URL y PAGE_SIZE_MAX al importarse: una sola página con todas las filas
+    os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db")
+    os.environ.pop("ASYNC_DATABASE_URL", None)
+    os.environ.pop("DATABASE_REPLICA_URLS", None)
+    os.environ["PAGE_SIZE_MAX"] = str(args.filas)
+
+    from app.db.database import engine
+    from benchmarks.dataset import Tamanio, sembrar
+
+    ds = sembrar(engine, Tamanio(escuelas=1, cursos=1, alumnos=args.filas, responsables=0))
+    resultado = asyncio.run(_medir(args.filas, ds.cursos[0], args.repeticiones))
+    print(json.dumps(resultado, indent=2))
+
+
+if __name__ == "__main__":
+    main()
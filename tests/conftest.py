@@ -0,0 +1,154 @@
+"""App completa sobre un SQLite temporal: pysqlite para la sesión sync y aiosqlite
+para la async, contra el mismo archivo.
+
+El fixture `cliente` corre cada test dos veces:
+- "async": las rutas `async def` usan AsyncSession sobre aiosqlite (como en producción)
+- "sync": las mismas rutas reciben una Session sync (pysqlite) detrás de la interfaz
+  de AsyncSession, así se comprueba que no dependen del driver
+"""
+import os
+import tempfile
+
+# la app lee la configuración al importarse: fijarla antes de cualquier import de app.*
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(), "tests.db")
+for _var in ("ASYNC_DATABASE_URL", "DATABASE_REPLICA_URLS", "ASYNC_DATABASE_REPLICA_URLS"):
+    os.environ.pop(_var, None)
+os.environ["DB_AUTO_MIGRATE"] = "true"
+os.environ["PASSWORD_HASH_ITERATIONS"] = "1000"  # PBKDF2 barato: sólo se prueba el flujo
+os.environ["SECRET_KEY"] = "tests"
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, SQLModel
+
+from app.core.response_cache import response_cache
+from app.db.database import DBSession, engine, get_async_session
+from app.main import app
+from app.models.rol import Rol
+from app.services import auth_service
+
+
+class SesionSync:
+    """Lo que usan las rutas de AsyncSession, resuelto con una Session sync."""
+
+    def __init__(self, session: Session):
+        self.sync_session = session
+
+    async def exec(self, *args, **kwargs):
+        return self.sync_session.exec(*args, **kwargs)
+
+    async def execute(self, *args, **kwargs):
+        return self.sync_session.execute(*args, **kwargs)
+
+    async def get(self, *args, **kwargs):
+        return self.sync_session.get(*args, **kwargs)
+
+    async def commit(self):
+        self.sync_session.commit()
+
+    def add(self, instancia):
+        self.sync_session.add(instancia)
+
+
+async def _sesion_sync():
+    with DBSession(expire_on_commit=False) as session:
+        yield SesionSync(session)
+
+
+@pytest.fixture(scope="session")
+def _app():
+    # el lifespan aplica las migraciones sobre la DB vacía
+    with TestClient(app) as cliente:
+        yield cliente
+
+
+@pytest.fixture(params=["async", "sync"])
+def cliente(request, _app, _db_limpia):
+    if request.param == "sync":
+        app.dependency_overrides[get_async_session] = _sesion_sync
+    yield _app
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def _db_limpia():
+    yield
+    with engine.begin() as conn:
+        for tabla in reversed(SQLModel.metadata.sorted_tables):
+            conn.execute(tabla.delete())
+    # caches por proceso: que un test no vea datos de otro
+    response_cache.invalidar("escuelas", "cursos")
+    auth_service._roles_cache.clear()
+    auth_service._membresias_cache.clear()
+    auth_service._revocados.clear()
+
+
+# --------------------------------------------------
+# Datos
+# --------------------------------------------------
+def crear_escuela(cliente, **datos) -> dict:
+    r = cliente.post("/escuelas/", json={
+        "nombre": "Escuela Primaria Sarmiento", "numero": "1", "cue": "060000001",
+        "nivel_educativo": "Primario", "turno": "Mañana", "direccion": "Calle 7 N° 100",
+        "codigo_postal": "7000", "localidad": "Tandil", "provincia": "Buenos Aires", **datos,
+    })
+    assert r.status_code == 201, r.text
+    return r.json()
+
+
+def crear_curso(cliente, escuela_id: int, **datos) -> dict:
+    r = cliente.post("/cursos/", json={
+        "escuelaId": escuela_id, "nombre": "1° A", "grado": "1", "division": "A",
+        "turno": "Mañana", "cicloLectivo": 2026, **datos,
+    })
+    assert r.status_code == 201, r.text
+    return r.json()
+
+
+def crear_alumno(cliente, curso_id: int, dni: str, **datos) -> dict:
+    r = cliente.post("/alumnos/", json={
+        "cursoId": curso_id, "nombre": "Lucía", "apellido": "Gómez", "dni": dni,
+        "fechaNac": "2019-05-10", "fechaIngreso": "2025-03-01", **datos,
+    })
+    assert r.status_code == 201, r.text
+    return r.json()
+
+
+def crear_usuario(cliente, dni: str, contrasena: str = "clave1234") -> dict:
+    r = cliente.post("/usuarios/", json={
+        "dni": dni, "cuil": f"20{dni}3", "nombre": "Marta", "apellido": "Sosa", "contrasena": contrasena,
+    })
+    assert r.status_code == 201, r.text
+    return r.json()
+
+
+def dar_rol(id_usuario: int, id_escuela: int, descripcion: str, estado: str = "Aprobado") -> int:
+    # directo en la DB: por la API sólo un Admin asigna roles aprobados
+    with Session(engine) as session:
+        rol = Rol(idUsuario=id_usuario, idEscuela=id_escuela, descripcion=descripcion, estado=estado)
+        session.add(rol)
+        session.commit()
+        return rol.idRol
+
+
+def token_con_rol(cliente, escuela_id: int, descripcion: str, dni: str) -> str:
+    """Usuario nuevo con un rol aprobado en la escuela; devuelve el token de ese rol."""
+    usuario = crear_usuario(cliente, dni)
+    dar_rol(usuario["idUsuario"], escuela_id, descripcion)
+    r = cliente.post("/login", json={"dni": dni, "password": "clave1234"})
+    [rol] = r.json()["roles_disponibles"]
+    return rol["token"]
+
+
+def auth(token: str) -> dict:
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def escuela(cliente) -> dict:
+    return crear_escuela(cliente)
+
+
+@pytest.fixture
+def curso(cliente, escuela) -> dict:
+    return crear_curso(cliente, escuela["idEscuela"])
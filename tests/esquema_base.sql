@@ -0,0 +1,87 @@
+-- Esquema de la DB antes de las migraciones (create_all de los modelos originales, SQLite).
+-- Punto de partida de test_migraciones: no editar.
+
+CREATE TABLE usuario (
+	"idUsuario" INTEGER NOT NULL, 
+	dni VARCHAR NOT NULL, 
+	cuil VARCHAR, 
+	"mailABC" VARCHAR, 
+	contrasena VARCHAR NOT NULL, 
+	celular VARCHAR, 
+	nombre VARCHAR, 
+	apellido VARCHAR, 
+	PRIMARY KEY ("idUsuario")
+);
+CREATE INDEX ix_usuario_dni ON usuario (dni);
+CREATE TABLE escuela (
+	"idEscuela" INTEGER NOT NULL, 
+	cue VARCHAR, 
+	nombre VARCHAR NOT NULL, 
+	numero VARCHAR, 
+	nivel_educativo VARCHAR, 
+	turno VARCHAR, 
+	matricula INTEGER, 
+	direccion VARCHAR, 
+	codigo_postal VARCHAR, 
+	codigo_provincial VARCHAR, 
+	telefono VARCHAR, 
+	correo_electronico VARCHAR, 
+	provincia VARCHAR, 
+	localidad VARCHAR, 
+	PRIMARY KEY ("idEscuela")
+);
+CREATE INDEX ix_escuela_cue ON escuela (cue);
+CREATE TABLE responsable (
+	"idResponsable" INTEGER NOT NULL, 
+	nombre VARCHAR NOT NULL, 
+	apellido VARCHAR NOT NULL, 
+	dni VARCHAR(20) NOT NULL, 
+	telefono VARCHAR(30), 
+	correo_electronico VARCHAR(120), 
+	PRIMARY KEY ("idResponsable")
+);
+CREATE INDEX ix_responsable_dni ON responsable (dni);
+CREATE TABLE rol (
+	"idRol" INTEGER NOT NULL, 
+	"idUsuario" INTEGER NOT NULL, 
+	"idEscuela" INTEGER NOT NULL, 
+	descripcion VARCHAR NOT NULL, 
+	estado VARCHAR NOT NULL, 
+	PRIMARY KEY ("idRol"), 
+	FOREIGN KEY("idUsuario") REFERENCES usuario ("idUsuario"), 
+	FOREIGN KEY("idEscuela") REFERENCES escuela ("idEscuela")
+);
+CREATE TABLE curso (
+	"idCurso" INTEGER NOT NULL, 
+	"idEscuela" INTEGER NOT NULL, 
+	nombre VARCHAR NOT NULL, 
+	grado VARCHAR, 
+	division VARCHAR, 
+	turno VARCHAR, 
+	"cicloLectivo" INTEGER NOT NULL, 
+	PRIMARY KEY ("idCurso"), 
+	FOREIGN KEY("idEscuela") REFERENCES escuela ("idEscuela")
+);
+CREATE INDEX "ix_curso_idEscuela" ON curso ("idEscuela");
+CREATE TABLE alumno (
+	"idAlumno" INTEGER NOT NULL, 
+	"idCurso" INTEGER NOT NULL, 
+	nombre VARCHAR NOT NULL, 
+	apellido VARCHAR NOT NULL, 
+	dni VARCHAR NOT NULL, 
+	fecha_nacimiento DATE NOT NULL, 
+	fecha_ingreso DATE NOT NULL, 
+	direccion VARCHAR, 
+	PRIMARY KEY ("idAlumno"), 
+	FOREIGN KEY("idCurso") REFERENCES curso ("idCurso")
+);
+CREATE INDEX "ix_alumno_idCurso" ON alumno ("idCurso");
+CREATE TABLE alumno_responsable (
+	"idAlumno" INTEGER NOT NULL, 
+	"idResponsable" INTEGER NOT NULL, 
+	parentesco VARCHAR(50) NOT NULL, 
+	PRIMARY KEY ("idAlumno", "idResponsable"), 
+	FOREIGN KEY("idAlumno") REFERENCES alumno ("idAlumno"), 
+	FOREIGN KEY("idResponsable") REFERENCES responsable ("idResponsable")
+);
+CREATE INDEX ix_alumno_responsable_parentesco ON alumno_responsable (parentesco);
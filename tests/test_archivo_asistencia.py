@@ -0,0 +1,46 @@
+"""Archivo de la asistencia de ciclos pasados y su lectura con UNION ALL."""
+from sqlalchemy import select
+from sqlmodel import Session
+
+from app.db.database import engine
+from app.models.asistencia import Asistencia, AsistenciaArchivo
+from app.services.asistencia_archivo import archivar_ciclo, ciclo_actual
+from tests.conftest import crear_alumno, crear_curso
+
+
+def test_archivar_ciclo_y_leerlo(cliente, escuela):
+    pasado = ciclo_actual() - 1
+    viejo = crear_curso(cliente, escuela["idEscuela"], cicloLectivo=pasado)["idCurso"]
+    actual = crear_curso(cliente, escuela["idEscuela"], cicloLectivo=ciclo_actual())["idCurso"]
+    alumno = crear_alumno(cliente, viejo, dni="50000001")["idAlumno"]
+    otro = crear_alumno(cliente, actual, dni="50000002")["idAlumno"]
+    for curso_id, a, fecha, estado in (
+        (viejo, alumno, f"{pasado}-03-09", "Presente"),
+        (viejo, alumno, f"{pasado}-03-10", "Ausente"),
+        (actual, otro, f"{ciclo_actual()}-03-09", "Presente"),
+    ):
+        r = cliente.post(f"/cursos/{curso_id}/asistencia", json={
+            "fecha": fecha, "registros": [{"alumnoId": a, "estado": estado}],
+        })
+        assert r.status_code == 200
+    resumen = cliente.get(f"/cursos/{viejo}/asistencia/resumen").json()
+
+    with Session(engine) as session:
+        assert archivar_ciclo(session, pasado, cursos_por_lote=1) == {"cursos": 1, "filas": 2}
+
+    with engine.connect() as conn:
+        assert conn.execute(select(Asistencia.idCurso)).scalars().all() == [actual]
+        assert conn.execute(
+            select(AsistenciaArchivo.idAlumno, AsistenciaArchivo.estado, AsistenciaArchivo.cicloLectivo)
+            .order_by(AsistenciaArchivo.fecha)
+        ).all() == [(alumno, "Presente", pasado), (alumno, "Ausente", pasado)]
+
+    # la planilla de un ciclo pasado se lee también del archivo
+    planilla = cliente.get(f"/cursos/{viejo}/asistencia", params={"fecha": f"{pasado}-03-10"}).json()
+    assert [(p["idAlumno"], p["estado"]) for p in planilla] == [(alumno, "Ausente")]
+    assert cliente.get(f"/cursos/{viejo}/asistencia/resumen").json() == resumen
+    # el curso archivado quedó cerrado
+    r = cliente.post(f"/cursos/{viejo}/asistencia", json={
+        "fecha": f"{pasado}-03-11", "registros": [{"alumnoId": alumno, "estado": "Presente"}],
+    })
+    assert r.status_code == 409
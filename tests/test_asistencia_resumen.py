@@ -0,0 +1,49 @@
+"""Los resúmenes incrementales de asistencia coinciden con recalcularlos desde cero."""
+from sqlmodel import Session, select
+
+from app.db.database import engine
+from app.models.alumno import Alumno
+from app.models.asistencia_resumen import AsistenciaEscuelaDia
+from app.services.asistencia_resumen import CLAVES, reconstruir
+from tests.conftest import crear_alumno, crear_curso
+
+
+def _resumenes() -> dict:
+    with engine.connect() as conn:
+        return {tabla.__tablename__: sorted(map(tuple, conn.execute(select(tabla.__table__)).all()))
+                for tabla in CLAVES}
+
+
+def _planilla(cliente, curso_id: int, fecha: str, **estados) -> None:
+    registros = [{"alumnoId": int(a), "estado": e} for a, e in estados.items()]
+    r = cliente.post(f"/cursos/{curso_id}/asistencia", json={"fecha": fecha, "registros": registros})
+    assert r.status_code == 200, r.text
+
+
+def test_incrementales_igual_a_reconstruir(cliente, escuela, curso):
+    otro = crear_curso(cliente, escuela["idEscuela"], nombre="1° B", division="B")
+    a1, a2, a3 = (crear_alumno(cliente, curso["idCurso"], dni=f"5000000{i}")["idAlumno"] for i in range(3))
+
+    _planilla(cliente, curso["idCurso"], "2026-03-09", **{str(a1): "Presente", str(a2): "Ausente", str(a3): "Presente"})
+    _planilla(cliente, curso["idCurso"], "2026-03-10", **{str(a1): "Presente", str(a2): "Presente"})
+    # se corrige la planilla del mismo día
+    _planilla(cliente, curso["idCurso"], "2026-03-10", **{str(a1): "Tarde", str(a2): "Presente"})
+
+    # a2 pasa a la otra división y se vuelve a cargar el mismo día desde ahí
+    with Session(engine) as session:
+        session.get(Alumno, a2).idCurso = otro["idCurso"]
+        session.commit()
+    _planilla(cliente, otro["idCurso"], "2026-03-10", **{str(a2): "Justificado"})
+
+    assert cliente.delete(f"/alumnos/{a3}").status_code == 204
+
+    incrementales = _resumenes()
+    with engine.connect() as conn:
+        por_dia = {
+            str(r.fecha): (r.presentes, r.ausentes, r.tardes, r.justificados)
+            for r in conn.execute(select(AsistenciaEscuelaDia.__table__))
+        }
+    assert por_dia == {"2026-03-09": (1, 1, 0, 0), "2026-03-10": (0, 0, 1, 1)}
+    with Session(engine) as session:
+        reconstruir(session)
+    assert _resumenes() == incrementales
@@ -0,0 +1,61 @@
+"""Autorización por claims del token y revocación compartida entre workers."""
+from app.db.database import engine
+from app.services import auth_service
+from tests.conftest import auth, crear_escuela, crear_usuario, token_con_rol
+
+
+def test_admin_requiere_rol_admin(cliente, escuela):
+    docente = token_con_rol(cliente, escuela["idEscuela"], "Docente", "30111222")
+    admin = token_con_rol(cliente, escuela["idEscuela"], "Admin", "30111223")
+
+    assert cliente.get("/admin/pendientes").status_code == 401
+    assert cliente.get("/admin/pendientes", headers=auth(docente)).status_code == 403
+    assert cliente.get("/admin/pendientes", headers=auth(admin)).status_code == 200
+
+
+def test_director_solo_en_su_escuela(cliente, escuela):
+    otra = crear_escuela(cliente, cue="060000002")
+    director = token_con_rol(cliente, escuela["idEscuela"], "Director", "30111222")
+    admin = token_con_rol(cliente, otra["idEscuela"], "Admin", "30111223")
+
+    assert cliente.get(f"/escuelas/{escuela['idEscuela']}/docentes", headers=auth(director)).status_code == 200
+    assert cliente.get(f"/escuelas/{otra['idEscuela']}/docentes", headers=auth(director)).status_code == 403
+    # escuela_id por query string
+    r = cliente.post("/usuarios/1/aprobar-docente", params={"escuela_id": otra["idEscuela"]}, headers=auth(director))
+    assert r.status_code == 403
+    assert cliente.get(f"/escuelas/{escuela['idEscuela']}/docentes", headers=auth(admin)).status_code == 200
+
+
+def test_revocacion_llega_a_los_demas_workers(cliente):
+    escuela = crear_escuela(cliente)
+    token = token_con_rol(cliente, escuela["idEscuela"], "Docente", "30111222")
+    assert cliente.get("/me", headers=auth(token)).status_code == 200
+
+    # borrar la escuela revoca los tokens de sus miembros
+    assert cliente.delete(f"/escuelas/{escuela['idEscuela']}").status_code == 204
+    assert cliente.get("/me", headers=auth(token)).status_code == 401
+
+    # otro worker no tiene la revocación en memoria hasta su próximo refresco
+    auth_service._revocados.clear()
+    assert cliente.get("/me", headers=auth(token)).status_code == 200
+    assert auth_service.cargar_revocaciones(engine) == 1
+    assert cliente.get("/me", headers=auth(token)).status_code == 401
+
+
+def test_pedir_rol_sin_ser_admin_queda_pendiente(cliente, escuela):
+    usuario = crear_usuario(cliente, "30111222")
+    pedido = {"idUsuario": usuario["idUsuario"], "idEscuela": escuela["idEscuela"]}
+
+    r = cliente.post("/roles/", json={**pedido, "descripcion": "Docente", "estado": "Aprobado"})
+    assert r.status_code == 201 and r.json()["estado"] == "Pendiente"
+    assert cliente.post("/roles/", json={**pedido, "descripcion": "Admin"}).status_code == 403
+    # sin rol aprobado no hay token
+    assert cliente.post("/login", json={"dni": "30111222", "password": "clave1234"}).status_code == 403
+
+    docente = token_con_rol(cliente, escuela["idEscuela"], "Docente", "30111224")
+    r = cliente.post("/roles/", json={**pedido, "descripcion": "Admin"}, headers=auth(docente))
+    assert r.status_code == 403
+
+    admin = token_con_rol(cliente, escuela["idEscuela"], "Admin", "30111223")
+    r = cliente.post("/roles/", json={**pedido, "descripcion": "Director", "estado": "Aprobado"}, headers=auth(admin))
+    assert r.json()["estado"] == "Aprobado"
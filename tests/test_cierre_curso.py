@@ -0,0 +1,45 @@
+"""Cierre de curso con baja de alumnos: cascada en la DB y responsables huérfanos."""
+from sqlalchemy import select
+
+from app.db.database import engine
+from app.models.alumno_responsable import AlumnoResponsable
+from app.models.asistencia import Asistencia
+from app.models.responsable import Responsable
+from tests.conftest import crear_alumno, crear_curso
+
+
+def _responsable(cliente, dni: str, *alumnos: int) -> int:
+    r = cliente.post("/responsables/", json={"nombre": "Ana", "apellido": "Gómez", "dni": dni}).json()
+    for alumno in alumnos:
+        vinculo = {"idAlumno": alumno, "idResponsable": r["idResponsable"], "parentesco": "Madre"}
+        assert cliente.post("/responsables/vincular", json=vinculo).status_code == 201
+    return r["idResponsable"]
+
+
+def test_cerrar_curso_eliminando_alumnos(cliente, escuela, curso):
+    otro = crear_curso(cliente, escuela["idEscuela"], nombre="1° B", division="B")
+    a1, a2 = (crear_alumno(cliente, curso["idCurso"], dni=d)["idAlumno"] for d in ("50000001", "50000002"))
+    a3 = crear_alumno(cliente, otro["idCurso"], dni="50000003")["idAlumno"]
+    _responsable(cliente, "30111222", a1)  # queda sin alumnos: se borra
+    compartido = _responsable(cliente, "30111223", a2, a3)  # hermanos en distintos cursos
+    for curso_id, alumno in ((curso["idCurso"], a1), (curso["idCurso"], a2), (otro["idCurso"], a3)):
+        cliente.post(f"/cursos/{curso_id}/asistencia", json={
+            "fecha": "2026-03-09", "registros": [{"alumnoId": alumno, "estado": "Presente"}],
+        })
+
+    r = cliente.post(f"/cursos/{curso['idCurso']}/cerrar", params={"eliminarAlumnos": True})
+    assert r.json() == {"cursoId": curso["idCurso"], "alumnos": 2, "vinculos": 2, "responsables": 1}
+
+    assert cliente.get("/alumnos/", params={"cursoId": curso["idCurso"]}).json()["items"] == []
+    with engine.connect() as conn:
+        assert conn.execute(select(Asistencia.idAlumno)).scalars().all() == [a3]
+        assert conn.execute(select(AlumnoResponsable.idAlumno, AlumnoResponsable.idResponsable)).all() == [
+            (a3, compartido),
+        ]
+        assert conn.execute(select(Responsable.idResponsable)).scalars().all() == [compartido]
+    # cerrado: no admite alumnos nuevos
+    r = cliente.post("/alumnos/", json={
+        "cursoId": curso["idCurso"], "nombre": "Lucía", "apellido": "Gómez", "dni": "50000009",
+        "fechaNac": "2019-05-10", "fechaIngreso": "2025-03-01",
+    })
+    assert r.status_code == 409
@@ -0,0 +1,69 @@
+"""Importación de alumnos por CSV: errores por fila y una transacción por tanda."""
+from sqlalchemy.exc import OperationalError
+
+from app.services import import_service
+from tests.conftest import crear_curso, crear_escuela
+
+ENCABEZADO = ("cursoId,nombre,apellido,dni,fechaNac,fechaIngreso,direccion,"
+              "responsableNombre,responsableApellido,responsableDni,responsableTelefono,responsableCorreo,parentesco")
+
+
+def _fila(curso_id: int, dni: str, responsable: str = "", parentesco: str = "") -> str:
+    datos_resp = f"Ana,Gómez,{responsable},,," if responsable else ",,,,,"
+    return f"{curso_id},Lucía,Gómez,{dni},2019-05-10,2025-03-01,,{datos_resp}{parentesco}"
+
+
+def _importar(cliente, escuela_id: int, filas: list[str], chunk_size: int) -> dict:
+    csv = "\n".join([ENCABEZADO, *filas]).encode()
+    r = cliente.post(
+        f"/escuelas/{escuela_id}/import", params={"chunkSize": chunk_size},
+        files={"archivo": ("alumnos.csv", csv, "text/csv")},
+    )
+    assert r.status_code == 200, r.text
+    return r.json()
+
+
+def test_importar_con_errores_por_fila_y_tanda_revertida(cliente, escuela, curso, monkeypatch):
+    cerrado = crear_curso(cliente, escuela["idEscuela"], nombre="1° B", division="B")
+    assert cliente.post(f"/cursos/{cerrado['idCurso']}/cerrar").status_code == 200
+    ajeno = crear_curso(cliente, crear_escuela(cliente, cue="060000002")["idEscuela"])
+
+    # la tanda con el DNI 50000007 se guarda y después falla: se revierte entera
+    original = import_service._insertar_tanda
+
+    def insertar_tanda(session, filas):
+        creados = original(session, filas)
+        if any(a.dni == "50000007" for _, a, _, _ in filas):
+            raise OperationalError("INSERT", {}, Exception("se cortó la conexión"))
+        return creados
+
+    monkeypatch.setattr(import_service, "_insertar_tanda", insertar_tanda)
+
+    c = curso["idCurso"]
+    resultado = _importar(cliente, escuela["idEscuela"], [
+        _fila(c, "50000001", "30111222", "Madre"),              # 2
+        _fila(c, "50000002", "30111222", "Madre"),              # 3: hermano, mismo responsable
+        _fila(c, "50000001"),                                   # 4: DNI repetido en la tanda
+        _fila(cerrado["idCurso"], "50000004"),                  # 5
+        _fila(ajeno["idCurso"], "50000005"),                    # 6
+        _fila(c, "50000006", "30111223"),                       # 7: sin parentesco
+        _fila(c, "50000007"),                                   # 8: tanda que falla
+        _fila(c, "50000008"),                                   # 9
+        _fila(c, "50000002"),                                   # 10: ya cargado en una tanda anterior
+    ], chunk_size=3)
+
+    assert (resultado["filas"], resultado["alumnosCreados"]) == (9, 2)
+    assert (resultado["responsablesCreados"], resultado["vinculosCreados"]) == (1, 2)
+    assert [(e["fila"], e["detalle"]) for e in resultado["errores"]] == [
+        (4, "Alumno con DNI 50000001 ya existe"),
+        (5, f"El curso {cerrado['idCurso']} está cerrado"),
+        (6, f"El curso {ajeno['idCurso']} no pertenece a la escuela"),
+        (7, "Falta parentesco del responsable"),
+        (8, "Error al guardar la tanda: OperationalError"),
+        (9, "Error al guardar la tanda: OperationalError"),
+        (10, "Alumno con DNI 50000002 ya existe"),
+    ]
+
+    alumnos = cliente.get("/alumnos/", params={"cursoId": c}).json()["items"]
+    assert [a["dni"] for a in alumnos] == ["50000001", "50000002"]
+    assert cliente.get("/alumnos/", params={"cursoId": cerrado["idCurso"]}).json()["items"] == []
@@ -0,0 +1,88 @@
+"""Rutas de lectura `async def` (alumno, curso, escuela, auth), en los dos modos de sesión."""
+from tests.conftest import crear_alumno, crear_curso, crear_escuela, crear_usuario, dar_rol
+
+
+def test_alumnos_paginados_por_curso(cliente, escuela, curso):
+    otro = crear_curso(cliente, escuela["idEscuela"], nombre="1° B", division="B")
+    ids = [crear_alumno(cliente, curso["idCurso"], dni=f"5000000{i}")["idAlumno"] for i in range(5)]
+    crear_alumno(cliente, otro["idCurso"], dni="50000099")
+
+    vistos, cursor = [], None
+    while True:
+        params = {"cursoId": curso["idCurso"], "limit": 2, **({"cursor": cursor} if cursor else {})}
+        pagina = cliente.get("/alumnos/", params=params).json()
+        vistos += [a["idAlumno"] for a in pagina["items"]]
+        cursor = pagina["next_cursor"]
+        if cursor is None:
+            break
+
+    assert vistos == ids
+    primero = cliente.get("/alumnos/", params={"limit": 1}).json()["items"][0]
+    assert primero == {
+        "idAlumno": ids[0], "idCurso": curso["idCurso"], "nombre": "Lucía", "apellido": "Gómez",
+        "dni": "50000000", "fechaNac": "2019-05-10", "fechaIngreso": "2025-03-01", "direccion": None,
+    }
+
+
+def test_alumno_y_detalles(cliente, curso):
+    a = crear_alumno(cliente, curso["idCurso"], dni="50000001")
+    b = crear_alumno(cliente, curso["idCurso"], dni="50000002", nombre="Mateo")
+    r = cliente.post("/responsables/", json={"nombre": "Ana", "apellido": "Gómez", "dni": "30111222"}).json()
+    cliente.post("/responsables/vincular", json={
+        "idAlumno": a["idAlumno"], "idResponsable": r["idResponsable"], "parentesco": "Madre",
+    })
+
+    assert cliente.get(f"/alumnos/{a['idAlumno']}").json() == a
+    assert cliente.get("/alumnos/999999").status_code == 404
+
+    detalle = cliente.get(f"/alumnos/{a['idAlumno']}/detalle").json()
+    assert [(x["dni"], x["parentesco"]) for x in detalle["responsables"]] == [("30111222", "Madre")]
+
+    # mismo orden que los ids pedidos; los inexistentes se omiten
+    varios = cliente.get("/alumnos/detalle", params={"ids": [b["idAlumno"], 999999, a["idAlumno"]]}).json()
+    assert [x["idAlumno"] for x in varios] == [b["idAlumno"], a["idAlumno"]]
+    assert varios[0]["responsables"] == []
+
+
+def test_cursos_filtrados_y_planilla(cliente, escuela):
+    c26 = crear_curso(cliente, escuela["idEscuela"])
+    crear_curso(cliente, escuela["idEscuela"], cicloLectivo=2025)
+    crear_alumno(cliente, c26["idCurso"], dni="50000001", apellido="Pérez")
+    crear_alumno(cliente, c26["idCurso"], dni="50000002", apellido="Acosta")
+
+    cursos = cliente.get("/cursos/", params={"escuelaId": escuela["idEscuela"], "cicloLectivo": 2026}).json()
+    assert [c["idCurso"] for c in cursos["items"]] == [c26["idCurso"]]
+    assert cliente.get(f"/cursos/{c26['idCurso']}").json() == c26
+    assert cliente.get("/cursos/999999").status_code == 404
+
+    planilla = cliente.get(f"/cursos/{c26['idCurso']}/alumnos").json()
+    assert [a["apellido"] for a in planilla] == ["Acosta", "Pérez"]
+
+
+def test_escuelas_lista_y_busqueda(cliente):
+    tecnica = crear_escuela(cliente, nombre="Escuela Técnica Belgrano", cue="060000002", localidad="Luján")
+    crear_escuela(cliente)
+
+    pagina = cliente.get("/escuelas/").json()
+    assert len(pagina["items"]) == 2
+    assert cliente.get(f"/escuelas/{tecnica['idEscuela']}").json()["nombre"] == "Escuela Técnica Belgrano"
+
+    # sin acentos ni mayúsculas
+    encontradas = cliente.get("/escuelas/", params={"q": "TECNICA lujan"}).json()["items"]
+    assert [e["idEscuela"] for e in encontradas] == [tecnica["idEscuela"]]
+
+
+def test_login_y_claims(cliente, escuela):
+    usuario = crear_usuario(cliente, "30111222")
+    dar_rol(usuario["idUsuario"], escuela["idEscuela"], "Docente")
+
+    assert cliente.post("/login", json={"dni": "30111222", "password": "otra"}).status_code == 401
+
+    login = cliente.post("/login", json={"dni": "30111222", "password": "clave1234"}).json()
+    [rol] = login["roles_disponibles"]
+    assert (rol["descripcion"], rol["idEscuela"]) == ("Docente", escuela["idEscuela"])
+
+    claims = cliente.get("/me", headers={"Authorization": f"Bearer {rol['token']}"}).json()
+    assert claims["idUsuario"] == usuario["idUsuario"]
+    assert claims["idEscuela"] == escuela["idEscuela"]
+    assert cliente.get("/me").status_code == 401
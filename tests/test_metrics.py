@@ -0,0 +1,22 @@
+"""/metrics exporta los pools de todas las DBs; CORS envuelve a los demás middlewares."""
+from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import create_engine
+
+from app import main
+from app.db.routing import ReplicaSet
+
+
+def test_metrics_incluye_pools_de_replicas(cliente, monkeypatch, tmp_path):
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    monkeypatch.setattr(main, "replica_set", ReplicaSet([replica]))
+
+    texto = cliente.get("/metrics").text
+    for pool in ("sync", "async", "replica_0"):
+        assert f'edupresente_db_pool_connections{{pool="{pool}",state="checked_out"}}' in texto
+    replica.dispose()
+
+
+def test_cors_es_el_middleware_mas_externo(cliente):
+    assert main.app.user_middleware[0].cls is CORSMiddleware
+    r = cliente.get("/health", headers={"Origin": "http://localhost:4200"})
+    assert r.headers["access-control-allow-origin"] == "http://localhost:4200"
@@ -0,0 +1,102 @@
+"""Migraciones sobre una DB SQLite propia de cada test (no la de la app)."""
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlmodel import SQLModel
+
+from app.db import migrations
+from app.db.migrations import m0005_fks_cascada
+from app.main import app  # noqa: F401  (registra todos los modelos en la metadata)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    e = create_engine(f"sqlite:///{tmp_path / 'migraciones.db'}")
+    yield e
+    e.dispose()
+
+
+def test_fks_cascada_revierte_si_falla(engine, monkeypatch):
+    with engine.connect() as conn:
+        for m in migrations.MIGRACIONES[:4]:
+            m.subir(conn)
+        conn.execute(text("INSERT INTO escuela (idEscuela, nombre) VALUES (1, 'Escuela 1')"))
+        conn.execute(text("INSERT INTO curso VALUES (1, 1, '1° A', NULL, NULL, NULL, 2026)"))
+        conn.commit()
+
+    original, reconstruidas = m0005_fks_cascada.actualizar_fks, []
+
+    def actualizar_fks(conn, tabla):
+        if reconstruidas:
+            raise RuntimeError("falla a mitad de la migración")
+        reconstruidas.append(tabla.name)
+        return original(conn, tabla)
+
+    monkeypatch.setattr(m0005_fks_cascada, "actualizar_fks", actualizar_fks)
+    with pytest.raises(RuntimeError):
+        migrations.migrar(engine)
+
+    with engine.connect() as conn:
+        assert migrations.version_actual(conn) == 4
+        assert "curso__viejo" not in inspect(conn).get_table_names()
+        # misma conexión del pool: la migración dejó foreign_keys como estaba
+        assert conn.exec_driver_sql("PRAGMA foreign_keys").scalar() == 1
+        # la primera tabla reconstruida volvió a su estado anterior
+        assert reconstruidas == ["curso"]
+        assert inspect(conn).get_foreign_keys("curso")[0]["options"] == {}
+        assert conn.execute(text("SELECT nombre FROM curso")).scalar() == "1° A"
+
+
+def _esquema(conn) -> dict:
+    insp = inspect(conn)
+    return {
+        t: (
+            {c["name"] for c in insp.get_columns(t)},
+            {i["name"] for i in insp.get_indexes(t)},
+            {(tuple(fk["constrained_columns"]), fk["referred_table"], fk["options"].get("ondelete"))
+             for fk in insp.get_foreign_keys(t)},
+        )
+        for t in insp.get_table_names()
+    }
+
+
+def test_actualiza_una_db_anterior_a_las_migraciones(engine, tmp_path):
+    with engine.begin() as conn:
+        conn.connection.executescript((Path(__file__).parent / "esquema_base.sql").read_text())
+        for sql in (
+            "INSERT INTO escuela (idEscuela, nombre, cue, localidad) VALUES (1, 'Escuela Técnica N°3', '060000003', 'Luján')",
+            "INSERT INTO usuario VALUES (1, '30111222', NULL, NULL, 'x', NULL, 'Marta', 'Sosa')",
+            "INSERT INTO rol VALUES (1, 1, 1, 'Director', 'Activo')",
+            "INSERT INTO curso VALUES (1, 1, '1° A', '1', 'A', 'Mañana', 2026)",
+            "INSERT INTO alumno VALUES (1, 1, 'Lucía', 'Gómez', '50000001', '2019-05-10', '2025-03-01', NULL)",
+            "INSERT INTO responsable VALUES (1, 'Ana', 'Gómez', '30111223', NULL, NULL)",
+            "INSERT INTO alumno_responsable VALUES (1, 1, 'Madre')",
+        ):
+            conn.execute(text(sql))
+
+    assert migrations.migrar(engine) == [m.VERSION for m in migrations.MIGRACIONES]
+
+    with engine.connect() as conn:
+        assert migrations.version_actual(conn) == migrations.VERSION_ESQUEMA
+        assert conn.execute(text("SELECT busqueda FROM escuela")).scalar() == "escuela tecnica n 3 060000003 lujan"
+        assert conn.execute(text('SELECT nombre, cerrado, "actualizadoEn" IS NOT NULL FROM curso')).one() == ("1° A", 0, 1)
+        assert conn.execute(text('SELECT dni, "actualizadoEn" IS NOT NULL FROM alumno')).one() == ("50000001", 1)
+        assert conn.execute(text("SELECT parentesco FROM alumno_responsable")).scalar() == "Madre"
+        assert conn.execute(text("SELECT descripcion FROM rol")).scalar() == "Director"
+        actualizada = _esquema(conn)
+
+    # mismo esquema que una DB creada desde cero con las migraciones
+    nueva = create_engine(f"sqlite:///{tmp_path / 'nueva.db'}")
+    migrations.migrar(nueva)
+    with nueva.connect() as conn:
+        assert actualizada == _esquema(conn)
+    nueva.dispose()
+
+    # y con todo lo que declaran los modelos
+    for tabla in SQLModel.metadata.sorted_tables:
+        columnas, indices, fks = actualizada[tabla.name]
+        assert columnas == set(tabla.columns.keys()), tabla.name
+        assert {i.name for i in tabla.indexes} <= indices, tabla.name
+        assert {(tuple(c.name for c in fk.columns), fk.referred_table.name, fk.ondelete)
+                for fk in tabla.foreign_key_constraints} == fks, tabla.name
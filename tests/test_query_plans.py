@@ -0,0 +1,24 @@
+"""EXPLAIN de las consultas calientes sobre un esquema recién migrado: un índice que
+falta hace fallar los tests, no sólo el chequeo a mano."""
+import os
+import subprocess
+import sys
+
+from sqlalchemy import create_engine
+
+from app.db.migrations import migrar
+from app.db.query_plans import revisar
+
+
+def test_ninguna_consulta_recorre_tablas_completas(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'planes.db'}")
+    migrar(engine)
+    assert revisar(engine) == []
+    engine.dispose()
+
+
+def test_importar_no_crea_el_engine_de_la_app():
+    # sin el driver de DATABASE_URL instalado, el chequeo con --db igual tiene que arrancar
+    env = {**os.environ, "DATABASE_URL": "mysql+mysqldb://usuario@localhost/edu"}
+    codigo = "import sys, app.db.query_plans; assert 'app.db.database' not in sys.modules"
+    subprocess.run([sys.executable, "-W", "ignore", "-c", codigo], env=env, check=True)
@@ -0,0 +1,34 @@
+"""Cache de respuestas GET: hit sin ir a la DB, invalidación al escribir y 304 por ETag."""
+from sqlmodel import Session
+
+from app.db.database import engine
+from app.models.escuela import Escuela
+from tests.conftest import crear_escuela
+
+
+def _nombres(r) -> list[str]:
+    assert r.status_code == 200, r.text
+    return [e["nombre"] for e in r.json()["items"]]
+
+
+def test_cache_hit_invalidacion_y_etag(cliente):
+    escuela = crear_escuela(cliente, nombre="Escuela 1")
+    primera = cliente.get("/escuelas/")
+    etag = primera.headers["ETag"]
+    assert _nombres(primera) == ["Escuela 1"]
+
+    # un cambio hecho por fuera de la API no se ve: la respuesta sale del cache
+    with Session(engine) as session:
+        session.get(Escuela, escuela["idEscuela"]).nombre = "Escuela renombrada"
+        session.commit()
+    hit = cliente.get("/escuelas/")
+    assert _nombres(hit) == ["Escuela 1"] and hit.headers["ETag"] == etag
+
+    r = cliente.get("/escuelas/", headers={"If-None-Match": etag})
+    assert (r.status_code, r.content, r.headers["ETag"]) == (304, b"", etag)
+
+    # escribir por la API invalida el namespace
+    crear_escuela(cliente, nombre="Escuela 2", cue="060000002")
+    r = cliente.get("/escuelas/", headers={"If-None-Match": etag})
+    assert r.status_code == 200 and r.headers["ETag"] != etag
+    assert _nombres(r) == ["Escuela renombrada", "Escuela 2"]
@@ -0,0 +1,50 @@
+"""Pase de año: promoción, egreso, dryRun y cursos del ciclo siguiente ya creados."""
+from sqlalchemy import select
+
+from app.db.database import engine
+from app.models.alumno import Alumno
+from app.models.curso import Curso
+from tests.conftest import crear_alumno, crear_curso
+
+
+def _estado(escuela_id: int) -> tuple[list, list]:
+    # directo de la DB: los listados de cursos pasan por el cache de respuestas
+    with engine.connect() as conn:
+        cursos = conn.execute(
+            select(Curso.idCurso, Curso.grado, Curso.cicloLectivo, Curso.cerrado)
+            .where(Curso.idEscuela == escuela_id).order_by(Curso.idCurso)
+        ).all()
+        alumnos = conn.execute(select(Alumno.dni, Alumno.idCurso).order_by(Alumno.dni)).all()
+    return cursos, alumnos
+
+
+def test_rollover(cliente, escuela):
+    e = escuela["idEscuela"]
+    primero, segundo, tercero = (
+        crear_curso(cliente, e, nombre=f"{g}° A", grado=str(g))["idCurso"] for g in (1, 2, 3)
+    )
+    # el 2° A del ciclo siguiente ya existe: se reutiliza
+    segundo_2027 = crear_curso(cliente, e, nombre="2° A", grado="2", cicloLectivo=2027)["idCurso"]
+    for curso_id, dni in ((primero, "50000001"), (segundo, "50000002"), (tercero, "50000003")):
+        crear_alumno(cliente, curso_id, dni=dni)
+
+    antes = _estado(e)
+    simulado = cliente.post(f"/escuelas/{e}/rollover", params={"cicloOrigen": 2026, "dryRun": True}).json()
+    assert _estado(e) == antes
+    assert (simulado["cursosCreados"], simulado["cursosExistentes"]) == (2, 1)
+    assert [(c["accion"], c["cursoDestinoId"]) for c in simulado["cursos"]] == [
+        ("promovido", segundo_2027), ("promovido", None), ("egresa", None),
+    ]
+
+    r = cliente.post(f"/escuelas/{e}/rollover", params={"cicloOrigen": 2026}).json()
+    assert (r["cursosCreados"], r["cursosExistentes"]) == (2, 1)
+    assert (r["alumnosPromovidos"], r["alumnosEgresados"]) == (2, 1)
+
+    cursos, alumnos = _estado(e)
+    nuevos = {grado: id_ for id_, grado, ciclo, _ in cursos if ciclo == 2027}
+    assert nuevos.keys() == {"1", "2", "3"} and nuevos["2"] == segundo_2027
+    assert r["cursos"][1]["cursoDestinoId"] == nuevos["3"]
+    # 1° → 2° existente, 2° → 3° creado, el de 3° egresa y queda en su curso
+    assert alumnos == [("50000001", segundo_2027), ("50000002", nuevos["3"]), ("50000003", tercero)]
+    # los cursos de origen quedan cerrados
+    assert {id_ for id_, _, ciclo, cerrado in cursos if cerrado} == {primero, segundo, tercero}
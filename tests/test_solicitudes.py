@@ -0,0 +1,66 @@
+"""Aprobación y rechazo de solicitudes de rol en lote (director y admin)."""
+from sqlalchemy import select
+
+from app.db.database import engine
+from app.models.rol import Rol
+from tests.conftest import auth, crear_escuela, crear_usuario, token_con_rol
+
+
+def _solicitud(cliente, dni: str, escuela_id: int, descripcion: str = "Docente") -> int:
+    usuario = crear_usuario(cliente, dni)
+    r = cliente.post("/roles/", json={
+        "idUsuario": usuario["idUsuario"], "idEscuela": escuela_id, "descripcion": descripcion,
+    })
+    assert r.json()["estado"] == "Pendiente"
+    return r.json()["idRol"]
+
+
+def _resultados(r) -> list:
+    assert r.status_code == 200, r.text
+    return [(x["idRol"], x["resultado"]) for x in r.json()["resultados"]]
+
+
+def test_director_resuelve_solo_docentes_de_su_escuela(cliente, escuela):
+    e = escuela["idEscuela"]
+    otra = crear_escuela(cliente, cue="060000002")["idEscuela"]
+    director = auth(token_con_rol(cliente, e, "Director", "30111220"))
+    admin = auth(token_con_rol(cliente, otra, "Admin", "30111221"))
+
+    docente = _solicitud(cliente, "30111222", e)
+    rechazada = _solicitud(cliente, "30111223", e)
+    de_otra = _solicitud(cliente, "30111224", otra)
+    otro_director = _solicitud(cliente, "30111225", e, "Director")
+
+    url = f"/escuelas/{e}/solicitudes"
+    lote = {"ids": [docente, de_otra, otro_director, 999999, docente]}
+    assert _resultados(cliente.post(f"{url}/aprobar", json=lote, headers=director)) == [
+        (docente, "aprobado"),
+        (de_otra, "no_encontrado"),  # de otra escuela
+        (otro_director, "no_encontrado"),  # el director sólo resuelve Docentes
+        (999999, "no_encontrado"),
+    ]
+    assert _resultados(cliente.post(f"{url}/aprobar", json={"ids": [docente]}, headers=director)) == [
+        (docente, "no_pendiente"),
+    ]
+    assert _resultados(cliente.post(f"{url}/rechazar", json={"ids": [rechazada]}, headers=director)) == [
+        (rechazada, "rechazado"),
+    ]
+    # rechazar borra la solicitud
+    assert _resultados(cliente.post(f"{url}/rechazar", json={"ids": [rechazada]}, headers=director)) == [
+        (rechazada, "no_encontrado"),
+    ]
+    # por la URL de otra escuela ni siquiera entra
+    r = cliente.post(f"/escuelas/{otra}/solicitudes/aprobar", json={"ids": [de_otra]}, headers=director)
+    assert r.status_code == 403
+
+    with engine.connect() as conn:
+        estados = dict(conn.execute(select(Rol.idRol, Rol.estado).where(
+            Rol.idRol.in_([docente, rechazada, de_otra, otro_director]),
+        )).all())
+    assert estados == {docente: "Aprobado", de_otra: "Pendiente", otro_director: "Pendiente"}
+
+    # el admin resuelve cualquier escuela y descripción
+    lote = {"ids": [de_otra, otro_director]}
+    assert _resultados(cliente.post("/admin/solicitudes/aprobar", json=lote, headers=admin)) == [
+        (de_otra, "aprobado"), (otro_director, "aprobado"),
+    ]
@@ -0,0 +1,61 @@
+"""Sync offline: las bajas llegan como tombstones y la asistencia subida resuelve conflictos por hora."""
+from tests.conftest import crear_alumno
+
+
+def test_desvincular_deja_la_baja(cliente, escuela, curso):
+    alumno = crear_alumno(cliente, curso["idCurso"], dni="50000001")
+    r = cliente.post("/responsables/", json={"nombre": "Ana", "apellido": "Gómez", "dni": "30111222"}).json()
+    vinculo = {"idAlumno": alumno["idAlumno"], "idResponsable": r["idResponsable"]}
+    assert cliente.post("/responsables/vincular", json={**vinculo, "parentesco": "Madre"}).status_code == 201
+
+    foto = cliente.get("/sync/", params={"escuelaId": escuela["idEscuela"]}).json()
+    assert foto["completo"] and len(foto["vinculos"]["filas"]) == 1
+
+    assert cliente.delete("/responsables/vincular", params=vinculo).status_code == 204
+    assert cliente.delete("/responsables/vincular", params=vinculo).status_code == 404
+
+    cambios = cliente.get("/sync/", params={"escuelaId": escuela["idEscuela"], "since": foto["token"]}).json()
+    assert cambios["bajas"]["vinculos"] == [[alumno["idAlumno"], r["idResponsable"]]]
+
+
+def test_subida_offline_gana_el_registro_mas_nuevo(cliente, escuela, curso):
+    alumno = crear_alumno(cliente, curso["idCurso"], dni="50000001")["idAlumno"]
+    otro = crear_alumno(cliente, curso["idCurso"], dni="50000002")["idAlumno"]
+    r = cliente.post(f"/cursos/{curso['idCurso']}/asistencia", json={
+        "fecha": "2026-03-09", "registros": [{"alumnoId": alumno, "estado": "Presente"}],
+    })
+    assert r.status_code == 200
+
+    def registro(fecha, estado, registrado_en, **datos):
+        return {"alumnoId": alumno, "cursoId": curso["idCurso"], "fecha": fecha, "estado": estado,
+                "registradoEn": registrado_en, **datos}
+
+    lote = cliente.post("/sync/asistencia", json={"registros": [
+        # tomada antes de lo que ya está en el servidor
+        registro("2026-03-09", "Ausente", "2026-03-09T08:00:00Z"),
+        # dos tomas del mismo día en el lote: gana la más nueva
+        registro("2026-03-10", "Ausente", "2026-03-10T08:00:00Z"),
+        registro("2026-03-10", "Tarde", "2026-03-10T08:30:00-03:00"),
+        registro("2026-03-10", "Presente", "2026-03-10T09:00:00Z", alumnoId=otro, cursoId=999999),
+    ]}).json()
+
+    assert lote["aplicados"] == 1
+    assert [(x["fecha"], x["resultado"], x["detalle"]) for x in lote["resultados"]] == [
+        ("2026-03-09", "descartado", "El servidor tiene un registro más nuevo"),
+        ("2026-03-10", "descartado", "Hay un registro más nuevo en el mismo lote"),
+        ("2026-03-10", "aplicado", None),
+        ("2026-03-10", "rechazado", "Curso no encontrado"),
+    ]
+
+    # una toma más nueva que la del servidor la reemplaza (la hora futura se limita a la del servidor)
+    lote = cliente.post("/sync/asistencia", json={"registros": [
+        registro("2026-03-09", "Justificado", "2099-01-01T00:00:00Z"),
+    ]}).json()
+    assert lote["resultados"][0]["resultado"] == "aplicado"
+
+    def estado(fecha):
+        filas = cliente.get(f"/cursos/{curso['idCurso']}/asistencia", params={"fecha": fecha}).json()
+        return [(f["idAlumno"], f["estado"]) for f in filas]
+
+    assert estado("2026-03-09") == [(alumno, "Justificado")]
+    assert estado("2026-03-10") == [(alumno, "Tarde")]